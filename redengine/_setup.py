@@ -3,7 +3,7 @@ from redengine.core import BaseCondition, Task
 from redengine.session import Session, Config
 from redengine.parse import add_condition_parser
 from redengine.conditions import true, false
-from redengine.tasks import CommandTask, FuncTask, CodeTask
+from redengine.tasks import CommandTask, FuncTask, CodeTask, MapTask
 from redengine.tasks.maintain import ShutDown, Restart
 from redengine.tasks.maintain import Restart
 
@@ -23,7 +23,7 @@ def _setup_defaults():
     # Update type hints
     cls_tasks = (
         Task,
-        FuncTask, CommandTask, CodeTask,
+        FuncTask, CommandTask, CodeTask, MapTask,
         ShutDown, Restart,
 
         _FuncTaskCondWrapper
@@ -6,7 +6,7 @@ from .utils import DependMixin, TaskStatusMixin
 from redbird.oper import between
 
 from redengine.core.condition import Statement, Historical, Comparable, All
-from redengine.core.time import TimeDelta
+from redengine.core.time import TimeDelta, TimeInterval
 from ..time import IsPeriod
 from redengine.time.construct import get_before, get_between, get_full_cycle, get_after, get_on
 
@@ -188,6 +188,9 @@ class TaskRunning(Historical):
 
         task = Statement.session.get_task(task)
 
+        if task.is_alive():
+            # Some of the runs (instances) are alive
+            return True
         if not self.session.config.force_status_from_logs:
             return bool(task.last_run)
 
@@ -283,6 +286,28 @@ class TaskExecutable(Historical):
             and bool(has_not_terminated)
         )
 
+    def get_next(self, dt):
+        # Predicted from the runtime state of the task
+        # thus failures with retries are not considered
+        period = self.period
+        if not isinstance(period, (TimeDelta, TimeInterval)):
+            return None
+        task = self.session.get_task(self.kwargs["task"])
+        finishes = [
+            finish for finish in (task.last_success, task.last_fail, task.last_inaction, task.last_terminate)
+            if finish is not None
+        ]
+        last_finish = max(finishes) if finishes else None
+
+        if isinstance(period, TimeDelta):
+            if last_finish is None:
+                return dt
+            return max(last_finish + period.past, dt)
+        elif dt in period:
+            if last_finish is None or last_finish < period.rollback(dt).left:
+                return dt
+        return period.next_start(dt)
+
     def __str__(self):
         if hasattr(self, "_str"):
             return self._str
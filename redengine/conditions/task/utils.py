@@ -37,7 +37,21 @@ class DependMixin:
         actual_task = self.session.get_task(task)
         depend_task = self.session.get_task(depend_task)
 
-        #! TODO: use Task._last_success & Task._last_run if not none and not forced
+        if not self.session.config.force_status_from_logs:
+            # Use the latest times cached in the tasks (as 
+            # Task.get_last_run etc.) instead of reading logs
+            last_depend_finish = None
+            for action in self._dep_actions:
+                last_occur = getattr(depend_task, f'last_{action}')
+                if last_occur is not None and (last_depend_finish is None or last_occur > last_depend_finish):
+                    last_depend_finish = last_occur
+            last_actual_start = actual_task.last_run
+            if last_depend_finish is not None and last_actual_start is not None:
+                return last_depend_finish > last_actual_start
+            # The caches are empty in a new process (ie. after a 
+            # restart) thus the unknown times are read from the logs
+
+
         last_depend_finish = depend_task.logger.get_latest(action=in_(self._dep_actions))
         last_actual_start = actual_task.logger.get_latest(action="run")
 
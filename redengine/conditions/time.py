@@ -2,6 +2,7 @@
 import datetime
 
 from redengine.time import TimeOfDay, TimeOfWeek, TimeDelta
+from redengine.core.time import TimeInterval
 from redengine.time.construct import get_full_cycle, get_between, get_after, get_before
 from redengine.core.condition.base import BaseCondition
 
@@ -37,6 +38,13 @@ class IsPeriod(BaseCondition):
     def __bool__(self):
         return datetime.datetime.now() in self.period
 
+    def get_next(self, dt):
+        if not isinstance(self.period, TimeInterval):
+            return None
+        elif dt in self.period:
+            return dt
+        return self.period.next_start(dt)
+
     def __str__(self):
         if hasattr(self, "_str"):
             return self._str
@@ -0,0 +1,105 @@
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+from redengine.core.coordination import BaseCoordinator
+
+class SQLiteCoordinator(BaseCoordinator):
+    """Coordinator storing the leases to a SQLite
+    database file.
+
+    The nodes must access the same file thus they
+    should run on the same host or the file should
+    be on a file system with working locks.
+
+    Parameters
+    ----------
+    path : path-like
+        Path to the database file. Created if missing.
+    timeout : float
+        Seconds waited if the database is locked
+        by another node, by default 5.
+    **kwargs : dict
+        See :py:class:`redengine.core.coordination.BaseCoordinator`
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        from redengine.coordination import SQLiteCoordinator
+
+        session.config.coordinator = SQLiteCoordinator("/shared/scheduler.db", mode="lease")
+    """
+
+    def __init__(self, path:Union[str, Path], timeout:float=5, **kwargs):
+        super().__init__(**kwargs)
+        self.path = str(path)
+        self.timeout = timeout
+        self._conn = None
+        self._conn_pid = None
+        self._lock = threading.Lock()
+
+    def _get_conn(self) -> sqlite3.Connection:
+        # Connections cannot be shared with forked processes
+        if self._conn is None or self._conn_pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS leases "
+                "(name TEXT PRIMARY KEY, owner TEXT NOT NULL, expires REAL NOT NULL)"
+            )
+            self._conn = conn
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    def acquire(self, name:str, duration:float=None) -> bool:
+        duration = self.lease_duration if duration is None else duration
+        now = time.time()
+        with self._lock:
+            conn = self._get_conn()
+            # Taken if free, expired or already ours (renewal)
+            conn.execute(
+                "INSERT INTO leases (name, owner, expires) VALUES (?, ?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET owner=excluded.owner, expires=excluded.expires "
+                "WHERE leases.owner = excluded.owner OR leases.expires < ?",
+                (name, self.node_id, now + duration, now)
+            )
+            row = conn.execute("SELECT owner FROM leases WHERE name = ?", (name,)).fetchone()
+        return row is not None and row[0] == self.node_id
+
+    def release(self, name:str):
+        with self._lock:
+            self._get_conn().execute(
+                "DELETE FROM leases WHERE name = ? AND owner = ?",
+                (name, self.node_id)
+            )
+
+    def get_owner(self, name:str) -> Optional[str]:
+        with self._lock:
+            row = self._get_conn().execute(
+                "SELECT owner FROM leases WHERE name = ? AND expires >= ?",
+                (name, time.time())
+            ).fetchone()
+        return row[0] if row is not None else None
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None and self._conn_pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
+    def __getstate__(self):
+        # NOTE: The config (and the coordinator) is pickled
+        # when a process task is started using spawn
+        state = self.__dict__.copy()
+        state["_conn"] = None
+        state["_conn_pid"] = None
+        state["_lock"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
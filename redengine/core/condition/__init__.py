@@ -1,3 +1,3 @@
 from .statement import Statement, Historical, Comparable
-from .utils import set_statement_defaults
+from .utils import set_statement_defaults, copy_condition
 from .base import AlwaysTrue, AlwaysFalse, All, Any, Not, BaseCondition, CLS_CONDITIONS
\ No newline at end of file
@@ -1,6 +1,6 @@
 import datetime
 from abc import abstractmethod
-from typing import Callable, Dict, Pattern, Union, Type
+from typing import Callable, Dict, Optional, Pattern, Union, Type
 
 from redengine._base import RedBase
 from redengine.core.meta import _add_parser, _register
@@ -94,6 +94,13 @@ class BaseCondition(RedBase, metaclass=_ConditionMeta):
         """Check whether the condition holds.
         Override this method."""
 
+    def get_next(self, dt:datetime.datetime) -> Optional[datetime.datetime]:
+        """Predict when the condition holds next
+        (at earliest ``dt``). Returns None if the
+        condition cannot be predicted. Override 
+        this method for time-based conditions."""
+        return None
+
     def __and__(self, other):
         # self & other
         # bitwise and
@@ -234,6 +241,13 @@ class Not(_ConditionContainer, BaseCondition):
 
 class AlwaysTrue(BaseCondition):
     "Condition that is always true"
+
+    def __copy__(self):
+        # Has no state thus it can be shared
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
     def __bool__(self):
         return True
 
@@ -250,6 +264,13 @@ class AlwaysTrue(BaseCondition):
 class AlwaysFalse(BaseCondition):
     "Condition that is always false"
 
+    def __copy__(self):
+        # Has no state thus it can be shared
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
     def __bool__(self):
         return False
 
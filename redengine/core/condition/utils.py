@@ -1,7 +1,9 @@
 
 from collections.abc import Iterable
+from copy import copy
 
 from .statement import Statement
+from .base import Not
 
 def _has_sub_conditions(obj):
     return isinstance(obj, Iterable)
@@ -26,3 +28,23 @@ def _set_default(cond, **kwargs):
     
 def set_statement_defaults(cond, **kwargs):
     _set_default(cond, **kwargs)
+
+def copy_condition(cond):
+    """Copy the condition tree for a task. 
+    
+    The containers and the statements are copied 
+    so that the defaults of the statements can be 
+    set without affecting the original. The rest 
+    (ie. the periods) are shared with the original."""
+    if isinstance(cond, Statement):
+        return cond.copy()
+    if not _has_sub_conditions(cond):
+        return copy(cond)
+
+    new = copy(cond)
+    subconditions = [copy_condition(sub_cond) for sub_cond in cond]
+    if isinstance(cond, Not):
+        new.condition = subconditions[0]
+    else:
+        new.subconditions = subconditions
+    return new
@@ -0,0 +1,82 @@
+import datetime
+import os
+import socket
+import uuid
+from abc import abstractmethod
+from typing import Literal, Optional, Union
+
+import pandas as pd
+
+from redengine._base import RedBase
+
+class BaseCoordinator(RedBase):
+    """Base class for coordination backends.
+
+    A coordinator lets multiple schedulers (nodes),
+    ie. on different hosts, share the same tasks
+    without running them twice. The nodes hold
+    leases that expire if they are not renewed
+    (ie. the node crashed).
+
+    In mode 'leader' (active/standby) only the node
+    holding the leader lease runs tasks and another
+    node takes over if the leader stops renewing the
+    lease. In mode 'lease' a node must hold the lease
+    of a task to run it thus the tasks are spread
+    across the nodes.
+
+    The nodes should log to the same repository so
+    that the conditions see the runs of the other nodes.
+    A node reads the state of a task from the logs
+    after it got the lease of the task (or became
+    the leader).
+
+    Parameters
+    ----------
+    node_id : str, optional
+        Identifier of the node. By default created
+        from the host name and the process id.
+    mode : str, {'leader', 'lease'}
+        Whether a node runs all of the tasks if it
+        is the leader or only the tasks it got the
+        leases, by default 'leader'.
+    lease_duration : str, int, timedelta
+        How long a lease is valid if not renewed,
+        by default 30 seconds. Integers are seconds.
+    """
+    leader_key: str = "__leader__"
+
+    def __init__(self, node_id:str=None, mode:Literal['leader', 'lease']="leader", lease_duration:Union[str, int, datetime.timedelta]=30):
+        if mode not in ("leader", "lease"):
+            raise ValueError(f"Invalid coordination mode: {mode}")
+        self.node_id = node_id if node_id is not None else f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.mode = mode
+        self.lease_duration = self._to_seconds(lease_duration)
+
+    @staticmethod
+    def _to_seconds(value) -> float:
+        if isinstance(value, str):
+            return pd.Timedelta(value).total_seconds()
+        elif isinstance(value, datetime.timedelta):
+            return value.total_seconds()
+        return float(value)
+
+    @abstractmethod
+    def acquire(self, name:str, duration:float=None) -> bool:
+        """Acquire or renew the lease of given name.
+        Returns whether the node holds the lease."""
+
+    @abstractmethod
+    def release(self, name:str):
+        "Release the lease of given name (if held by the node)"
+
+    @abstractmethod
+    def get_owner(self, name:str) -> Optional[str]:
+        "Get the node holding the lease of given name (None if free)"
+
+    def is_leader(self) -> bool:
+        "Acquire or renew the leader lease"
+        return self.acquire(self.leader_key)
+
+    def close(self):
+        "Release the resources of the coordinator"
@@ -0,0 +1,239 @@
+import datetime
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Union
+
+# Kinds of the events published by the scheduler and the tasks
+TASK_EVENTS = ("task_run", "task_success", "task_fail", "task_terminate", "task_inaction")
+SCHEDULER_EVENTS = ("scheduler_startup", "scheduler_shutdown", "cycle_start", "cycle_end")
+EVENT_KINDS = TASK_EVENTS + SCHEDULER_EVENTS
+
+logger = logging.getLogger("redengine.events")
+
+class Event:
+    """Event published to the event bus.
+
+    Attributes
+    ----------
+    kind : str
+        Kind of the event, ie. ``task_success``
+        or ``cycle_end`` (see ``EVENT_KINDS``).
+    created : float
+        Time of the event (seconds since epoch).
+    task : str, optional
+        Name of the task (for task events).
+    data : dict
+        Additional information of the event
+        (ie. ``run_id`` and ``pid`` of the task
+        events or ``n_cycles`` of the cycle events).
+    """
+
+    __slots__ = ("kind", "created", "task", "data")
+
+    def __init__(self, kind:str, created:float=None, task:str=None, **data):
+        self.kind = kind
+        self.created = time.time() if created is None else created
+        self.task = task
+        self.data = data
+
+    @property
+    def timestamp(self) -> datetime.datetime:
+        "datetime.datetime: Time of the event"
+        return datetime.datetime.fromtimestamp(self.created)
+
+    def __repr__(self):
+        task = f", task={self.task!r}" if self.task is not None else ""
+        return f"Event({self.kind!r}{task})"
+
+class Subscription:
+    """Subscription to the events of an event bus.
+
+    Synchronous subscriptions call the callback
+    in the thread that published the event (ie.
+    in the scheduler as it handles the logs) thus
+    the callback should be fast. Queued subscriptions
+    put the events to ``queue``: the events are
+    either read with ``get`` or, if a callback is
+    given, passed to it in a separate thread.
+    """
+
+    def __init__(self, bus:'EventBus', kinds:Optional[tuple], callback:Callable=None, queued:bool=False, maxsize:int=0):
+        self.bus = bus
+        self.kinds = kinds
+        self.callback = callback
+        self.queued = queued
+        self.queue = queue.Queue(maxsize=maxsize) if queued else None
+        self.n_dropped = 0
+        self._thread = None
+        if queued and callback is not None:
+            self._thread = threading.Thread(target=self._consume, name="redengine-events", daemon=True)
+            self._thread.start()
+
+    def deliver(self, event:Event):
+        "Pass an event to the subscriber"
+        if not self.queued:
+            self.callback(event)
+            return
+        try:
+            self.queue.put_nowait(event)
+        except queue.Full:
+            # Slow consumers must not block the publisher
+            self.n_dropped += 1
+
+    def get(self, timeout:float=None) -> Optional[Event]:
+        """Get the next event of a queued subscription
+        (None if timeouted)."""
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def get_all(self) -> List[Event]:
+        "Get the events in the queue without waiting"
+        events = []
+        while True:
+            try:
+                events.append(self.queue.get_nowait())
+            except queue.Empty:
+                return events
+
+    def close(self):
+        "Unsubscribe (and stop the consumer thread)"
+        self.bus.unsubscribe(self)
+        if self._thread is not None:
+            self.queue.put(None)
+            if self._thread is not threading.current_thread():
+                self._thread.join()
+            self._thread = None
+
+    def _consume(self):
+        while True:
+            event = self.queue.get()
+            if event is None:
+                break
+            try:
+                self.callback(event)
+            except Exception:
+                logger.exception(f"Subscriber {self.callback!r} failed to handle {event!r}")
+
+class EventBus:
+    """Publish/subscribe bus of the scheduler events
+    (``session.events``).
+
+    The tasks publish their status changes and the
+    scheduler its cycles, startup and shutdown so that
+    consumers (metrics, UIs, dependency triggering)
+    can react to them instead of polling the logs.
+    The events are published only in the process that
+    created the bus (the scheduler). Publishing is
+    cheap if nothing subscribed the kind.
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        @session.events.subscribe("task_fail")
+        def alert(event):
+            print(f"Task {event.task} failed")
+
+        # Or read the events in another thread
+        sub = session.events.subscribe(["task_success", "task_fail"], queued=True)
+        event = sub.get(timeout=1)
+    """
+
+    def __init__(self):
+        self._subscribers: Dict[Optional[str], List[Subscription]] = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def subscribe(self, kinds:Union[str, Iterable[str]]=None, callback:Callable=None, queued:bool=False, maxsize:int=0):
+        """Subscribe to the events.
+
+        Parameters
+        ----------
+        kinds : str, list of str, optional
+            Kinds of the events to subscribe.
+            By default all of the events.
+        callback : callable, optional
+            Function called with the event. If not given
+            and ``queued`` is False, a decorator is returned.
+        queued : bool
+            Whether the events are put to a queue instead
+            of calling the callback in the publishing thread.
+        maxsize : int
+            Maximum number of events in the queue. The
+            events are dropped if the queue is full. By
+            default unlimited.
+
+        Returns
+        -------
+        Subscription
+        """
+        if isinstance(kinds, str):
+            kinds = (kinds,)
+        elif kinds is not None:
+            kinds = tuple(kinds)
+        for kind in kinds or ():
+            if kind not in EVENT_KINDS:
+                raise KeyError(f"Invalid event kind: {kind}")
+
+        if callback is None and not queued:
+            def wrapper(func):
+                self.subscribe(kinds, callback=func)
+                return func
+            return wrapper
+
+        sub = Subscription(self, kinds, callback=callback, queued=queued, maxsize=maxsize)
+        with self._lock:
+            # Copied so that publishing does not need the lock
+            subscribers = {key: list(subs) for key, subs in self._subscribers.items()}
+            for kind in kinds or (None,):
+                subscribers.setdefault(kind, []).append(sub)
+            self._subscribers = subscribers
+        return sub
+
+    def unsubscribe(self, sub:Subscription):
+        "Remove a subscription"
+        with self._lock:
+            self._subscribers = {
+                key: [s for s in subs if s is not sub]
+                for key, subs in self._subscribers.items()
+            }
+
+    def has_subscribers(self, kind:str) -> bool:
+        "Whether the events of the kind are delivered to someone"
+        subscribers = self._subscribers
+        return bool(subscribers.get(kind) or subscribers.get(None))
+
+    def publish(self, kind:str, task:str=None, created:float=None, **data):
+        "Publish an event to the subscribers"
+        subscribers = self._subscribers
+        if not subscribers or os.getpid() != self._pid:
+            return
+        subs = subscribers.get(kind, []) + subscribers.get(None, [])
+        if not subs:
+            return
+        event = Event(kind, created=created, task=task, **data)
+        for sub in subs:
+            try:
+                sub.deliver(event)
+            except Exception:
+                logger.exception(f"Subscriber {sub.callback!r} failed to handle {event!r}")
+
+    def clear(self):
+        "Remove all of the subscriptions"
+        with self._lock:
+            subs = {sub for subs in self._subscribers.values() for sub in subs}
+        for sub in subs:
+            sub.close()
+
+    def __getstate__(self):
+        # The subscribers are local to the process
+        return {}
+
+    def __setstate__(self, state):
+        self.__init__()
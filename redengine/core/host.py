@@ -0,0 +1,260 @@
+import logging
+import multiprocessing
+import os
+import pickle
+import queue
+import threading
+import traceback
+from typing import TYPE_CHECKING, Dict
+
+from redengine.core.log import current_run_id
+from redengine.core.parameters import Parameters
+from redengine.log import QueueHandler
+
+if TYPE_CHECKING:
+    from redengine.core import Task
+
+def _crash_record(task_name:str, run_id:str, message:str) -> logging.LogRecord:
+    "Create a failure record for a run that could not finish"
+    record = logging.LogRecord(
+        name="redengine.host", level=logging.CRITICAL,
+        pathname=__file__, lineno=0, msg=message, args=None, exc_info=None
+    )
+    record.message = message
+    record.task_name = task_name
+    record.action = "fail"
+    record.run_id = run_id
+    return record
+
+class _PipeQueue:
+    "Queue-like object sending the log records through a pipe"
+
+    def __init__(self, send):
+        self._send = send
+
+    def put_nowait(self, record):
+        self._send(("record", record))
+
+    put = put_nowait
+
+class HostedRun:
+    """Handle of a run of a thread task on the
+    task host.
+
+    The run is alive till the host reports that
+    the thread of the run has ended."""
+
+    def __init__(self, host:'TaskHost', run_id:str, task_name:str):
+        self.host = host
+        self.run_id = run_id
+        self.task_name = task_name
+        self._done = threading.Event()
+
+    def is_alive(self) -> bool:
+        "Whether the thread of the run is alive"
+        return not self._done.is_set()
+
+    def wait(self, timeout:float=None) -> bool:
+        "Wait till the run has ended"
+        return self._done.wait(timeout)
+
+    def terminate(self):
+        """Ask the run to terminate (sets the
+        ``_thread_terminate_`` of the run)"""
+        self.host.terminate(self.run_id)
+
+class TaskHost:
+    """Process hosting the tasks with ``execution='thread'``
+    (see ``config.thread_host``).
+
+    The scheduler (control plane) sends the runs to the
+    host (data plane) which runs them on threads and
+    sends the log records and the ends of the runs back
+    through a pipe. Therefore CPU-bound thread tasks
+    hold the GIL of the host and not the GIL of the
+    scheduler. The records are put to ``queue`` which
+    the scheduler handles like the records of the
+    process tasks.
+
+    The host is started on the first run and if it
+    dies, the runs on it are logged as failed and a
+    new host is started for the next run.
+
+    Parameters
+    ----------
+    ctx : multiprocessing context, optional
+        Context used to start the host process.
+    """
+
+    def __init__(self, ctx=None):
+        self.queue = queue.Queue()
+        self._ctx = multiprocessing if ctx is None else ctx
+        self._process = None
+        self._conn = None
+        self._listener = None
+        self._runs: Dict[str, HostedRun] = {}
+        self._lock = threading.RLock()
+
+    def is_alive(self) -> bool:
+        "Whether the host process is running"
+        return self._process is not None and self._process.is_alive()
+
+    def start(self):
+        "Start the host process (if not running)"
+        with self._lock:
+            if self.is_alive():
+                return
+            conn, child_conn = self._ctx.Pipe()
+            self._process = self._ctx.Process(target=_serve_host, args=(child_conn,), name="redengine-task-host", daemon=True)
+            self._process.start()
+            child_conn.close()
+            self._conn = conn
+            # The runs of each host process are kept apart
+            # in case it dies and a new one is started
+            self._runs = {}
+            self._listener = threading.Thread(target=self._listen, args=(conn, self._runs), name="redengine-task-host-listener", daemon=True)
+            self._listener.start()
+
+    def submit(self, task:'Task', params:Parameters, direct_params:Parameters, exec_hooks:list) -> HostedRun:
+        "Run a task on a thread of the host"
+        # Pickled here so that unpicklable tasks fail in the scheduler
+        payload = pickle.dumps((task, params, direct_params, exec_hooks))
+        msg = ("run", task.run_id, task.name, payload)
+        with self._lock:
+            self.start()
+            run = HostedRun(self, task.run_id, task.name)
+            self._runs[run.run_id] = run
+            try:
+                self._conn.send(msg)
+            except OSError:
+                # The host died but it was not yet reaped
+                self._runs.pop(run.run_id, None)
+                self._process.join()
+                self.start()
+                self._runs[run.run_id] = run
+                self._conn.send(msg)
+        return run
+
+    def terminate(self, run_id:str):
+        "Ask a run to terminate"
+        with self._lock:
+            if run_id not in self._runs:
+                return
+            try:
+                self._conn.send(("terminate", run_id))
+            except OSError:
+                pass
+
+    def close(self):
+        """Stop the host process. The runs not finished
+        are logged as failed."""
+        with self._lock:
+            process, conn, listener = self._process, self._conn, self._listener
+            self._process = self._conn = self._listener = None
+        if process is None:
+            return
+        try:
+            conn.send(("stop",))
+        except OSError:
+            pass
+        process.join(timeout=5)
+        if process.is_alive():
+            process.terminate()
+            process.join()
+        listener.join()
+
+    def _listen(self, conn, runs:Dict[str, HostedRun]):
+        "Handle the messages from the host (in a thread of the scheduler)"
+        while True:
+            try:
+                msg = conn.recv()
+            except (EOFError, OSError):
+                break
+            if msg[0] == "record":
+                self.queue.put(msg[1])
+            elif msg[0] == "exit":
+                with self._lock:
+                    run = runs.pop(msg[1], None)
+                if run is not None:
+                    run._done.set()
+
+        # The host is gone: the runs left will not finish
+        with self._lock:
+            lost = list(runs.values())
+            runs.clear()
+        for run in lost:
+            self.queue.put(_crash_record(run.task_name, run.run_id, f"Task '{run.task_name}' crashed as the task host died"))
+            run._done.set()
+        conn.close()
+
+def _serve_host(conn):
+    "Run the tasks sent by the scheduler (in the host process)"
+    send_lock = threading.Lock()
+    logger_lock = threading.Lock()
+    tasks = {}
+    loggers = {}
+
+    def send(msg):
+        with send_lock:
+            conn.send(msg)
+
+    def get_logger(basename:str) -> logging.Logger:
+        # The records of the tasks are sent to the scheduler
+        if basename not in loggers:
+            logger = logging.getLogger(basename + "._process")
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+            logger.handlers = [QueueHandler(_PipeQueue(send))]
+            loggers[basename] = logger
+        return loggers[basename]
+
+    def run(run_id, task_name, payload):
+        current_run_id.set(run_id)
+        try:
+            try:
+                task, params, direct_params, exec_hooks = pickle.loads(payload)
+            except Exception:
+                send(("record", _crash_record(task_name, run_id, f"Task '{task_name}' crashed in unpickling on task host:\n{traceback.format_exc()}")))
+                return
+            tasks[run_id] = task
+            with logger_lock:
+                logger = get_logger(task.logger_name)
+            task.logger_name = logger.name
+            # The termination event is not picklable
+            # thus the one of the host is passed instead
+            params = Parameters(params) | Parameters(task.prefilter_params(Parameters(_thread_terminate_=task._thread_terminate)))
+            task.log_running()
+            try:
+                task._run_as_main(params=params, direct_params=direct_params, execution="process", hooks=exec_hooks)
+            except Exception:
+                # Task crashed before running execute
+                task.log_failure()
+        finally:
+            tasks.pop(run_id, None)
+            send(("exit", run_id))
+
+    # multiprocessing.parent_process is new in Python 3.8
+    parent = multiprocessing.parent_process() if hasattr(multiprocessing, "parent_process") else None
+    ppid = os.getppid()
+    while True:
+        try:
+            if not conn.poll(1):
+                # The pipe is not closed if the scheduler crashed
+                # as the other processes may have its end
+                if parent is not None and not parent.is_alive():
+                    break
+                elif parent is None and os.getppid() != ppid:
+                    # Orphaned (not noticed on Windows)
+                    break
+                continue
+            msg = conn.recv()
+        except (EOFError, OSError):
+            break
+        if msg[0] == "run":
+            threading.Thread(target=run, args=msg[1:], daemon=True).start()
+        elif msg[0] == "terminate":
+            task = tasks.get(msg[1])
+            if task is not None:
+                task._thread_terminate.set()
+        elif msg[0] == "stop":
+            break
@@ -1 +1 @@
-from .adapter import TaskAdapter
\ No newline at end of file
+from .adapter import TaskAdapter, current_run_id
\ No newline at end of file
@@ -2,6 +2,7 @@
 import logging
 import warnings
 import datetime
+from contextvars import ContextVar
 from typing import TYPE_CHECKING, Iterable, List, Dict, Union
 
 from dateutil.parser import parse as _parse_datetime
@@ -14,11 +15,16 @@ from redengine.pybox import query
 if TYPE_CHECKING:
     from redengine.core import Task
 
+# Run (instance) of a task that is executing in the 
+# current context (thread, coroutine or process)
+current_run_id: ContextVar[Union[str, None]] = ContextVar("current_run_id", default=None)
+
 class TaskAdapter(logging.LoggerAdapter):
     """Logging adapter for tasks.
 
     The adapter includes the name of the given 
-    task to the log records and allows reading
+    task and the identifier of the run (if the 
+    task is running) to the log records and allows reading
     the log records if a handler with reading
     capability is found.
 
@@ -40,6 +46,9 @@ class TaskAdapter(logging.LoggerAdapter):
         ""
         kwargs["extra"] = kwargs.get("extra", {})
         kwargs["extra"].update(self.extra)
+        run_id = current_run_id.get()
+        if run_id is not None:
+            kwargs["extra"].setdefault("run_id", run_id)
         return msg, kwargs
 
     def filter_by(self, *args, **kwargs):
@@ -1,7 +1,9 @@
 
 from multiprocessing import cpu_count
 import multiprocessing
-from typing import TYPE_CHECKING, Callable, Optional, Union
+import asyncio
+import concurrent.futures
+from typing import TYPE_CHECKING, Callable, Optional, Tuple, Union
 import threading
 import time
 import sys, os, subprocess
@@ -10,14 +12,20 @@ import datetime
 import platform
 from copy import copy
 from queue import Empty
+from collections import Counter
+import heapq
+import itertools
 
 import pandas as pd
 
 from redengine._base import RedBase
 from redengine.core.condition import BaseCondition, AlwaysFalse
 from redengine.core.task import Task
+from redengine.core.host import TaskHost
 from redengine.exc import SchedulerRestart, SchedulerExit
 from redengine.core.hook import _Hooker
+from redengine.core.log import current_run_id
+from redengine.core.utils import get_process_context
 
 if TYPE_CHECKING:
     from redengine import Session
@@ -88,16 +96,86 @@ class Scheduler(RedBase):
         # still running or not
         self.is_alive = None
 
-        self._log_queue = multiprocessing.Queue(-1)
+        # Queue for the logs of process tasks (created when needed
+        # as it must share the multiprocessing context of the tasks)
+        self._log_queue_obj = None
+        self._log_queue_method = None
+
+        # Process tasks launched but not yet confirmed running
+        self._pending_launches = set()
+
+        # Tasks holding execution and resource slots
+        # (released as they are found not running)
+        self._slot_holders = {}
+        self._n_execution = Counter()
+        self._n_resources = Counter()
+
+        # Tasks that are runnable but wait for free 
+        # capacity (task -> time it was enqueued)
+        self._ready = {}
+
+        # Timeouts of the running tasks: min-heap of 
+        # (deadline, count, task) with the valid deadlines 
+        # (monotonic clock) in a dict (task -> deadline)
+        self._timeouts = []
+        self._deadlines = {}
+        self._timeout_count = itertools.count()
+
+        # Dependents triggered by finished tasks 
+        # (see config.trigger_dependents)
+        self._triggered = {}
+        self._trigger_lock = threading.Lock()
+        self._trigger_sub = None
+        self._trigger_wakeup = threading.Event()
+
+        # Event loop for async tasks (created when needed)
+        self._loop = None
+        self._loop_thread = None
+        self._loop_lock = threading.Lock()
+
+        # Thread pool for thread tasks (created when needed)
+        self._thread_pool = None
+        self._thread_pool_lock = threading.Lock()
+
+        # Process hosting the thread tasks (created when needed)
+        self._task_host = None
+        self._task_host_lock = threading.Lock()
+
+        # Processes shared with other schedulers (see ShardedScheduler)
+        self.process_budget = None
+
+        # Coordination with other nodes (see config.coordinator):
+        # whether the node is the leader and the tasks it holds 
+        # the leases of
+        self._is_leader = None
+        self._leases = set()
 
     def _register_instance(self):
         self.session.scheduler = self
 
+    @property
+    def _log_queue(self) -> multiprocessing.Queue:
+        "Queue the process tasks log to"
+        method = self.session.config.process_start_method
+        if self._log_queue_obj is None or self._log_queue_method != method:
+            ctx = get_process_context(method, self.session.config.preload_modules)
+            self._log_queue_obj = ctx.Queue(-1)
+            self._log_queue_method = method
+        return self._log_queue_obj
+
     @property
     def tasks(self):
 
         #! TODO: Is this needed?
-        tasks = self.session.get_tasks()
+        return self._sort_tasks(self.session.get_tasks())
+
+    def _sort_tasks(self, tasks) -> list:
+        "Sort the tasks to the order they are inspected in a cycle"
+        # Tasks of the same priority are in the topological order
+        # of the dependencies so that the completions of the 
+        # upstream tasks are seen before checking the downstream
+        order = self.session.graph.get_order()
+        tasks = sorted(tasks, key=lambda task: order.get(task.name, 0))
         # There may be extra rare situation that priority is not in the task
         # for short period if it is being modified thus we use getattr
         return sorted(tasks, key=lambda task: getattr(task, "priority", 0), reverse=True)
@@ -115,7 +193,7 @@ class Scheduler(RedBase):
         try:
             self.startup()
 
-            while not self.check_cond(self.session.config.shut_cond):
+            while not self._is_shut_cond():
                 if self._flag_shutdown.is_set():
                     break
                 elif self._flag_restart.is_set():
@@ -154,41 +232,223 @@ class Scheduler(RedBase):
         """Run one round of tasks.
         
         Each task is inspected and in case their starting condition
-        is fulfilled, they are run.  A task can be running once at 
-        any given time (in other words, multiple paraller execution 
-        of a single task is not supported at the moment). Tasks that 
-        are running but their termination condition is fulfilled are 
-        terminated.
+        is fulfilled, they are run. A task can have up to 
+        ``max_instances`` runs alive at any given time (by default
+        one): a task with free instances can be run again while 
+        its earlier runs are still going. Tasks that are running 
+        but their termination condition is fulfilled are terminated.
         """
         tasks = self.tasks
         self.logger.debug(f"Beginning cycle with {len(tasks)} tasks...", extra={"action": "run"})
+        self.session.events.publish("cycle_start", n_cycles=self.n_cycles)
+        self.release_slots()
+        self.terminate_timeouted()
+        self.maintain_leases()
 
         # Running hooks
         hooker = _Hooker(self.session.hooks.scheduler_cycle)
         hooker.prerun(self)
 
+        # Tasks that waited for free capacity go first
+        self.handle_logs()
+        self.run_ready()
+
+        self.run_triggered()
+
         for task in tasks:
             with task.lock:
                 self.handle_logs()
                 if task.on_startup or task.on_shutdown:
                     # Startup or shutdown tasks are not run in main sequence
                     pass
-                elif self._flag_enabled.is_set() and self.is_task_runnable(task):
-                    # Run the actual task
-                    self.run_task(task)
-                    # Reset force_run as a run has forced
-                    task.force_run = False
-                elif self.is_timeouted(task):
-                    # Terminate the task
-                    self.terminate_task(task, reason="timeout")
+                elif task in self._ready:
+                    # Waiting in the ready queue (conditions are not re-evaluated)
+                    pass
+                elif self._try_run(task):
+                    pass
                 elif self.is_out_of_condition(task):
                     # Terminate the task
                     self.terminate_task(task)
+                self.maintain_prespawn(task)
+            # Dependents of the tasks finished meanwhile
+            self.run_triggered()
+
+        # The launches of the cycle are not waited: they
+        # are reconciled as the logs are handled (see
+        # handle_logs) and not relaunched while pending
+        self.handle_logs()
 
         # Running hooks
         hooker.postrun()
         
         self.n_cycles += 1
+        self.session.events.publish("cycle_end", n_cycles=self.n_cycles)
+
+    def _try_run(self, task:Task) -> bool:
+        """Run the task if runnable or put it to the ready 
+        queue if it waits for capacity. Returns whether
+        either was done."""
+        if not self._flag_enabled.is_set():
+            return False
+        elif self.is_task_runnable(task) and self.acquire_lease(task):
+            # Run the actual task. Process tasks are not 
+            # waited to start but reconciled later
+            self.run_task(task, wait_for_run=False)
+            task.last_queue_wait = datetime.timedelta(0)
+            # Reset force_run as a run has forced
+            task.force_run = False
+            return True
+        elif task.waiting_for is not None:
+            # Runnable but no capacity
+            self._ready[task] = time.monotonic()
+            return True
+        return False
+
+    def _check_dependency_cycles(self):
+        cycle = self.session.graph.find_cycle()
+        if cycle is not None:
+            self.logger.warning(f"Tasks have circular dependencies: {' -> '.join(cycle)}")
+
+    def _trigger_dependents(self, event):
+        "Mark the dependents of a finished task to be checked"
+        dependents = self.session.graph.get_children(event.task)
+        if not dependents:
+            return
+        task_names = self.session._task_names
+        with self._trigger_lock:
+            for name in dependents:
+                task = task_names.get(name)
+                if task is not None:
+                    self._triggered[task] = None
+        # Thread tasks may finish while hibernating
+        self._trigger_wakeup.set()
+
+    def run_triggered(self):
+        """Check and run the dependents of the tasks that
+        finished (see ``config.trigger_dependents``) without
+        waiting for the next cycle."""
+        checked = set()
+        while self._triggered:
+            with self._trigger_lock:
+                triggered, self._triggered = self._triggered, {}
+                self._trigger_wakeup.clear()
+            for task in triggered:
+                # The dependents of the dependents are checked as
+                # well but each only once (the graph may have cycles)
+                if task in checked:
+                    continue
+                checked.add(task)
+                with task.lock:
+                    if task.on_startup or task.on_shutdown or task in self._ready or task not in self.session:
+                        continue
+                    self._try_run(task)
+
+    def _start_triggering(self):
+        if self.session.config.trigger_dependents and self._trigger_sub is None:
+            self._trigger_sub = self.session.events.subscribe(
+                ["task_success", "task_fail", "task_terminate"],
+                callback=self._trigger_dependents
+            )
+
+    def _stop_triggering(self):
+        if self._trigger_sub is not None:
+            self._trigger_sub.close()
+            self._trigger_sub = None
+        self._triggered = {}
+
+    def maintain_leases(self):
+        """Renew the leadership or the leases of the running
+        tasks and release the leases of the finished tasks
+        (if a coordinator is set in the configuration)."""
+        coordinator = self.session.config.coordinator
+        if coordinator is None:
+            return
+        if coordinator.mode == "leader":
+            is_leader = coordinator.is_leader()
+            if is_leader and not self._is_leader:
+                self.logger.info(f"Node '{coordinator.node_id}' is the leader")
+                # The previous leader may have run tasks
+                for task in self.tasks:
+                    task.load_state()
+            elif not is_leader and self._is_leader:
+                self.logger.warning(f"Node '{coordinator.node_id}' lost the leadership")
+            self._is_leader = is_leader
+            return
+
+        for task in list(self._leases):
+            if task.is_alive() or task.is_launch_pending():
+                coordinator.acquire(task.name)
+            else:
+                coordinator.release(task.name)
+                self._leases.discard(task)
+
+    def acquire_lease(self, task:Task) -> bool:
+        """Whether the node may run the task according
+        to the coordinator (if set in the configuration).
+        
+        In mode 'lease', the lease of the task is acquired
+        and the task is inspected again after its state is 
+        read from the logs (as another node may have run it)."""
+        coordinator = self.session.config.coordinator
+        if coordinator is None:
+            return True
+        elif coordinator.mode == "leader":
+            return bool(self._is_leader)
+        elif task in self._leases:
+            return True
+        elif not coordinator.acquire(task.name):
+            return False
+
+        task.load_state()
+        if self.check_cond(task):
+            self._leases.add(task)
+            return True
+        coordinator.release(task.name)
+        return False
+
+    def _release_leases(self):
+        "Release the leadership and the leases of the tasks"
+        coordinator = self.session.config.coordinator
+        if coordinator is None:
+            return
+        for task in self._leases:
+            coordinator.release(task.name)
+        self._leases.clear()
+        if self._is_leader:
+            coordinator.release(coordinator.leader_key)
+        self._is_leader = None
+
+    def maintain_prespawn(self, task:Task):
+        """Start a warm process for a process task if its 
+        start is predicted to be within ``prespawn_lead``
+        or discard the warm process if the prediction
+        has changed."""
+        lead = self.session.config.prespawn_lead
+        if lead is None and not task.is_prespawned():
+            return
+        now = datetime.datetime.fromtimestamp(time.time())
+        is_predictable = (
+            lead is not None 
+            and self._flag_enabled.is_set()
+            and task.get_execution() == "process"
+            and not (task.disabled or task.on_startup or task.on_shutdown)
+            and task.has_free_instance()
+        )
+        next_start = self.get_next_start(task.start_cond, now) if is_predictable else None
+
+        if next_start is None or next_start > now + lead:
+            task.discard_prespawn()
+        elif next_start > now and not task.is_prespawned():
+            task.prespawn(self._log_queue)
+
+    def get_next_start(self, cond:BaseCondition, dt:datetime.datetime) -> Optional[datetime.datetime]:
+        "Predict when the condition holds next"
+        try:
+            return cond.get_next(dt)
+        except:
+            if not self.session.config.silence_cond_check:
+                raise
+            return None
 
     def check_cond(self, cond: Union[BaseCondition, Task]) -> bool:
         try:
@@ -198,12 +458,22 @@ class Scheduler(RedBase):
                 raise
             return False
 
-    def run_task(self, task:Task, *args, **kwargs):
-        """Run a given task"""
+    def run_task(self, task:Task, *args, wait_for_run=True, **kwargs):
+        """Run a given task
+        
+        If ``wait_for_run`` is False and the task is run 
+        as a process, the method does not wait for the 
+        process to log that it started running. The launch
+        is pending till its run record is handled."""
         start_time = datetime.datetime.fromtimestamp(time.time())
 
+        if not self._acquire_budget(task):
+            # Another scheduler took the last process
+            task.waiting_for = "free processor"
+            self._ready.setdefault(task, time.monotonic())
+            return
         try:
-            task(log_queue=self._log_queue)
+            task(log_queue=self._log_queue, wait_for_run=wait_for_run)
         except (SchedulerRestart, SchedulerExit) as exc:
             raise 
         except Exception as exc:
@@ -212,6 +482,16 @@ class Scheduler(RedBase):
         else:
             exception = None
             status = "success"
+        finally:
+            # Tasks that finished already (ie. execution="main")
+            # do not hold slots
+            if task.is_alive_current() or task.is_launch_pending():
+                self._acquire_slots(task)
+                self._register_timeout(task)
+            elif self.process_budget is not None and task.get_execution() == "process":
+                self.process_budget.release()
+        if task.is_launch_pending():
+            self._pending_launches.add(task)
 
     def terminate_all(self, reason:str=None):
         """Terminate all running tasks."""
@@ -219,28 +499,95 @@ class Scheduler(RedBase):
             if task.is_alive():
                 self.terminate_task(task, reason=reason)
 
-    def terminate_task(self, task, reason=None):
-        """Terminate a given task."""
+    def terminate_task(self, task, reason=None, run_id=None):
+        """Terminate a given task. 
+        
+        If ``run_id`` is given, only the run (instance)
+        of the task with the identifier is terminated.
+        Otherwise all runs of the task are terminated."""
         self.logger.debug(f"Terminating task '{task.name}'")
-        is_threaded = hasattr(task, "_thread")
-        is_multiprocessed = hasattr(task, "_process")
-        if task.is_alive_as_thread():
-            # We can only kindly ask the thread to...
-            # get the fuck out please.
-            task._thread_terminate.set()
-
-        elif task.is_alive_as_process():
-            task._process.terminate()
-            # Waiting till the termination is finished. 
-            # Otherwise may try to terminate it many times as the process is alive for a brief moment
-            task._process.join() 
-            task.log_termination(reason=reason)
-
-            # Resetting attr force_termination
-            task.force_termination = False
-        else:
-            # The process/thread probably just died after the check
-            pass
+        for instance in task.get_instances():
+            if run_id is None or instance.run_id == run_id:
+                self._terminate_instance(task, instance, reason=reason)
+        if run_id is not None and run_id != task.run_id:
+            return
+
+        # The termination is logged for the run
+        token = current_run_id.set(task.run_id)
+        try:
+            if task.is_alive_as_thread():
+                if task._thread_future is not None and task._thread_future.cancel():
+                    # The run was still waiting in the thread pool
+                    task.log_termination(reason=reason)
+                elif task._hosted is not None:
+                    # The thread on the task host logs the 
+                    # termination (if it listens to the event)
+                    task._hosted.terminate()
+                    task.force_termination = False
+                else:
+                    # We can only kindly ask the thread to...
+                    # get the fuck out please.
+                    task._thread_terminate.set()
+
+            elif task.is_alive_as_async():
+                # Cancel the coroutine. The coroutine logs
+                # the termination itself.
+                task._thread_terminate.set()
+                self.get_event_loop().call_soon_threadsafe(task._cancel_async)
+
+            elif task.is_alive_as_process():
+                task._process.terminate()
+                # Waiting till the termination is finished. 
+                # Otherwise may try to terminate it many times as the process is alive for a brief moment
+                task._process.join() 
+                # The process may have logged (ie. run) before 
+                # it was terminated
+                self.handle_logs()
+                task.log_termination(reason=reason)
+
+                # Resetting attr force_termination
+                task.force_termination = False
+
+            elif task.is_alive_as_remote():
+                # The worker ends the run and sends 
+                # the records logged before that
+                task._remote.terminate()
+                self.handle_logs()
+                task.log_termination(reason=reason)
+                task.force_termination = False
+            else:
+                # The process/thread probably just died after the check
+                pass
+        finally:
+            current_run_id.reset(token)
+
+    def _terminate_instance(self, task:Task, instance, reason=None):
+        "Terminate an earlier run of a task (see max_instances)"
+        token = current_run_id.set(instance.run_id)
+        try:
+            if instance.hosted is not None:
+                instance.hosted.terminate()
+            elif instance.thread_future is not None or instance.thread is not None:
+                if instance.thread_future is not None and instance.thread_future.cancel():
+                    # The run was still waiting in the thread pool
+                    task.log_termination(reason=reason)
+                else:
+                    instance.terminate_event.set()
+            elif instance.async_future is not None:
+                # The coroutine logs the termination itself
+                instance.terminate_event.set()
+                instance.async_future.cancel()
+            elif instance.process is not None:
+                instance.process.terminate()
+                instance.process.join()
+                self.handle_logs()
+                task.log_termination(reason=reason)
+            elif instance.remote is not None:
+                instance.remote.terminate()
+                self.handle_logs()
+                task.log_termination(reason=reason)
+        finally:
+            current_run_id.reset(token)
 
     def is_timeouted(self, task):
         """Check if the task is timeouted."""
@@ -254,36 +601,207 @@ class Scheduler(RedBase):
             return False
         elif not task.is_alive():
             return False
+        elif task.is_launch_pending():
+            # Timeout is counted from the confirmed start
+            return False
 
-        timeout = (
-            task.timeout if task.timeout is not None
-            else self.session.config.timeout
-        )
-        
+        deadline = self._deadlines.get((task, task.run_id))
+        if deadline is not None:
+            return time.monotonic() > deadline
+
+        # Not run by the scheduler, using the wall clock
+        timeout = self._get_timeout(task)
         if timeout is None:
             return False
         run_duration = datetime.datetime.fromtimestamp(time.time()) - task.get_last_run()
         return run_duration > timeout
 
+    def terminate_timeouted(self):
+        """Terminate the tasks that have run over their 
+        timeout. Only the tasks whose deadlines have passed
+        are inspected."""
+        timeouts = self._timeouts
+        now = time.monotonic()
+        while timeouts and timeouts[0][0] <= now:
+            deadline, _, task, run_id = heapq.heappop(timeouts)
+            run = (task, run_id)
+            if self._deadlines.get(run) != deadline:
+                # Finished or run again after this was registered
+                continue
+            elif task.is_launch_pending() and run_id == task.run_id:
+                # Timeout is counted from the confirmed start
+                self._register_timeout(task)
+                continue
+            del self._deadlines[run]
+            with task.lock:
+                if task.is_instance_alive(run_id):
+                    self.terminate_task(task, reason="timeout", run_id=run_id)
+
+        # Drop cancelled deadlines if they pile up
+        if len(timeouts) > 2 * len(self._deadlines) + 64:
+            self._timeouts = [
+                entry for entry in timeouts 
+                if self._deadlines.get((entry[2], entry[3])) == entry[0]
+            ]
+            heapq.heapify(self._timeouts)
+
+    def _get_timeout(self, task:Task) -> Optional[datetime.timedelta]:
+        return (
+            task.timeout if task.timeout is not None
+            else self.session.config.timeout
+        )
+
+    def _register_timeout(self, task:Task):
+        "Set the deadline of the latest run of the task"
+        run = (task, task.run_id)
+        self._deadlines.pop(run, None)
+        if task.permanent_task or task.get_execution() == "main":
+            return
+        timeout = self._get_timeout(task)
+        if timeout is None:
+            return
+        deadline = time.monotonic() + timeout.total_seconds()
+        self._deadlines[run] = deadline
+        heapq.heappush(self._timeouts, (deadline, next(self._timeout_count), task, task.run_id))
+
     def is_task_runnable(self, task:Task):
         """Inspect whether the task should be run."""
         #! TODO: Can this be put to the Task?
+        if task.is_launch_pending():
+            # Launched but not yet confirmed. Running it again
+            # could cause accidental multiple launches.
+            return False
         execution = task.get_execution()
+        has_free_processors = True
         if execution == "process":
-            is_not_running = not task.is_alive()
+            is_not_running = task.has_free_instance()
             has_free_processors = self.has_free_processors()
             is_condition = self.check_cond(task)
-            return is_not_running and has_free_processors and is_condition
+            is_runnable = is_not_running and is_condition
         elif execution == "main":
             is_condition = self.check_cond(task)
-            return is_condition
-        elif execution == "thread":
-            is_not_running = not task.is_alive()
+            is_runnable = is_condition
+        elif execution in ("thread", "async", "remote"):
+            is_not_running = task.has_free_instance()
             is_condition = self.check_cond(task)
-            return is_not_running and is_condition
+            is_runnable = is_not_running and is_condition
         else:
             raise NotImplementedError(task.execution)
 
+        # Tasks blocked only by the capacity are waiting
+        if not is_runnable:
+            waiting_for = None
+        elif not has_free_processors:
+            waiting_for = "free processor"
+        else:
+            waiting_for = self.get_missing_slot(task)
+        if waiting_for != task.waiting_for:
+            task.waiting_for = waiting_for
+        return is_runnable and waiting_for is None
+
+    def run_ready(self):
+        """Run the tasks waiting in the ready queue as 
+        far as there is capacity. 
+        
+        The tasks are run in the order of their priority 
+        which increases by ``ready_queue_aging`` per second
+        the task has waited. The conditions of the tasks 
+        are not re-evaluated."""
+        if not self._ready:
+            return
+        if not self._flag_enabled.is_set():
+            return
+        now = time.monotonic()
+        aging = self.session.config.ready_queue_aging
+        queue = sorted(
+            self._ready.items(),
+            key=lambda item: getattr(item[0], "priority", 0) + aging * (now - item[1]),
+            reverse=True
+        )
+        has_free_processors = True
+        for task, enqueued in queue:
+            with task.lock:
+                if task.disabled or task not in self.session or not task.has_free_instance():
+                    # Not to be run anymore
+                    del self._ready[task]
+                    task.waiting_for = None
+                    continue
+
+                if task.get_execution() == "process":
+                    has_free_processors = has_free_processors and self.has_free_processors()
+                    waiting_for = "free processor" if not has_free_processors else self.get_missing_slot(task)
+                else:
+                    waiting_for = self.get_missing_slot(task)
+                if waiting_for is not None:
+                    if waiting_for != task.waiting_for:
+                        task.waiting_for = waiting_for
+                    continue
+
+                del self._ready[task]
+                task.waiting_for = None
+                if not self.acquire_lease(task):
+                    # Another node runs the task
+                    continue
+                wait = datetime.timedelta(seconds=time.monotonic() - enqueued)
+                self.logger.debug(f"Task '{task.name}' waited {wait} in the ready queue")
+                self.run_task(task, wait_for_run=False)
+                task.last_queue_wait = wait
+                task.force_run = False
+
+    def get_missing_slot(self, task:Task) -> Optional[str]:
+        """Get the execution or resource limit that
+        prevents running the task (None if the task
+        can be run)."""
+        config = self.session.config
+        execution = task.get_execution()
+        limit = config.execution_limits.get(execution)
+        if limit is not None and self._n_execution[execution] >= limit:
+            return f"execution '{execution}'"
+        for resource, amount in task.resources.items():
+            limit = config.resource_limits.get(resource)
+            if limit is not None and self._n_resources[resource] + amount > limit:
+                return f"resource '{resource}'"
+        return None
+
+    def release_slots(self):
+        "Release the execution and resource slots of the runs that are not alive"
+        finished = [
+            (task, run_id) for task, run_id in self._slot_holders 
+            if not task.is_instance_alive(run_id) 
+            and not (task.is_launch_pending() and run_id == task.run_id)
+        ]
+        for run in finished:
+            self._release_slots(run)
+            # Cancel the timeout
+            self._deadlines.pop(run, None)
+
+    def _acquire_slots(self, task:Task):
+        "Hold the slots for the latest run of the task"
+        run = (task, task.run_id)
+        if run in self._slot_holders:
+            return
+        execution = task.get_execution()
+        resources = dict(task.resources)
+        self._slot_holders[run] = (execution, resources)
+        self._n_execution[execution] += 1
+        self._n_resources.update(resources)
+
+    def _release_slots(self, run:Tuple[Task, str]):
+        slots = self._slot_holders.pop(run, None)
+        if slots is None:
+            return
+        execution, resources = slots
+        self._n_execution[execution] -= 1
+        self._n_resources.subtract(resources)
+        if execution == "process" and self.process_budget is not None:
+            self.process_budget.release()
+
+    def _acquire_budget(self, task:Task) -> bool:
+        "Take a process from the shared process budget (if any)"
+        if self.process_budget is None or task.get_execution() != "process":
+            return True
+        return self.process_budget.acquire()
+
     def is_out_of_condition(self, task:Task):
         """Inspect whether the task should be terminated."""
         #! TODO: Can this be put to the Task?
@@ -293,6 +811,10 @@ class Scheduler(RedBase):
             # cannot be left running
             return False
 
+        elif task.is_launch_pending():
+            # Terminated only after the run is confirmed
+            return False
+
         elif task.force_termination:
             return True
 
@@ -302,43 +824,115 @@ class Scheduler(RedBase):
     def handle_logs(self):
         """Handle the status queue and carries the logging on their behalf."""
         # TODO: This could be maybe done in the tasks
-        queue = self._log_queue
+
+        # The records of a dead process are already in the queue
+        # thus the launches that are pending after handling the
+        # queue have crashed before logging the run.
+        dead_launches = self._get_dead_launches()
+
+        queues = [self._log_queue]
+        server = self.session.config.worker_server
+        if server is not None:
+            # Records of the remote runs
+            queues.append(server.queue)
+        if self._task_host is not None:
+            # Records of the thread tasks on the task host
+            queues.append(self._task_host.queue)
+        for queue in queues:
+            self._handle_queue(queue)
+
+        self._reconcile_launches(dead_launches)
+
+    def _handle_queue(self, queue):
+        "Handle the records in a queue till it is empty"
         while True:
             try:
                 record = queue.get(block=False)
             except Empty:
                 break
             else:
-                self.logger.debug(f"Inserting record for '{record.task_name}' ({record.action})")
-                task = self.session.get_task(record.task_name)
-                if record.action == "fail":
-                    # There is a caveat in logging 
-                    # https://github.com/python/cpython/blame/fad6af2744c0b022568f7f4a8afc93fed056d4db/Lib/logging/handlers.py#L1383 
-                    # https://bugs.python.org/issue34334
-
-                    # The traceback/exception info is no longer in record.exc_info/record.exc_text 
-                    # and it has been formatted to record.message/record.msg
-                    # This means we have to rely that message really contains
-                    # the full traceback
-
-                    record.exc_info = record.exc_text
-                    record.exc_text = record.exc_text
-                    if record.exc_text is not None and record.exc_text not in record.message:
-                        record.message = record.message + "\n" + record.message
-                elif record.action == "success":
-                    # Take the return value from the record and delete
-                    # Note that record has attr __return__ only if task running as process
-                    return_value = record.__return__
-                    task._handle_return(return_value)
-                    del record.__return__
-                
-                task.log_record(record)
+                self._handle_record(record)
+
+    def _is_shut_cond(self) -> bool:
+        "Whether the shut condition is fulfilled"
+        shut_cond = self.session.config.shut_cond
+        if self._pending_launches and not isinstance(shut_cond, AlwaysFalse):
+            # The shut condition may depend on the runs (ie. 
+            # TaskStarted) thus the launches are confirmed first
+            self.wait_launches()
+        return self.check_cond(shut_cond)
+
+    def wait_launches(self):
+        """Wait till the pending process launches are 
+        confirmed to run (or their processes died)."""
+        queue = self._log_queue
+        while self._pending_launches:
+            dead_launches = self._get_dead_launches()
+            try:
+                record = queue.get(block=True, timeout=0.1)
+            except Empty:
+                self._reconcile_launches(dead_launches)
+            else:
+                self._handle_record(record)
+                self.handle_logs()
+
+    def _handle_record(self, record:logging.LogRecord):
+        "Handle a log record from a task running as process"
+        self.logger.debug(f"Inserting record for '{record.task_name}' ({record.action})")
+        task = self.session.get_task(record.task_name)
+        if record.action == "fail":
+            # There is a caveat in logging 
+            # https://github.com/python/cpython/blame/fad6af2744c0b022568f7f4a8afc93fed056d4db/Lib/logging/handlers.py#L1383 
+            # https://bugs.python.org/issue34334
+
+            # The traceback/exception info is no longer in record.exc_info/record.exc_text 
+            # and it has been formatted to record.message/record.msg
+            # This means we have to rely that message really contains
+            # the full traceback
+
+            record.exc_info = record.exc_text
+            record.exc_text = record.exc_text
+            if record.exc_text is not None and record.exc_text not in record.message:
+                record.message = record.message + "\n" + record.message
+        elif record.action == "success":
+            # Take the return value from the record and delete
+            # Note that record has attr __return__ only if task running as process
+            return_value = record.__return__
+            task._handle_return(return_value)
+            del record.__return__
+        
+        task.log_record(record)
+
+    def _get_dead_launches(self) -> list:
+        return [
+            task for task in self._pending_launches
+            if not task.is_alive_as_process()
+        ]
+
+    def _reconcile_launches(self, dead_launches:list):
+        "Reconcile the pending process launches with the handled run records"
+        for task in dead_launches:
+            if task.is_launch_pending():
+                # There will be no "run" log record thus ending the task gracefully
+                task._launch_pending = False
+                task.logger.critical(f"Task '{task.name}' crashed in setup", extra={"action": "fail", "run_id": task.run_id})
+        self._pending_launches = {
+            task for task in self._pending_launches
+            if task.is_launch_pending()
+        }
 
     def _hibernate(self):
         """Go to sleep and wake up when next task can be executed."""
         delay = self.session.config.cycle_sleep
         if delay is not None:
-            time.sleep(delay)
+            if self._timeouts:
+                # Wake up to terminate at the next deadline
+                delay = min(delay, max(self._timeouts[0][0] - time.monotonic(), 0))
+            if self._trigger_sub is not None:
+                # Wake up if a task finished with dependents
+                self._trigger_wakeup.wait(delay)
+            else:
+                time.sleep(delay)
 
     def startup(self):
         """Start up the scheduler.
@@ -351,6 +945,12 @@ class Scheduler(RedBase):
         hooker.prerun(self)
 
         self.n_cycles = 0
+        self._ready.clear()
+        if self.session.config.worker_server is not None:
+            self.session.config.worker_server.start()
+        self._publish_tasks()
+        self._check_dependency_cycles()
+        self._start_triggering()
         self.startup_time = datetime.datetime.fromtimestamp(time.time())
 
         self.logger.info(f"Beginning startup sequence...")
@@ -364,17 +964,31 @@ class Scheduler(RedBase):
                     self.run_task(task)
 
         hooker.postrun()
+        self.session.events.publish("scheduler_startup")
         self.logger.info(f"Setup complete.")
 
+    def _publish_tasks(self):
+        "Publish the states of the tasks to the status table (if set)"
+        table = self.session.config.status_table
+        if table is None or not table.is_owner:
+            return
+        for task in self.tasks:
+            table.set_task(task)
+
     def has_free_processors(self) -> bool:
         """Whether the Scheduler has free processors to
         allocate more tasks."""
+        if self.process_budget is not None:
+            return self.process_budget.n_free > 0
         return self.n_alive <= self.session.config.max_process_count
 
     @property
     def n_alive(self) -> int:
-        """Count of tasks that are alive."""
-        return sum(task.is_alive() for task in self.tasks)
+        """Count of runs started by the scheduler that are 
+        alive. The runs are counted per execution as they 
+        are started and released as they are found finished
+        (see ``release_slots``)."""
+        return sum(self._n_execution.values())
         
     def _shut_down_tasks(self, traceback=None, exception=None):
         non_fatal_excs = (SchedulerRestart,) # Exceptions that are allowed to have graceful exit
@@ -385,6 +999,7 @@ class Scheduler(RedBase):
                 while self.n_alive:
                     #time.sleep(self.min_sleep)
                     self.handle_logs()
+                    self.release_slots()
                     for task in self.tasks:
                         if task.permanent_task:
                             # Would never "finish" anyways
@@ -406,8 +1021,11 @@ class Scheduler(RedBase):
 
     def wait_task_alive(self):
         """Wait till all, especially threading tasks, are finished."""
-        while self.n_alive > 0:
+        # Tasks may have been run outside the scheduler
+        # thus all of them are inspected
+        while any(task.is_alive() for task in self.session.get_tasks()):
             time.sleep(0.005)
+        self.release_slots()
 
     def shut_down(self, traceback=None, exception=None):
         """Shut down the scheduler.
@@ -440,22 +1058,136 @@ class Scheduler(RedBase):
                 if self.is_task_runnable(task):
                     self.run_task(task)
 
+        self._stop_triggering()
         self.logger.info(f"Shutting down tasks...")
+        for task in self.tasks:
+            task.discard_prespawn()
         self._shut_down_tasks(traceback, exception)
 
         if not self.session.config.instant_shutdown:
             self.wait_task_alive() # Wait till all tasks' threads and processes are dead
+        self._stop_event_loop()
+        self._stop_thread_pool()
+        self._stop_task_host()
+        self._release_leases()
+        if self.session.config.worker_server is not None:
+            self.session.config.worker_server.close()
 
         # Running hooks
         hooker.postrun()
 
         self.is_alive = False
+        self.session.events.publish("scheduler_shutdown")
         self.logger.info(f"Shutdown completed. Good bye.")
         if isinstance(exception, SchedulerRestart):
             # Clean up finished, restart is finally
             # possible
             self._restart()
 
+    def get_event_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the event loop running the tasks with 
+        ``execution='async'``. The loop runs in a 
+        dedicated thread that is started on the first 
+        call."""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(target=self._loop.run_forever, name="redengine-event-loop", daemon=True)
+                self._loop_thread.start()
+            return self._loop
+
+    def get_thread_pool(self) -> Optional[concurrent.futures.ThreadPoolExecutor]:
+        """Get the thread pool running the tasks with 
+        ``execution='thread'``. Returns None if the pool
+        is not in use (``thread_pool_size`` is not set)."""
+        size = self.session.config.thread_pool_size
+        if size is None:
+            return None
+        with self._thread_pool_lock:
+            if self._thread_pool is None:
+                self._thread_pool = concurrent.futures.ThreadPoolExecutor(max_workers=size, thread_name_prefix="redengine-task")
+            return self._thread_pool
+
+    @property
+    def n_thread_active(self) -> int:
+        """Count of thread tasks running in the thread pool."""
+        return sum(
+            task._thread_future is not None and task._thread_future.running()
+            for task in self.tasks
+        )
+
+    @property
+    def n_thread_queued(self) -> int:
+        """Count of thread tasks waiting for a free worker 
+        in the thread pool."""
+        return sum(
+            task._thread_future is not None and not task._thread_future.running() and not task._thread_future.done()
+            for task in self.tasks
+        )
+
+    def get_task_host(self) -> Optional[TaskHost]:
+        """Get the process hosting the tasks with
+        ``execution='thread'``. Returns None if the
+        thread tasks are run in the scheduler process
+        (``thread_host`` is not set)."""
+        if not self.session.config.thread_host:
+            return None
+        with self._task_host_lock:
+            if self._task_host is None:
+                ctx = get_process_context(self.session.config.process_start_method, self.session.config.preload_modules)
+                self._task_host = TaskHost(ctx=ctx)
+            return self._task_host
+
+    def _stop_task_host(self):
+        "Stop the process hosting the thread tasks (if running)"
+        with self._task_host_lock:
+            host = self._task_host
+            self._task_host = None
+        if host is not None:
+            host.close()
+            # Records logged before the host stopped
+            self._handle_queue(host.queue)
+
+    def _stop_thread_pool(self):
+        "Stop the thread pool of the thread tasks (if running)"
+        with self._thread_pool_lock:
+            pool = self._thread_pool
+            self._thread_pool = None
+        if pool is None:
+            return
+        instant = self.session.config.instant_shutdown
+        if instant:
+            # The runs still waiting in the pool are not started
+            # (ThreadPoolExecutor.shutdown has no cancel_futures 
+            # before Python 3.9)
+            for task in self.session.tasks:
+                futures = [task._thread_future] + [instance.thread_future for instance in task.get_instances()]
+                for future in futures:
+                    if future is not None:
+                        future.cancel()
+        pool.shutdown(wait=not instant)
+
+    def _stop_event_loop(self):
+        "Stop the event loop of the async tasks (if running)"
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = None
+            self._loop_thread = None
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+
+        # Let the remaining (cancelled) coroutines finish
+        async def finish_pending():
+            pending = asyncio.all_tasks() - {asyncio.current_task()}
+            for aio_task in pending:
+                aio_task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            await loop.shutdown_asyncgens()
+        loop.run_until_complete(finish_pending())
+        loop.close()
+
     def _restart(self):
         """Restart the scheduler by creating a new process
         on the temporary run script where the scheduler's is
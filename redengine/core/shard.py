@@ -0,0 +1,286 @@
+import logging
+import multiprocessing
+import zlib
+from queue import Empty
+from typing import TYPE_CHECKING, Callable, Hashable, List, Set
+
+from redbird.logging import RepoHandler
+from redbird.repos import MemoryRepo
+
+from redengine.core.schedule import Scheduler
+from redengine.core.task import Task
+from redengine.exc import SchedulerExit
+from redengine.log import QueueHandler, MinimalRecord
+
+if TYPE_CHECKING:
+    from redengine import Session
+
+class ProcessBudget:
+    """Number of processes that can run at the same
+    time shared between schedulers (processes).
+
+    Parameters
+    ----------
+    limit : int
+        Maximum number of processes running at the same time.
+    ctx : multiprocessing context, optional
+        Context used to create the shared counter.
+    """
+
+    def __init__(self, limit:int, ctx=None):
+        ctx = multiprocessing if ctx is None else ctx
+        self.limit = limit
+        self._n_used = ctx.Value("i", 0)
+
+    def acquire(self) -> bool:
+        "Take a process from the budget (False if none left)"
+        with self._n_used.get_lock():
+            if self._n_used.value >= self.limit:
+                return False
+            self._n_used.value += 1
+            return True
+
+    def release(self):
+        "Return a process to the budget"
+        with self._n_used.get_lock():
+            self._n_used.value = max(self._n_used.value - 1, 0)
+
+    @property
+    def n_used(self) -> int:
+        "int: Number of processes taken from the budget"
+        return self._n_used.value
+
+    @property
+    def n_free(self) -> int:
+        "int: Number of processes left in the budget"
+        return self.limit - self._n_used.value
+
+class _ShardFilter(logging.Filter):
+    """Marks the records of a shard and prevents sending
+    the records from the other shards back to the coordinator"""
+
+    def __init__(self, index:int):
+        super().__init__()
+        self.index = index
+
+    def filter(self, record):
+        shard = getattr(record, "shard", None)
+        if shard is None:
+            record.shard = self.index
+            return True
+        return shard == self.index
+
+class ShardScheduler(Scheduler):
+    """Scheduler of one shard.
+
+    Runs only the tasks in its partition but keeps
+    the status of the rest of the tasks of the session
+    up to date using the records the coordinator
+    (``ShardedScheduler``) forwards from the other
+    shards.
+
+    Parameters
+    ----------
+    session : redengine.session.Session
+        Session of the scheduler.
+    index : int
+        Number of the shard.
+    partition : set of str
+        Names of the tasks the shard runs.
+    inbox : multiprocessing.Queue
+        Queue of the records from the other shards.
+    stop_event : multiprocessing.Event
+        Event set by the coordinator to shut down.
+    process_budget : ProcessBudget, optional
+        Processes shared with the other shards.
+    """
+
+    def __init__(self, session, index:int, partition:Set[str], inbox, stop_event, process_budget:ProcessBudget=None, **kwargs):
+        super().__init__(session=session, **kwargs)
+        self.index = index
+        self.partition = partition
+        self.process_budget = process_budget
+        self._inbox = inbox
+        self._stop_event = stop_event
+
+    @property
+    def tasks(self):
+        return self._sort_tasks(task for task in self.session.get_tasks() if task.name in self.partition)
+
+    def run_cycle(self):
+        if self._stop_event.is_set():
+            raise SchedulerExit()
+        self.handle_shard_records()
+        super().run_cycle()
+
+    def handle_shard_records(self):
+        "Update the tasks of the other shards with the records from the coordinator"
+        while True:
+            try:
+                record = self._inbox.get(block=False)
+            except Empty:
+                break
+            if record.task_name in self.session:
+                self.session[record.task_name].log_record(record)
+
+class ShardedScheduler:
+    """Scheduler that partitions the tasks of the
+    session to multiple scheduler processes (shards).
+
+    Each shard runs the cycles of the scheduler over its
+    own partition of the tasks thus the conditions are
+    evaluated in parallel. The shards share the process
+    budget (``max_process_count``) and the coordinator
+    (this scheduler) collects the log records of all of
+    the shards to the loggers of the session and forwards
+    them to the other shards. Therefore the conditions
+    depending on tasks in another shard (ie. ``DependSuccess``)
+    resolve the same way as with one scheduler.
+
+    The shards are forked from the coordinator thus
+    the ``fork`` start method must be available.
+
+    Parameters
+    ----------
+    session : redengine.session.Session
+        Session of the scheduler.
+    n_shards : int, optional
+        Number of shards. By default the ``n_shards``
+        of the session configuration.
+    shard_key : callable, optional
+        Function that returns the key of a task. The
+        tasks are partitioned by the hash of the key
+        (or by the key if it is an integer). By default
+        the tasks are partitioned by the names.
+
+    Warnings
+    --------
+    The return values of the tasks are only available
+    in the shard the task ran in (ie. ``Return`` of a
+    task in another shard returns the default).
+    """
+
+    def __init__(self, session:'Session'=None, n_shards:int=None, shard_key:Callable[[Task], Hashable]=None):
+        self.session = session
+        self.n_shards = n_shards if n_shards is not None else session.config.n_shards
+        self.shard_key = shard_key
+        self.logger = logging.getLogger(session.config.scheduler_logger_basename)
+        self.process_budget = None
+        self._workers = []
+        self._stop_event = None
+
+    def get_shard(self, task:Task) -> int:
+        "Get the number of the shard the task is run in"
+        key = task.name if self.shard_key is None else self.shard_key(task)
+        if not isinstance(key, int):
+            key = zlib.crc32(str(key).encode("utf-8"))
+        return key % self.n_shards
+
+    def get_partitions(self) -> List[Set[str]]:
+        "Get the names of the tasks in each shard"
+        partitions = [set() for _ in range(self.n_shards)]
+        for task in self.session.tasks:
+            partitions[self.get_shard(task)].add(task.name)
+        return partitions
+
+    def __call__(self):
+        """Start the shards and run till all of them
+        have shut down."""
+        ctx = multiprocessing.get_context("fork")
+        self.process_budget = ProcessBudget(self.session.config.max_process_count, ctx=ctx)
+        self._stop_event = ctx.Event()
+        outbox = ctx.Queue()
+        inboxes = [ctx.Queue() for _ in range(self.n_shards)]
+        for inbox in inboxes:
+            # The shards that have shut down do not
+            # read their inboxes anymore
+            inbox.cancel_join_thread()
+
+        self._workers = [
+            ctx.Process(
+                target=self._run_shard,
+                args=(index, partition, outbox, inboxes[index]),
+                name=f"redengine-shard-{index}"
+            )
+            for index, partition in enumerate(self.get_partitions())
+        ]
+        self.logger.info(f"Starting {self.n_shards} shards...")
+        for worker in self._workers:
+            worker.start()
+
+        try:
+            while any(worker.is_alive() for worker in self._workers):
+                try:
+                    record = outbox.get(timeout=0.1)
+                except Empty:
+                    continue
+                self._route_record(record, inboxes)
+        except KeyboardInterrupt:
+            self.logger.info("Interupted. Shutting down shards...")
+        finally:
+            self._stop_event.set()
+            # Records left after the shards exited
+            for worker in self._workers:
+                while worker.is_alive() or not outbox.empty():
+                    try:
+                        record = outbox.get(timeout=0.1)
+                    except Empty:
+                        continue
+                    self._route_record(record, inboxes)
+                worker.join()
+        self.logger.info("All shards shut down.")
+
+    def _route_record(self, record:logging.LogRecord, inboxes:list):
+        "Log a record of a shard and forward it to the other shards"
+        if record.task_name in self.session:
+            self.session[record.task_name].log_record(record)
+        for index, inbox in enumerate(inboxes):
+            if index != record.shard and self._workers[index].is_alive():
+                inbox.put(record)
+
+    def _run_shard(self, index:int, partition:Set[str], outbox, inbox):
+        "Run a shard (in the forked process)"
+        session = self.session
+        task_logger = logging.getLogger(session.config.task_logger_basename)
+
+        # The records are read from a local copy of the
+        # task logs and sent to the coordinator to log
+        local_repo = MemoryRepo(model=MinimalRecord)
+        for handler in task_logger.handlers:
+            repo = getattr(handler, "repo", None)
+            if repo is not None:
+                for record in self.get_seed_records(repo):
+                    local_repo.add(record)
+                break
+        queue_handler = QueueHandler(outbox)
+        queue_handler.addFilter(_ShardFilter(index))
+        task_logger.handlers = [RepoHandler(repo=local_repo), queue_handler]
+
+        scheduler = ShardScheduler(
+            session=session, index=index, partition=partition,
+            inbox=inbox, stop_event=self._stop_event, process_budget=self.process_budget
+        )
+        session.scheduler = scheduler
+        try:
+            scheduler()
+        finally:
+            outbox.close()
+            outbox.join_thread()
+
+    def get_seed_records(self, repo) -> List[MinimalRecord]:
+        """Get the records a shard is seeded with from the task 
+        logs. All of the history is copied as the conditions may
+        count the records of any task over any period (ie. 
+        ``TaskStarted(task='x') >= 3`` or the retries of 
+        ``TaskExecutable``). The records logged after the start
+        are forwarded by the coordinator."""
+        records = []
+        for record in repo.filter_by().all():
+            record = record if isinstance(record, dict) else record.dict()
+            records.append(MinimalRecord(**record))
+        return records
+
+    def shut_down(self):
+        "Shut down the shards"
+        if self._stop_event is not None:
+            self._stop_event.set()
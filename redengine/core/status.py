@@ -0,0 +1,341 @@
+import datetime
+import hashlib
+import multiprocessing
+import os
+import threading
+import time
+import warnings
+from multiprocessing import resource_tracker, shared_memory
+from typing import TYPE_CHECKING, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from redengine.core import Task
+
+# Status codes in the table (unknown actions are -1)
+STATUS_CODES = {None: 0, "run": 1, "success": 2, "fail": 3, "terminate": 4, "inaction": 5}
+_STATUSES = {code: status for status, code in STATUS_CODES.items()}
+_ACTIONS = ("run", "success", "fail", "terminate", "inaction")
+
+_MAGIC = b"REDSTAT1"
+_HEADER = np.dtype([("magic", "S8"), ("capacity", "<u4"), ("n_rows", "<u4")])
+_HEADER_SIZE = 64
+ROW_DTYPE = np.dtype([
+    ("seq", "<u8"), # Odd while the row is being written
+    ("name_hash", "<u8"),
+    ("status", "i1"),
+    ("pid", "<i4"),
+    ("run_count", "<i8"),
+    ("last_run", "<i8"),
+    ("last_success", "<i8"),
+    ("last_fail", "<i8"),
+    ("last_terminate", "<i8"),
+    ("last_inaction", "<i8"),
+    ("name", "S128"),
+])
+# Missing times (same as numpy's NaT)
+_NAT = np.iinfo(np.int64).min
+
+# Seconds a row being written is retried. The row
+# stays odd if the writer died while writing it thus
+# after that the row is read as it is (possibly torn).
+READ_TIMEOUT = 0.5
+
+# Tables created in this process
+_CREATED = set()
+
+def _hash_name(name:str) -> int:
+    return int.from_bytes(hashlib.blake2b(name.encode("utf-8"), digest_size=8).digest(), "little")
+
+def _to_ns(value) -> int:
+    if value is None:
+        return _NAT
+    elif isinstance(value, datetime.datetime):
+        value = value.timestamp()
+    return int(value * 1e9)
+
+def _from_ns(value:int) -> Optional[datetime.datetime]:
+    # Local time as the times of the tasks
+    if value == _NAT:
+        return None
+    return datetime.datetime.fromtimestamp(value / 1e9)
+
+class StatusTable:
+    """Table of the statuses of the tasks in shared memory.
+
+    The scheduler (the process that created the table)
+    publishes the status, the latest times of the actions
+    (as nanoseconds since epoch), the process id of the
+    latest record and the number of runs of each task
+    as it logs them. Other local processes (child processes
+    of the tasks or external monitors) can attach to the
+    table by its name and read the statuses without locks
+    or round trips to the scheduler.
+
+    The rows have a fixed layout (see ``ROW_DTYPE``) and
+    each row has a sequence number that is odd while the
+    row is being written (seqlock) so that the readers
+    retry the rows that changed while reading (for 
+    ``READ_TIMEOUT`` seconds). The times are read as 
+    local times, the same way as the times of the tasks.
+
+    Parameters
+    ----------
+    name : str, optional
+        Name of the shared memory block. By default a
+        unique name is generated.
+    capacity : int
+        Maximum number of tasks in the table, by default 1024.
+        Tasks that do not fit are not published.
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        from redengine.core.status import StatusTable
+
+        session.config.status_table = StatusTable("redengine-status")
+
+    And in a monitor:
+
+    .. code-block:: python
+
+        table = StatusTable.attach("redengine-status")
+        table.get_status("mytask")
+        df = table.read()
+    """
+
+    def __init__(self, name:str=None, capacity:int=1024):
+        size = _HEADER_SIZE + capacity * ROW_DTYPE.itemsize
+        self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        self.name = self._shm.name
+        self.capacity = capacity
+        self._owner_pid = os.getpid()
+        _CREATED.add(self.name)
+        self._header = np.ndarray((), dtype=_HEADER, buffer=self._shm.buf)
+        self._header["capacity"] = capacity
+        self._header["n_rows"] = 0
+        self._header["magic"] = _MAGIC
+        self._rows = np.ndarray((capacity,), dtype=ROW_DTYPE, buffer=self._shm.buf, offset=_HEADER_SIZE)
+        self._index: Dict[int, int] = {}
+        self._n_indexed = 0
+        self._lock = threading.Lock()
+        self._warned = False
+
+    @classmethod
+    def attach(cls, name:str) -> 'StatusTable':
+        "Attach to an existing table for reading"
+        self = cls.__new__(cls)
+        self.name = name
+        self._owner_pid = None
+        self._shm = None
+        self._attach()
+        return self
+
+    def _attach(self):
+        shm = shared_memory.SharedMemory(name=self.name)
+        if self.name not in _CREATED and multiprocessing.parent_process() is None:
+            # Attaching registers the block to the resource tracker
+            # of the process which would remove the block as the
+            # process exits. The child processes share the tracker
+            # of the scheduler thus only other processes unregister.
+            resource_tracker.unregister(shm._name, "shared_memory")
+        header = np.ndarray((), dtype=_HEADER, buffer=shm.buf)
+        if header["magic"] != _MAGIC:
+            shm.close()
+            raise ValueError(f"Shared memory '{self.name}' is not a status table")
+        self._shm = shm
+        self._header = header
+        self.capacity = int(header["capacity"])
+        self._rows = np.ndarray((self.capacity,), dtype=ROW_DTYPE, buffer=shm.buf, offset=_HEADER_SIZE)
+        self._index = {}
+        self._n_indexed = 0
+        self._lock = threading.Lock()
+        self._warned = False
+
+    @property
+    def is_attached(self) -> bool:
+        "bool: Whether the table is readable in the process"
+        return self._shm is not None
+
+    @property
+    def is_owner(self) -> bool:
+        "bool: Whether the process writes to the table (the scheduler)"
+        return self._owner_pid == os.getpid()
+
+    @property
+    def n_rows(self) -> int:
+        "int: Number of tasks in the table"
+        return int(self._header["n_rows"])
+
+# Writing (the scheduler)
+    def _get_row(self, name:str, create:bool=False) -> Optional[int]:
+        name_hash = _hash_name(name)
+        index = self._index.get(name_hash)
+        if index is None and create:
+            n_rows = self.n_rows
+            if n_rows >= self.capacity:
+                if not self._warned:
+                    warnings.warn(f"Status table '{self.name}' is full ({self.capacity} tasks). Task '{name}' is not published.")
+                    self._warned = True
+                return None
+            row = self._rows[n_rows]
+            row["seq"] = 0
+            row["name_hash"] = name_hash
+            row["name"] = name.encode("utf-8")[:ROW_DTYPE["name"].itemsize]
+            row["status"] = 0
+            row["pid"] = 0
+            row["run_count"] = 0
+            for action in _ACTIONS:
+                row[f"last_{action}"] = _NAT
+            # The row is visible to the readers after it is complete
+            self._header["n_rows"] = n_rows + 1
+            self._index[name_hash] = index = n_rows
+        return index
+
+    def set_task(self, task:'Task'):
+        "Write the whole state of a task"
+        state = task._state
+        with self._lock:
+            index = self._get_row(task.name, create=True)
+            if index is None:
+                return
+            row = self._rows[index]
+            row["seq"] += 1
+            row["status"] = STATUS_CODES.get(state.status, -1)
+            for action in _ACTIONS:
+                row[f"last_{action}"] = _to_ns(getattr(state, f"last_{action}"))
+            row["seq"] += 1
+
+    def set_action(self, name:str, action:str, created:float=None, pid:int=None):
+        """Write an action (status) of a task logged at
+        given time (seconds since epoch, by default now)
+        by given process (by default the current)."""
+        created = time.time() if created is None else created
+        with self._lock:
+            index = self._get_row(name, create=True)
+            if index is None:
+                return
+            row = self._rows[index]
+            row["seq"] += 1
+            row["status"] = STATUS_CODES.get(action, -1)
+            row["pid"] = os.getpid() if pid is None else pid
+            if action in _ACTIONS:
+                row[f"last_{action}"] = _to_ns(created)
+            if action == "run":
+                row["run_count"] += 1
+            row["seq"] += 1
+
+# Reading (any process)
+    def _find(self, name:str) -> Optional[int]:
+        name_hash = _hash_name(name)
+        index = self._index.get(name_hash)
+        if index is None and not self.is_owner:
+            # Rows added after the previous lookup
+            n_rows = self.n_rows
+            hashes = self._rows["name_hash"][self._n_indexed:n_rows].tolist()
+            for i, row_hash in enumerate(hashes, start=self._n_indexed):
+                self._index[row_hash] = i
+            self._n_indexed = n_rows
+            index = self._index.get(name_hash)
+        return index
+
+    def _read_row(self, index:int) -> np.void:
+        row = self._rows[index:index + 1]
+        deadline = time.monotonic() + READ_TIMEOUT
+        while True:
+            seq = int(row["seq"][0])
+            if seq % 2 == 0:
+                copy = row.copy()[0]
+                if int(row["seq"][0]) == seq:
+                    return copy
+            elif time.monotonic() > deadline:
+                # The writer likely died while writing
+                return row.copy()[0]
+            time.sleep(0)
+
+    def snapshot(self) -> np.ndarray:
+        """Get a consistent copy of the rows of the
+        table (as a structured array of ``ROW_DTYPE``)."""
+        n_rows = self.n_rows
+        rows = self._rows[:n_rows]
+        copy = rows.copy()
+        deadline = time.monotonic() + READ_TIMEOUT
+        while True:
+            # Rows that were being written while copied
+            changed = (copy["seq"] != rows["seq"]) | (copy["seq"] % 2 == 1)
+            if not changed.any() or time.monotonic() > deadline:
+                return copy
+            time.sleep(0)
+            indexes = np.nonzero(changed)[0]
+            copy[indexes] = rows[indexes]
+
+    def get(self, name:str) -> Optional[dict]:
+        """Get the published state of a task (None if
+        the task is not in the table)."""
+        index = self._find(name)
+        if index is None:
+            return None
+        row = self._read_row(index)
+        state = {
+            "name": row["name"].decode("utf-8", errors="replace"),
+            "status": _STATUSES.get(int(row["status"])),
+            "pid": int(row["pid"]) or None,
+            "run_count": int(row["run_count"]),
+        }
+        for action in _ACTIONS:
+            state[f"last_{action}"] = _from_ns(int(row[f"last_{action}"]))
+        return state
+
+    def get_status(self, name:str) -> Optional[str]:
+        "Get the published status of a task"
+        index = self._find(name)
+        if index is None:
+            return None
+        return _STATUSES.get(int(self._read_row(index)["status"]))
+
+    def read(self) -> pd.DataFrame:
+        "Read the states of all of the tasks in the table"
+        rows = self.snapshot()
+        df = pd.DataFrame({
+            "name": [name.decode("utf-8", errors="replace") for name in rows["name"]],
+            "status": [_STATUSES.get(code) for code in rows["status"].tolist()],
+            "pid": rows["pid"],
+            "run_count": rows["run_count"],
+        })
+        for action in _ACTIONS:
+            df[f"last_{action}"] = pd.to_datetime([_from_ns(value) for value in rows[f"last_{action}"].tolist()])
+        return df
+
+    def close(self):
+        """Detach from the table. The owner also
+        removes the table."""
+        if self._shm is None:
+            return
+        is_owner = self.is_owner
+        # The arrays must not refer to the memory when closed
+        self._header = None
+        self._rows = None
+        self._shm.close()
+        if is_owner:
+            self._shm.unlink()
+            _CREATED.discard(self.name)
+        self._shm = None
+
+    def __getstate__(self):
+        # NOTE: The config (and the table) is pickled
+        # when a process task is started using spawn.
+        # The table is attached for reading there.
+        return {"name": self.name, "_owner_pid": self._owner_pid}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._shm = None
+        try:
+            self._attach()
+        except FileNotFoundError:
+            # Unpickled on another host (ie. remote worker)
+            pass
@@ -1,5 +1,6 @@
 
 from pickle import PicklingError
+import os
 import sys
 import time
 import datetime
@@ -11,18 +12,23 @@ from copy import copy
 from abc import abstractmethod
 from typing import TYPE_CHECKING, Any, Callable, ClassVar, List, Dict, Literal, Type, Union, Tuple, Optional, get_type_hints
 import multiprocessing
+from multiprocessing.connection import Connection
 import threading
+import asyncio
+import concurrent.futures
+import uuid
+from functools import partial
 from queue import Empty
 
 import pandas as pd
 from pydantic import BaseModel, Field, PrivateAttr, validator
 
 from redengine._base import RedBase
-from redengine.core.condition import BaseCondition, AlwaysFalse, All, set_statement_defaults
+from redengine.core.condition import BaseCondition, AlwaysFalse, All, set_statement_defaults, copy_condition
 from redengine.core.time import TimePeriod
 from redengine.core.parameters import Parameters
-from redengine.core.log import TaskAdapter
-from redengine.core.utils import is_pickleable, filter_keyword_args, is_main_subprocess
+from redengine.core.log import TaskAdapter, current_run_id
+from redengine.core.utils import is_pickleable, filter_keyword_args, is_main_subprocess, get_process_context
 from redengine.exc import SchedulerRestart, SchedulerExit, TaskInactionException, TaskTerminationException
 from redengine.core.meta import _register
 from redengine.core.hook import _Hooker
@@ -31,9 +37,77 @@ from redengine.log import QueueHandler
 if TYPE_CHECKING:
     from redengine import Session
     from redengine.core.parameters import BaseArgument
+    from redengine.worker import RemoteRun
+    from redengine.core.host import HostedRun
 
 _IS_WINDOWS = platform.system()
 
+# Guards the lazy creation of locks and events of tasks
+_CREATE_LOCK = threading.Lock()
+
+class _TaskState:
+    """Runtime state of a task.
+    
+    The state changes every time the task runs
+    thus it is kept outside of the validated 
+    fields of the task."""
+
+    __slots__ = (
+        "status", "force_run", "force_termination",
+        "last_run", "last_success", "last_fail", "last_terminate", "last_inaction",
+        "waiting_for", "last_queue_wait",
+    )
+
+    def __init__(self):
+        self.status = None
+        self.force_run = False
+        self.force_termination = False
+        self.last_run = None
+        self.last_success = None
+        self.last_fail = None
+        self.last_terminate = None
+        self.last_inaction = None
+        self.waiting_for = None
+        self.last_queue_wait = None
+
+class _TaskInstance:
+    """Handles of a run of a task that is left 
+    running as the task is run again (see 
+    ``max_instances``)."""
+
+    __slots__ = ("run_id", "process", "thread", "thread_future", "hosted", "async_future", "remote", "terminate_event")
+
+    def __init__(self, run_id, process=None, thread=None, thread_future=None, hosted=None, async_future=None, remote=None, terminate_event=None):
+        self.run_id = run_id
+        self.process = process
+        self.thread = thread
+        self.hosted = hosted
+        self.thread_future = thread_future
+        self.async_future = async_future
+        self.remote = remote
+        self.terminate_event = terminate_event
+
+    def is_alive(self) -> bool:
+        if self.hosted is not None:
+            return self.hosted.is_alive()
+        elif self.thread_future is not None:
+            return not self.thread_future.done()
+        elif self.thread is not None:
+            return self.thread.is_alive()
+        elif self.process is not None:
+            return self.process.is_alive()
+        elif self.async_future is not None:
+            return not self.async_future.done()
+        elif self.remote is not None:
+            return self.remote.is_alive()
+        return False
+
+def _state_property(name:str, doc:str):
+    "Create a property to access an attribute of the runtime state"
+    def fget(self):
+        return getattr(self._state, name)
+    return property(fget, doc=doc)
+
 class Task(RedBase, BaseModel):
     """Base class for Tasks.
 
@@ -58,14 +132,18 @@ class Task(RedBase, BaseModel):
     end_cond : BaseCondition, optional
         Condition that when True the task
         will be terminated. Only works for for 
-        tasks with execution='process' or 'thread'
-        if thread termination is implemented in 
+        tasks with execution='process', 'remote' or 'async', or 
+        'thread' if thread termination is implemented in 
         the task, by default AlwaysFalse()
-    execution : str, {'main', 'thread', 'process'}, default='process'
+    execution : str, {'main', 'thread', 'process', 'async', 'remote'}, default='process'
         How the task is executed. Allowed values
         'main' (run on main thread & process), 
-        'thread' (run on another thread) and 
-        'process' (run on another process).
+        'thread' (run on another thread), 
+        'process' (run on another process),
+        'async' (run concurrently on the event loop 
+        of the scheduler) and 'remote' (run on a 
+        process of a remote worker, see 
+        ``redengine.worker``).
     parameters : Parameters, optional
         Parameters set specifically to the task, 
         by default None
@@ -97,6 +175,18 @@ class Task(RedBase, BaseModel):
         for tasks with execution='process' or 
         with execution='thread'. Passed to 
         ``pandas.Timedelta``.
+    resources : dict, optional
+        Named resources and their amounts the
+        task holds while running, ie. 
+        ``{"db": 1, "cpu": 2}``. The limits of
+        the resources are set in the session 
+        configuration (``resource_limits``).
+    max_instances : int
+        Maximum number of runs of the task that
+        can be alive at the same time. Only 
+        applicable for tasks with execution 
+        'process', 'thread', 'async' or 'remote',
+        by default 1
     daemon : Bool, optional
         Whether run the task as daemon process
         or not. Only applicable for execution='process',
@@ -151,6 +241,7 @@ class Task(RedBase, BaseModel):
     # Class
     permanent_task: bool = False # Whether the task is not meant to finish (Ie. RestAPI)
     _actions: ClassVar[Tuple] = ("run", "fail", "success", "inaction", "terminate", None, "crash_release")
+    _statuses: ClassVar[Tuple] = ("run", "fail", "success", "inaction", "terminate", None)
     fmt_log_message: str = r"Task '{task}' status: '{action}'"
 
     daemon: Optional[bool]
@@ -159,15 +250,14 @@ class Task(RedBase, BaseModel):
     name: Optional[str] = Field(description="Name of the task. Must be unique")
     description: Optional[str] = Field(description="Description of the task for documentation")
     logger_name: Optional[str] = Field(description="Logger name to be used in logging the task records")
-    execution: Optional[Literal['main', 'thread', 'process']]
+    execution: Optional[Literal['main', 'thread', 'process', 'async', 'remote']]
     priority: int = 0
     disabled: bool = False
-    force_run: bool = False
-    force_termination: bool = False
-    status: Optional[Literal['run', 'fail', 'success', 'terminate', 'inaction']] = Field(description="Latest status of the task")
     timeout: Optional[pd.Timedelta]
+    resources: Dict[str, int] = Field(default_factory=dict)
+    max_instances: int = Field(default=1, ge=1)
 
-    parameters: Parameters = Parameters()
+    parameters: Parameters = Field(default_factory=Parameters)
 
     start_cond: BaseCondition = AlwaysFalse() #! TODO: Create get_start_cond so that this could also be as string (lazily parsed)
     end_cond: BaseCondition = AlwaysFalse()
@@ -175,34 +265,58 @@ class Task(RedBase, BaseModel):
     on_startup: bool = False
     on_shutdown: bool = False
 
-    last_run: Optional[datetime.datetime]
-    last_success: Optional[datetime.datetime]
-    last_fail: Optional[datetime.datetime]
-    last_terminate: Optional[datetime.datetime]
-    last_inaction: Optional[datetime.datetime]
-
+    # Runtime state (not validated)
+    status = _state_property("status", "Latest status of the task")
+    force_run = _state_property("force_run", "Whether the task is run regardless of the start_cond")
+    force_termination = _state_property("force_termination", "Whether the task is terminated regardless of the end_cond")
+    last_run = _state_property("last_run", "Latest time the task started")
+    last_success = _state_property("last_success", "Latest time the task succeeded")
+    last_fail = _state_property("last_fail", "Latest time the task failed")
+    last_terminate = _state_property("last_terminate", "Latest time the task was terminated")
+    last_inaction = _state_property("last_inaction", "Latest time the task inacted")
+    waiting_for = _state_property("waiting_for", "Resource or execution limit the task is waiting for to run")
+    last_queue_wait = _state_property("last_queue_wait", "Time the latest run waited in the ready queue of the scheduler")
+
+    _state: _TaskState = PrivateAttr(default_factory=_TaskState)
     _process: multiprocessing.Process = None
     _thread: threading.Thread = None
-    _thread_terminate: threading.Event = PrivateAttr(default_factory=threading.Event)
-    _lock: Optional[threading.Lock] = PrivateAttr(default_factory=threading.Lock)
+    _thread_future: concurrent.futures.Future = None
+    # Thread run on the task host (see config.thread_host)
+    _hosted: Optional['HostedRun'] = None
+    _async_future: concurrent.futures.Future = None
+    _async_task: asyncio.Task = None
+    # Run on a remote worker (see redengine.worker)
+    _remote: Optional['RemoteRun'] = None
+    _launch_pending: bool = False
+    _run_id: Optional[str] = None
+    # Earlier runs that are still alive (see max_instances)
+    _instances: Optional[List[_TaskInstance]] = None
+    # Process started ahead of the run (see prespawn)
+    _warm_process: Optional[multiprocessing.Process] = None
+    _warm_conn: Optional[Connection] = None
+    _warm_queue: Optional[multiprocessing.Queue] = None
+    # These are created when first needed
+    _thread_terminate_event: Optional[threading.Event] = None
+    _lock: Optional[threading.Lock] = None
+    _logger_adapter: Optional[TaskAdapter] = None
+    _logger_handlers: Optional[list] = None
+    _period: Optional[TimePeriod] = None
 
     _mark_running = False
 
     @validator('start_cond', pre=True)
     def parse_start_cond(cls, value, values):
-        from redengine.parse.condition import parse_condition
         session = values['session']
         if isinstance(value, str):
-            value = parse_condition(value, session=session)
-        return copy(value)
+            value = session._parse_condition(value)
+        return copy_condition(value)
 
     @validator('end_cond', pre=True)
     def parse_end_cond(cls, value, values):
-        from redengine.parse.condition import parse_condition
         session = values['session']
         if isinstance(value, str):
-            value = parse_condition(value, session=session)
-        return copy(value)
+            value = session._parse_condition(value)
+        return copy_condition(value)
 
     @validator('logger_name', pre=True, always=True)
     def parse_logger_name(cls, value, values):
@@ -229,9 +343,20 @@ class Task(RedBase, BaseModel):
             return value
 
     @property
-    def logger(self):
+    def logger(self) -> TaskAdapter:
+        # The adapter is cached and recreated if the 
+        # logger or its handlers have changed
+        adapter = self._logger_adapter
+        if adapter is not None:
+            logger = logging.Logger.manager.loggerDict.get(self.logger_name)
+            if adapter.logger is logger and self._logger_handlers == logger.handlers:
+                return adapter
+
         logger = logging.getLogger(self.logger_name)
-        return TaskAdapter(logger, task=self)
+        adapter = TaskAdapter(logger, task=self)
+        self._logger_adapter = adapter
+        self._logger_handlers = list(logger.handlers)
+        return adapter
 
     def __init__(self, **kwargs):
 
@@ -242,7 +367,15 @@ class Task(RedBase, BaseModel):
             kwargs['session'] = self.session
         kwargs['name'] = self._get_name(**kwargs)
 
+        state = {
+            attr: kwargs.pop(attr) 
+            for attr in _TaskState.__slots__ 
+            if attr in kwargs
+        }
         super().__init__(**kwargs)
+        for attr, value in state.items():
+            # Validated the same way as set later
+            setattr(self, attr, value)
 
         # Set default readable logger if missing 
         self.session._check_readable_logger()
@@ -311,6 +444,60 @@ class Task(RedBase, BaseModel):
     def __hash__(self):
         return id(self)
 
+    def __setattr__(self, name, value):
+        if name in _TaskState.__slots__:
+            # Runtime state is set frequently thus
+            # it bypasses the validation of Pydantic
+            if name == "status" and value not in self._statuses:
+                raise ValueError(f"Invalid status: {value!r}")
+            setattr(self._state, name, value)
+        elif name == "name":
+            old_name = self.name
+            super().__setattr__(name, value)
+            self.session._rename_task(self, old_name)
+            self._logger_adapter = None
+            self._period = None
+        else:
+            super().__setattr__(name, value)
+            # Reset cached properties
+            if name == "logger_name":
+                self._logger_adapter = None
+            elif name == "start_cond":
+                set_statement_defaults(self.start_cond, task=self)
+                self._period = None
+                session = self.session
+                if session is not None and session._task_names.get(self.name) is self:
+                    session.graph.update_task(self)
+            elif name == "end_cond":
+                set_statement_defaults(self.end_cond, task=self)
+
+    def _iter(self, to_dict=False, by_alias=False, include=None, exclude=None, exclude_unset=False, exclude_defaults=False, exclude_none=False):
+        # Include the runtime state to Task.dict() and Task.json()
+        yield from super()._iter(
+            to_dict=to_dict, by_alias=by_alias, include=include, exclude=exclude, 
+            exclude_unset=exclude_unset, exclude_defaults=exclude_defaults, exclude_none=exclude_none
+        )
+        if not to_dict:
+            # Task.copy(), the state is copied in _copy_and_set_values
+            return
+        for attr in _TaskState.__slots__:
+            if include is not None and attr not in include:
+                continue
+            if exclude is not None and attr in exclude:
+                continue
+            value = getattr(self._state, attr)
+            if value in (None, False) and (exclude_none or exclude_unset or exclude_defaults):
+                continue
+            yield attr, value
+
+    def _copy_and_set_values(self, values, fields_set, *, deep):
+        task = super()._copy_and_set_values(values, fields_set, deep=deep)
+        if not deep:
+            # Pydantic copies the private attributes shallowly
+            # thus the copy would share the state
+            object.__setattr__(task, "_state", copy(self._state))
+        return task
+
     def __call__(self, params:Union[dict, Parameters]=None, **kwargs):
         """Execute the task. Creates a new process
         (if execution='process'), a new thread
@@ -326,13 +513,37 @@ class Task(RedBase, BaseModel):
             and extra parameters are acquired, by default None
         """
 
+        # Runs that are still alive are kept aside 
+        # if the task is allowed to run multiple instances
+        if self.max_instances > 1 and self.is_alive_current():
+            self._stash_instance()
+
         # Remove old threads/processes
         # (using _process and _threads are most robust way to check if running as process or thread)
         if self._process is not None:
             self._process = None
         if self._thread:
             self._thread = None
+        if self._thread_future is not None:
+            self._thread_future = None
+        if self._hosted is not None:
+            self._hosted = None
+        if self._async_future is not None:
+            self._async_future = None
+        if self._remote is not None:
+            self._remote = None
+
+        # Each run has an identifier that is
+        # included in the log records of the run
+        self._run_id = uuid.uuid4().hex
+        token = current_run_id.set(self._run_id)
+        try:
+            self._run(params, **kwargs)
+        finally:
+            current_run_id.reset(token)
 
+    def _run(self, params:Union[dict, Parameters]=None, **kwargs):
+        "Run the task using the execution of the task"
         # The parameters are handled in the following way:
         #   - First extra parameters are fetched. This includes:
         #       - session.parameters
@@ -363,6 +574,10 @@ class Task(RedBase, BaseModel):
                 self.run_as_process(params=params, **kwargs)
             elif execution == "thread":
                 self.run_as_thread(params=params, **kwargs)
+            elif execution == "async":
+                self.run_as_async(params=params, **kwargs)
+            elif execution == "remote":
+                self.run_as_remote(params=params, **kwargs)
         except (SchedulerRestart, SchedulerExit):
             raise
         except Exception as exc:
@@ -481,31 +696,58 @@ class Task(RedBase, BaseModel):
 
         finally:
             self.process_finish(status=status)
-            self.force_run = False
+            self._state.force_run = False
             #if cwd is not None:
             #    os.chdir(old_cwd)
             hooker.postrun(*exc_info)
 
     def run_as_thread(self, params:Parameters, **kwargs):
-        """Create a new thread and run the task on that."""
+        """Create a new thread and run the task on that.
+        
+        If the scheduler has a thread pool (``thread_pool_size``
+        is set), the task is submitted to the pool instead. The 
+        run may then wait in the queue of the pool till a worker
+        is free. If the task host is in use (``thread_host`` is 
+        set), the task is run on a thread of the host process."""
 
         params = params.pre_materialize(task=self)
         direct_params = self.parameters.pre_materialize(task=self)
 
         self._thread_terminate.clear()
 
+        host = self.session.scheduler.get_task_host()
+        if host is not None:
+            self._state.last_run = datetime.datetime.fromtimestamp(time.time()) # Needed for termination
+            exec_hooks = self._get_hooks("task_execute")
+            self._mark_running = True # needed in pickling
+            try:
+                self._hosted = host.submit(self, params, direct_params, exec_hooks)
+            finally:
+                self._mark_running = False
+            return
+
+        pool = self.session.scheduler.get_thread_pool()
+        if pool is not None:
+            self._state.last_run = datetime.datetime.fromtimestamp(time.time()) # Needed for termination
+            self._thread_future = pool.submit(self._run_as_thread, params, direct_params, run_id=self._run_id)
+            return
+
         event_is_running = threading.Event()
-        self._thread = threading.Thread(target=self._run_as_thread, args=(params, direct_params, event_is_running))
-        self.last_run = datetime.datetime.fromtimestamp(time.time()) # Needed for termination
+        self._thread = threading.Thread(target=self._run_as_thread, args=(params, direct_params, event_is_running), kwargs={"run_id": self._run_id})
+        self._state.last_run = datetime.datetime.fromtimestamp(time.time()) # Needed for termination
         self._thread.start()
         event_is_running.wait() # Wait until the task is confirmed to run 
  
-    def _run_as_thread(self, params:Parameters, direct_params:Parameters, event=None):
+    def _run_as_thread(self, params:Parameters, direct_params:Parameters, event=None, run_id=None):
         """Running the task in a new thread. This method should only
         be run by the new thread."""
+        # The workers of the thread pool are reused
+        # thus the run is reset afterwards
+        token = current_run_id.set(run_id)
 
         self.log_running()
-        event.set()
+        if event is not None:
+            event.set()
         try:
             output = self._run_as_main(params=params, direct_params=direct_params, execution="thread")
         except:
@@ -513,9 +755,103 @@ class Task(RedBase, BaseModel):
             self.log_failure()
             # We cannot rely the exception to main thread here
             # thus we supress to prevent unnecessary warnings.
+        finally:
+            current_run_id.reset(token)
 
-    def run_as_process(self, params:Parameters, daemon=None, log_queue: multiprocessing.Queue=None):
-        """Create a new process and run the task on that."""
+    def run_as_async(self, params:Parameters, **kwargs):
+        """Run the task on the event loop of the scheduler."""
+
+        params = params.pre_materialize(task=self)
+        direct_params = self.parameters.pre_materialize(task=self)
+
+        self._thread_terminate.clear()
+        self._async_task = None
+
+        loop = self.session.scheduler.get_event_loop()
+        self.log_running()
+        self._async_future = asyncio.run_coroutine_threadsafe(
+            self._run_as_async(params=params, direct_params=direct_params, terminate_event=self._thread_terminate, run_id=self._run_id), 
+            loop
+        )
+
+    async def _run_as_async(self, params:Parameters, direct_params:Parameters, terminate_event=None, run_id=None):
+        """Running the task on the event loop. This method should only
+        be run by the event loop of the scheduler."""
+        # Each coroutine runs in a copy of the context
+        current_run_id.set(run_id)
+        terminate_event = self._thread_terminate if terminate_event is None else terminate_event
+        if run_id == self._run_id:
+            self._async_task = asyncio.current_task()
+
+        hooker = _Hooker(self.session.hooks.task_execute)
+        hooker.prerun(self)
+
+        status = None
+        output = None
+        exc_info = (None, None, None)
+        try:
+            if terminate_event.is_set():
+                # Terminated before the task got to start
+                raise asyncio.CancelledError()
+            params = self.postfilter_params(params)
+            params = Parameters(params) | Parameters(direct_params)
+            params = params.materialize(task=self)
+
+            output = await self.execute_async(**params)
+            self.process_success(output)
+
+        except (asyncio.CancelledError, TaskTerminationException):
+            # Task was cancelled (terminated) by the scheduler
+            # or the task listened the termination event.
+            self.log_termination(reason="cancelled")
+            # Sync execute may still run in a thread and
+            # it should see the termination request
+            terminate_event.set()
+            status = "termination"
+            exc_info = sys.exc_info()
+
+        except TaskInactionException:
+            self.log_inaction()
+            status = "inaction"
+            exc_info = sys.exc_info()
+
+        except Exception:
+            try:
+                self.process_failure(*sys.exc_info())
+            except:
+                # Failure of failure processing
+                self.log_failure()
+            else:
+                self.log_failure()
+            status = "failed"
+            exc_info = sys.exc_info()
+
+        else:
+            self._handle_return(output)
+            self.log_success(output)
+            status = "succeeded"
+            return output
+
+        finally:
+            self.process_finish(status=status)
+            self.force_run = False
+            if run_id == self._run_id:
+                self._async_task = None
+            hooker.postrun(*exc_info)
+
+    def _cancel_async(self):
+        "Cancel the task running on the event loop (must be called from the loop)"
+        if self._async_task is not None:
+            self._async_task.cancel()
+
+    def run_as_process(self, params:Parameters, daemon=None, log_queue: multiprocessing.Queue=None, wait_for_run=True):
+        """Create a new process and run the task on that.
+        
+        If ``wait_for_run`` is False, the method returns 
+        without waiting for the process to log that it
+        started running. The launch is then pending till
+        the run record is handled from the log queue
+        (by the scheduler)."""
 
         params = params.pre_materialize(task=self)
         direct_params = self.parameters.pre_materialize(task=self)
@@ -523,20 +859,139 @@ class Task(RedBase, BaseModel):
         # Daemon resolution: task.daemon >> scheduler.tasks_as_daemon
         log_queue = self.session.scheduler._log_queue if log_queue is None else log_queue
 
+        exec_hooks = self._get_hooks("task_execute")
+        if not self._run_prespawned(params, direct_params, log_queue, exec_hooks):
+            daemon = self.daemon if self.daemon is not None else self.session.config.tasks_as_daemon
+            ctx = get_process_context(self.session.config.process_start_method, self.session.config.preload_modules)
+            self._process = ctx.Process(
+                target=self._run_as_process, 
+                args=(params, direct_params, log_queue, self.session.config, exec_hooks), 
+                daemon=daemon
+            ) 
+            #self._last_run = datetime.datetime.fromtimestamp(time.time()) # Needed for termination
+            self._mark_running = True # needed in pickling
+            
+            self._process.start()
+            self._mark_running = False
+        
+        if wait_for_run:
+            self._lock_to_run_log(log_queue)
+        else:
+            self._launch_pending = True
+        return log_queue
+
+    def prespawn(self, log_queue: multiprocessing.Queue=None):
+        """Start a warm process for the task ahead of 
+        its run. 
+        
+        The process prepares the task (see ``prepare_process``)
+        and waits till the task is run (using ``run_as_process``)
+        or the process is discarded (using ``discard_prespawn``)."""
+        self.discard_prespawn()
+        log_queue = self.session.scheduler._log_queue if log_queue is None else log_queue
+
         daemon = self.daemon if self.daemon is not None else self.session.config.tasks_as_daemon
-        self._process = multiprocessing.Process(
-            target=self._run_as_process, 
-            args=(params, direct_params, log_queue, self.session.config, self._get_hooks("task_execute")), 
+        ctx = get_process_context(self.session.config.process_start_method, self.session.config.preload_modules)
+        conn_recv, conn_send = ctx.Pipe(duplex=False)
+        self._warm_process = ctx.Process(
+            target=self._run_as_warm_process,
+            args=(conn_recv, conn_send, log_queue),
             daemon=daemon
-        ) 
-        #self._last_run = datetime.datetime.fromtimestamp(time.time()) # Needed for termination
+        )
         self._mark_running = True # needed in pickling
-        
-        self._process.start()
-        self._mark_running = False
-        
-        self._lock_to_run_log(log_queue)
-        return log_queue
+        try:
+            self._warm_process.start()
+        finally:
+            self._mark_running = False
+            conn_recv.close()
+        self._warm_conn = conn_send
+        self._warm_queue = log_queue
+
+    def discard_prespawn(self):
+        "Stop the warm process of the task (if any)"
+        process = self._warm_process
+        if process is None:
+            return
+        self._warm_conn.close() # The process exits as the pipe closes
+        self._warm_process = None
+        self._warm_conn = None
+        self._warm_queue = None
+        process.join(timeout=1)
+        if process.is_alive():
+            process.terminate()
+            process.join()
+
+    def run_as_remote(self, params:Parameters, **kwargs):
+        """Send the task to a remote worker (see 
+        ``redengine.worker``) using the worker server
+        of the session (``config.worker_server``).
+
+        The method returns without waiting for a worker
+        to start the run. The run is alive till the worker 
+        has finished it and its log records are handled 
+        from the queue of the server (by the scheduler)."""
+        server = self.session.config.worker_server
+        if server is None:
+            raise ValueError(f"Task '{self.name}' has execution 'remote' but the session has no worker server (config.worker_server)")
+
+        params = params.pre_materialize(task=self)
+        direct_params = self.parameters.pre_materialize(task=self)
+        exec_hooks = self._get_hooks("task_execute")
+
+        self._mark_running = True # needed in pickling
+        try:
+            self._remote = server.submit(self, params, direct_params, exec_hooks)
+        finally:
+            self._mark_running = False
+
+    def is_prespawned(self) -> bool:
+        "Whether the task has a warm process waiting for the run"
+        return self._warm_process is not None
+
+    def _run_prespawned(self, params:Parameters, direct_params:Parameters, log_queue, exec_hooks) -> bool:
+        "Run the task on the warm process (if there is a one alive)"
+        process = self._warm_process
+        if process is None:
+            return False
+        elif process.is_alive() and log_queue is self._warm_queue:
+            try:
+                self._warm_conn.send((params, direct_params, self.session.config, exec_hooks, self._run_id))
+            except Exception:
+                # Could not pass the parameters (ie. not picklable),
+                # starting a new process instead
+                pass
+            else:
+                self._warm_conn.close()
+                self._warm_process = None
+                self._warm_conn = None
+                self._warm_queue = None
+                self._process = process
+                return True
+        self.discard_prespawn()
+        return False
+
+    def _run_as_warm_process(self, conn, conn_send, queue):
+        """Prepare the task and wait for the run. 
+        This method should only be run by the warm 
+        process."""
+        # Only the main process may send so that
+        # the pipe closes if it is discarded
+        conn_send.close()
+        self.prepare_process()
+        try:
+            params, direct_params, config, exec_hooks, self._run_id = conn.recv()
+        except EOFError:
+            # Discarded
+            return
+        finally:
+            conn.close()
+        self._run_as_process(params, direct_params, queue, config, exec_hooks)
+
+    def prepare_process(self):
+        """Prepare the task in a warm process before
+        the task is run (see ``prespawn``). Override 
+        to import modules or to set up resources the
+        task needs."""
 
     def _run_as_process(self, params:Parameters, direct_params:Parameters, queue, config, exec_hooks):
         """Running the task in a new process. This method should only
@@ -552,6 +1007,8 @@ class Task(RedBase, BaseModel):
         # logger (with multiprocessing.Queue as queue) so that all the logging
         # records end up in the main process to be logged properly. 
 
+        current_run_id.set(self._run_id)
+
         basename = self.logger_name
         # handler = logging.handlers.QueueHandler(queue)
         handler = QueueHandler(queue)
@@ -663,6 +1120,17 @@ class Task(RedBase, BaseModel):
         """
         raise NotImplementedError(f"Method 'execute' not implemented to {type(self)}.")
 
+    async def execute_async(self, **kwargs):
+        """Run the actual task on the event loop (if 
+        ``execution='async'``). Override this with
+        a coroutine if the task supports asyncio.
+
+        By default, ``execute`` is run in a separate 
+        thread not to block the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(self.execute, **kwargs))
+
     def process_failure(self, exc_type:Type[Exception], exc_val:Exception, exc_tb:TracebackType):
         """This method is executed after a failure of the task. 
         Override if needed.
@@ -718,16 +1186,88 @@ class Task(RedBase, BaseModel):
         raise NotImplementedError(f"Method 'get_default_name' not implemented to {type(self)}")
 
     def is_alive(self) -> bool:
-        """Whether the task is alive: check if the task has a live process or thread."""
-        return self.is_alive_as_thread() or self.is_alive_as_process()
+        """Whether the task is alive: check if the task has a live process, thread or coroutine."""
+        return self.is_alive_current() or bool(self.get_instances())
+
+    def is_alive_current(self) -> bool:
+        """Whether the latest run of the task is alive."""
+        return self.is_alive_as_thread() or self.is_alive_as_process() or self.is_alive_as_async() or self.is_alive_as_remote()
+
+    def is_instance_alive(self, run_id:str) -> bool:
+        """Whether the given run of the task is alive."""
+        if run_id == self._run_id:
+            return self.is_alive_current()
+        return any(instance.run_id == run_id for instance in self.get_instances())
+
+    def get_instances(self) -> List[_TaskInstance]:
+        """Get the earlier runs of the task that are
+        still alive (the latest run excluded)."""
+        if not self._instances:
+            return []
+        self._instances = [instance for instance in self._instances if instance.is_alive()]
+        return self._instances
+
+    @property
+    def n_instances(self) -> int:
+        """int: Number of runs of the task alive."""
+        return int(self.is_alive_current()) + len(self.get_instances())
+
+    @property
+    def run_id(self) -> Optional[str]:
+        """str: Identifier of the latest run of the task."""
+        return self._run_id
+
+    def has_free_instance(self) -> bool:
+        """Whether the task can be run again (the number 
+        of alive runs is below ``max_instances``)."""
+        return self.n_instances < self.max_instances
+
+    def _stash_instance(self):
+        "Keep the alive latest run aside so that the task can be run again"
+        instance = _TaskInstance(
+            run_id=self._run_id,
+            process=self._process, 
+            thread=self._thread,
+            thread_future=self._thread_future,
+            hosted=self._hosted,
+            async_future=self._async_future,
+            remote=self._remote,
+            terminate_event=self._thread_terminate_event,
+        )
+        if self._instances is None:
+            self._instances = []
+        self._instances.append(instance)
+        # The next run has its own termination event
+        self._thread_terminate_event = None
+        self._async_task = None
 
     def is_alive_as_thread(self) -> bool:
-        """Whether the task has a live thread."""
+        """Whether the task has a live thread (or
+        it is running or queued in the thread pool
+        or running on the task host)."""
+        if self._hosted is not None:
+            return self._hosted.is_alive()
+        elif self._thread_future is not None:
+            return not self._thread_future.done()
         return self._thread is not None and self._thread.is_alive()
 
     def is_alive_as_process(self) -> bool:
         """Whether the task has a live process."""
         return self._process is not None and self._process.is_alive()
+
+    def is_alive_as_async(self) -> bool:
+        """Whether the task has a live coroutine on the event loop."""
+        return self._async_future is not None and not self._async_future.done()
+
+    def is_alive_as_remote(self) -> bool:
+        """Whether the task has a run on a remote worker
+        (or waiting for a free worker)."""
+        return self._remote is not None and self._remote.is_alive()
+
+    def is_launch_pending(self) -> bool:
+        """Whether the task has been launched as a process
+        but it has not yet been confirmed to run."""
+        return self._launch_pending
         
 # Logging
     def _lock_to_run_log(self, log_queue):
@@ -770,8 +1310,10 @@ class Task(RedBase, BaseModel):
         self._set_status("terminate", message=reason)
 
         # Reset event and force_termination (for threads)
-        self._thread_terminate.clear()
-        self.force_termination = False
+        # unless an earlier run was terminated
+        if current_run_id.get() in (None, self._run_id):
+            self._thread_terminate.clear()
+            self._state.force_termination = False
 
     def log_inaction(self):
         """Make a log that the task did nothing."""
@@ -781,13 +1323,19 @@ class Task(RedBase, BaseModel):
         """Log the record with the logger of the task.
         Also sets the status according to the record.
         """
+        # The launch is confirmed (or it crashed) 
+        run_id = getattr(record, "run_id", None)
+        if run_id is None or run_id == self._run_id:
+            self._launch_pending = False
+
         # Set last_run/last_success/last_fail etc.
         cache_attr = f"last_{record.action}"
         record_time = datetime.datetime.fromtimestamp(record.created)
-        setattr(self, cache_attr, record_time)
+        setattr(self._state, cache_attr, record_time)
 
         self.logger.handle(record)
-        self.status = record.action
+        self._state.status = record.action
+        self._publish_status(record.action, created=record.created, pid=getattr(record, "process", None), run_id=run_id)
 
     def get_status(self) -> Literal['run', 'fail', 'success', 'terminate', 'inaction', None]:
         """Get latest status of the task."""
@@ -805,6 +1353,11 @@ class Task(RedBase, BaseModel):
             self.status = status
             return status
         else:
+            table = self._get_status_table()
+            if table is not None and not table.is_owner and table.is_attached:
+                # In a child process the state is a copy
+                # thus the status is read from the scheduler
+                return table.get_status(self.name)
             # This is way faster
             return self.status
 
@@ -838,8 +1391,28 @@ class Task(RedBase, BaseModel):
                 extra=extra
             )
             cache_attr = f"last_{action}"
-            setattr(self, cache_attr, now)
-        self.status = action
+            setattr(self._state, cache_attr, now)
+        self._state.status = action
+        self._publish_status(action)
+
+    def _get_status_table(self):
+        session = self.session
+        if session is None:
+            return None
+        return session.config.status_table
+
+    def _publish_status(self, action, created:float=None, pid:int=None, run_id:str=None):
+        """Publish the status to the status table (see config.status_table)
+        and to the event bus (see session.events)"""
+        table = self._get_status_table()
+        if table is not None and table.is_owner:
+            table.set_action(self.name, action, created=created, pid=pid)
+        session = self.session
+        if session is not None and action is not None:
+            session.events.publish(
+                f"task_{action}", task=self.name, created=created,
+                run_id=run_id if run_id is not None else self._run_id, pid=pid if pid is not None else os.getpid()
+            )
 
     def get_last_success(self) -> datetime.datetime:
         """Get the lastest timestamp when the task succeeded."""
@@ -861,6 +1434,24 @@ class Task(RedBase, BaseModel):
         """Get the lastest timestamp when the task inacted."""
         return self._get_last_action("inaction")
 
+    def load_state(self):
+        """Read the status and the latest times of the 
+        actions of the task from the logs. Useful if 
+        other schedulers log to the same repository."""
+        if not self.logger.is_readable:
+            return
+        for action in ("run", "success", "fail", "terminate", "inaction"):
+            value = self._get_last_action_from_log(action)
+            if isinstance(value, float):
+                value = datetime.datetime.fromtimestamp(value)
+            setattr(self._state, f"last_{action}", value)
+        record = self.logger.get_latest()
+        if record:
+            self._state.status = record["action"] if isinstance(record, dict) else record.action
+        table = self._get_status_table()
+        if table is not None and table.is_owner:
+            table.set_task(self)
+
     def get_execution(self) -> str:
         if self.execution is None:
             return self.session.config.task_execution
@@ -922,8 +1513,20 @@ class Task(RedBase, BaseModel):
         priv_attrs = state['__private_attribute_values__']
         priv_attrs['_lock'] = None
         priv_attrs['_process'] = None
+        priv_attrs['_warm_process'] = None
+        priv_attrs['_warm_conn'] = None
+        priv_attrs['_warm_queue'] = None
         priv_attrs['_thread'] = None
-        priv_attrs['_thread_terminate'] = None
+        priv_attrs['_thread_future'] = None
+        priv_attrs['_hosted'] = None
+        priv_attrs['_thread_terminate_event'] = None
+        priv_attrs['_async_future'] = None
+        priv_attrs['_async_task'] = None
+        priv_attrs['_remote'] = None
+        priv_attrs['_instances'] = None
+        priv_attrs['_logger_adapter'] = None
+        priv_attrs['_logger_handlers'] = None
+        priv_attrs['_period'] = None
 
         # We also get rid of the conditions as if there is a task
         # containing an attr that cannot be pickled (like FuncTask
@@ -963,7 +1566,7 @@ class Task(RedBase, BaseModel):
     def delete(self):
         """Delete the task from the session. 
         Overried if needed additional cleaning."""
-        self.session.tasks.remove(self)
+        self.session.remove_task(self)
 
     def _get_hooks(self, name:str):
         return getattr(self.session.hooks, name)
@@ -976,6 +1579,13 @@ class Task(RedBase, BaseModel):
         Note that this should not be considered as absolute truth but
         as a best estimate.
         """
+        period = self._period
+        if period is None:
+            period = self._period = self._get_period()
+        return period
+
+    def _get_period(self) -> TimePeriod:
+        "Determine the time period from the start_cond"
         from redengine.core.time import StaticInterval, All as AllTime
         from redengine.conditions import TaskFinished, TaskSucceeded
 
@@ -998,12 +1608,25 @@ class Task(RedBase, BaseModel):
         return StaticInterval()
 
     @property
-    def lock(self):
+    def lock(self) -> threading.Lock:
         # Lock is private in a sense that we want to hide it from 
         # the model (if put to dict etc.) but public in a sense
         # that the user should be allowed to interact with it
+        if self._lock is None:
+            with _CREATE_LOCK:
+                if self._lock is None:
+                    self._lock = threading.Lock()
         return self._lock
 
+    @property
+    def _thread_terminate(self) -> threading.Event:
+        # Event to signal a thread/async task to terminate
+        if self._thread_terminate_event is None:
+            with _CREATE_LOCK:
+                if self._thread_terminate_event is None:
+                    self._thread_terminate_event = threading.Event()
+        return self._thread_terminate_event
+
     def json(self, **kwargs):
         if 'exclude' not in kwargs:
             kwargs['exclude'] = set()
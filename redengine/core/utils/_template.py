@@ -0,0 +1,13 @@
+"""Setup of the template process of process tasks.
+
+This module is imported (as the last preloaded module)
+by the forkserver. The objects created by the preloaded
+modules are moved to the permanent generation of the
+garbage collector so that the forked task processes do
+not write (and thus copy) their memory pages when
+collecting garbage."""
+
+import gc
+
+gc.collect()
+gc.freeze()
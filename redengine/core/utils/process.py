@@ -1,4 +1,24 @@
+import multiprocessing
 from multiprocessing import current_process
+from typing import List, Optional
 
 def is_main_subprocess():
-    return current_process().name == 'MainProcess'
\ No newline at end of file
+    return current_process().name == 'MainProcess'
+
+def get_process_context(method:Optional[str]=None, preload:Optional[List[str]]=None):
+    """Get the multiprocessing context process tasks
+    are launched with.
+
+    If the start method is ``forkserver``, the server
+    process works as a template: it imports Red Engine
+    and the modules in ``preload``, freezes the garbage
+    collector and forks the task processes on request.
+    Note that the modules are preloaded only if the
+    server is not yet running."""
+    ctx = multiprocessing.get_context(method)
+    if ctx.get_start_method() == "forkserver":
+        # The template module must be the last one: it freezes
+        # the objects created by the modules imported before it
+        modules = ["redengine", *(preload or ()), "redengine.core.utils._template"]
+        ctx.set_forkserver_preload(modules)
+    return ctx
@@ -15,4 +15,17 @@ class TaskTerminationException(Exception):
     This should only be raised by threaded
     tasks to signal that they did indeed
     listen the thread_please_terminate event
-    and ended as a result of that"""
\ No newline at end of file
+    and ended as a result of that"""
+
+
+class MapTaskException(Exception):
+    """Some of the chunks of a map task failed.
+    The exceptions of the failed chunks are in 
+    ``failures`` and the return values of the
+    succeeded chunks in ``results`` (by the 
+    index of the chunk)."""
+
+    def __init__(self, *args, failures:dict=None, results:dict=None):
+        super().__init__(*args)
+        self.failures = failures if failures is not None else {}
+        self.results = results if results is not None else {}
@@ -31,6 +31,7 @@ class LogRecord(MinimalRecord):
     processName: str
     process: int
     message: str
+    run_id: Optional[str] = Field(description="Identifier of the run of the task")
 
     formatted_message: str = Field(description="Formatted message. This field is created by RepoHandler.")
 
@@ -40,5 +41,7 @@ class TaskLogRecord(MinimalRecord):
     end: Optional[datetime.datetime]
     runtime: Optional[datetime.timedelta]
 
+    run_id: Optional[str]
+
     message: str
     exc_text: Optional[str]
\ No newline at end of file
@@ -7,6 +7,7 @@ about the scehuler/task/parameters etc.
 
 import datetime
 import logging
+import multiprocessing
 from multiprocessing import cpu_count
 from pathlib import Path
 import warnings
@@ -21,6 +22,8 @@ from redbird.logging import RepoHandler
 from redengine._base import RedBase
 
 if TYPE_CHECKING:
+    from redengine.core.events import EventBus
+    from redengine.utils.dependencies import DependencyGraph
     from redengine.core.log import TaskAdapter
     from redengine.parse import StaticParser
     from redengine.core import (
@@ -52,7 +55,20 @@ class Config(BaseModel):
     debug: bool = False
 
     max_process_count = cpu_count()
+    n_shards: Optional[int] = None # Number of scheduler processes the tasks are partitioned to (None: one scheduler)
+    coordinator: Optional[Any] = None # Coordination backend shared with other schedulers (see redengine.coordination)
+    worker_server: Optional[Any] = None # Server the remote workers connect to (see redengine.worker)
+    thread_host: bool = False # Run thread tasks in a separate process so that they do not hold the GIL of the scheduler
+    trigger_dependents: bool = True # Check the dependents of a finished task immediately instead of the next cycle
+    status_table: Optional[Any] = None # Table of the task statuses in shared memory (see redengine.core.status)
+    thread_pool_size: Optional[int] = None # Number of workers running thread tasks (None: a new thread per run)
+    execution_limits: Dict[str, int] = {} # Maximum number of running tasks per execution type
+    resource_limits: Dict[str, int] = {} # Amounts of named resources available for the tasks
+    ready_queue_aging: float = 0.01 # Priority gained per second waiting in the ready queue
     tasks_as_daemon: bool = True
+    process_start_method: Optional[str] = None # Multiprocessing start method of process tasks (None: default)
+    preload_modules: List[str] = [] # Modules imported to the template process (if forkserver)
+    prespawn_lead: Optional[datetime.timedelta] = None # How long before the predicted start process tasks are prespawned
     restarting: str = 'replace'
     instant_shutdown: bool = False
 
@@ -67,7 +83,13 @@ class Config(BaseModel):
             return AlwaysFalse()
         return parse_condition(value)
 
-    @validator('timeout')
+    @validator('process_start_method')
+    def parse_process_start_method(cls, value):
+        if value is not None and value not in multiprocessing.get_all_start_methods():
+            raise ValueError(f"Invalid start method: {value}")
+        return value
+
+    @validator('timeout', 'prespawn_lead', pre=True)
     def parse_timeout(cls, value):
         if isinstance(value, str):
             return pd.Timedelta(value).to_pytimedelta()
@@ -118,6 +140,11 @@ class Session(RedBase):
         of different object and classes in the session.
     scheduler : Scheduler
         Scheduler of the session.
+    events : redengine.core.events.EventBus
+        Bus of the task status changes and the
+        scheduler events.
+    graph : redengine.utils.dependencies.DependencyGraph
+        Index of the dependencies between the tasks.
     delete_existing_loggers : bool
         If True, all loggers that match the 
         session.config.basename are deleted (by 
@@ -131,11 +158,14 @@ class Session(RedBase):
 
     tasks: Set['Task']
     hooks: Hooks
+    events: 'EventBus'
+    graph: 'DependencyGraph'
     parameters: 'Parameters'
     _scheduler: 'Scheduler'
 
     _time_parsers: ClassVar[Dict] = {}
     _cls_cond_parsers: ClassVar[Dict] = {} # Default condition parsers
+    _max_parsed_conds: ClassVar[int] = 1024 # Max number of cached condition strings
 
     def _get_parameters(self, value):
         from redengine.core import Parameters
@@ -157,35 +187,47 @@ class Session(RedBase):
 
     def __init__(self, config=None, parameters=None, delete_existing_loggers=False):
         from redengine.core import Scheduler
+        from redengine.core.events import EventBus
+        from redengine.utils.dependencies import DependencyGraph
         self.config = self._get_config(config)
+        self.graph = DependencyGraph(self)
         self.parameters = self._get_parameters(parameters)
         self.scheduler = Scheduler(self)
         self.tasks = set()
         self.hooks = Hooks()
+        self.events = EventBus()
         self.returns = self._get_parameters(None)
         self._cond_parsers = self._cls_cond_parsers.copy()
         self._cond_cache: Dict = {} # Cached by CondParser to speed up expensive conditions
+        self._parsed_conds: Dict[str, BaseCondition] = {} # Parsed condition strings of tasks
         self._cond_states = {} # Used by FuncConds to relay condiiton states to conditions
         if delete_existing_loggers:
             self.delete_task_loggers()
 
+    @property
+    def tasks(self) -> Set['Task']:
+        "Tasks of the session"
+        return self._tasks
+
+    @tasks.setter
+    def tasks(self, tasks:Set['Task']):
+        self._tasks = tasks
+        # Index of the tasks by name for constant time lookups
+        self._task_names = {task.name: task for task in tasks}
+        self.graph.rebuild()
+
     def __getitem__(self, task:Union['Task', str]):
         "Get a task from the session"
         task_name = task.name if not isinstance(task, str) else task
-        for task in self.tasks:
-            if task.name == task_name:
-                return task
-        else:
+        try:
+            return self._task_names[task_name]
+        except KeyError:
             raise KeyError(f"Task '{task_name}' not found")
 
     def __contains__(self, task: Union['Task', str]):
         "Check if task is in session"
-        try:
-            self[task]
-        except KeyError:
-            return False
-        else:
-            return True
+        task_name = task.name if not isinstance(task, str) else task
+        return task_name in self._task_names
 
     def start(self):
         """Start the scheduling session.
@@ -193,7 +235,11 @@ class Session(RedBase):
         Will block and wait till the scheduler finishes 
         if there is a shut condition."""
         self._check_readable_logger()
-        self.scheduler()
+        if self.config.n_shards:
+            from redengine.core.shard import ShardedScheduler
+            ShardedScheduler(session=self)()
+        else:
+            self.scheduler()
 
     def run(self, *task_names:Tuple[str], execution=None, obey_cond=False):
         """Run specific task(s) manually.
@@ -225,12 +271,13 @@ class Session(RedBase):
         from redengine.conditions.scheduler import SchedulerCycles
 
         orig_vals = {}
+        orig_force_run = {}
         for task in self.tasks:
             name = task.name
-            orig_vals[name] = {
-                attr: val for attr, val in task.__dict__.items()
-                if attr not in ("status", "last_run", "last_success", "last_fail", "last_terminate")
-            }
+            # Runtime state (status, last_run etc.) is not 
+            # in __dict__ thus it is not reverted
+            orig_vals[name] = task.__dict__.copy()
+            orig_force_run[name] = task.force_run
             if name in task_names:
                 if not obey_cond:
                     task.force_run = True
@@ -248,6 +295,7 @@ class Session(RedBase):
             # Set back the disabled, execution etc.
             for task in self.tasks:
                 task.__dict__.update(orig_vals[task.name])
+                task.force_run = orig_force_run[task.name]
 
     def restart(self):
         """Restart the scheduler
@@ -306,6 +354,24 @@ class Session(RedBase):
         "Used by the actual string condition parser"
         return self._cond_parsers
 
+    def _parse_condition(self, s:str) -> 'BaseCondition':
+        """Parse a condition string of a task.
+        
+        The parsed conditions are cached and shared 
+        thus the tasks should copy them (see 
+        redengine.core.condition.copy_condition)."""
+        from redengine.parse.condition import parse_condition
+        try:
+            return self._parsed_conds[s]
+        except KeyError:
+            pass
+        cond = parse_condition(s, session=self)
+        if len(self._parsed_conds) >= self._max_parsed_conds:
+            # Remove the oldest
+            del self._parsed_conds[next(iter(self._parsed_conds))]
+        self._parsed_conds[s] = cond
+        return cond
+
     def add_task(self, task: 'Task'):
         "Add the task to the session"
         if_exists = self.config.task_pre_exist
@@ -314,20 +380,31 @@ class Session(RedBase):
             if if_exists == 'ignore':
                 return
             elif if_exists == 'replace':
-                self.tasks.remove(task)
-                self.tasks.add(task)
+                self.remove_task(self[task])
             elif if_exists == 'raise':
                 raise KeyError(f"Task '{task.name}' already exists")
-        else:
-            self.tasks.add(task)
+        self._tasks.add(task)
+        self._task_names[task.name] = task
+        self.graph.update_task(task)
+
+    def remove_task(self, task: Union['Task', str]):
+        "Remove the task from the session"
+        if isinstance(task, str):
+            task = self[task]
+        self._tasks.remove(task)
+        if self._task_names.get(task.name) is task:
+            del self._task_names[task.name]
+            self.graph.remove_task(task.name)
+
+    def _rename_task(self, task: 'Task', old_name:str):
+        "Update the name of a task in the session"
+        if self._task_names.get(old_name) is task:
+            del self._task_names[old_name]
+            self._task_names[task.name] = task
+            self.graph.rename_task(old_name, task)
 
     def task_exists(self, task: 'Task'):
-        task_name = task.name if not isinstance(task, str) else task
-        for task in self.tasks:
-            if task.name == task_name:
-                return True
-        else:
-            return False
+        return task in self
 
     def get_repo(self):
         "Get log repo where the task logs are stored"
@@ -406,8 +483,10 @@ class Session(RedBase):
         # NOTE: When a process task is executed, it will pickle
         # the task.session. Therefore removing unpicklable here.
         state = self.__dict__.copy()
-        state["tasks"] = set()
+        state["_tasks"] = set()
+        state["_task_names"] = {}
         state["_cond_cache"] = None
+        state["_parsed_conds"] = None
         state["_cond_parsers"] = None
         state["session"] = None
         #state["parameters"] = None
@@ -1,6 +1,17 @@
+from functools import lru_cache
+
+from pydantic import validator
 
 from redengine.core import Task
 
+@lru_cache(maxsize=1024)
+def compile_code(code:str):
+    """Compile a piece of code to a code object.
+
+    The code objects are cached by the source thus
+    the same code is compiled only once (per process)."""
+    return compile(code, "<string>", "exec")
+
 class CodeTask(Task):
     """Task to run a piece of Python code
 
@@ -17,6 +28,12 @@ class CodeTask(Task):
     **kwargs : dict
         See :class:`redengine.core.Task`
 
+    Notes
+    -----
+        The code is compiled when the task is created 
+        (raises an error if the code is invalid) and the
+        compiled code is reused in the consecutive runs.
+
     Warnings
     --------
         Note that it is potentially dangerous if you let the user
@@ -48,10 +65,18 @@ class CodeTask(Task):
     output_variable: str = 'return_value'
     code: str
 
+    @validator('code')
+    def validate_code(cls, value):
+        try:
+            compile_code(value)
+        except SyntaxError as exc:
+            raise ValueError(f"Invalid code: {exc}") from exc
+        return value
+
     def execute(self, **params):
         loc = params
         glob = {}
-        exec(self.code, glob, loc)
+        exec(compile_code(self.code), glob, loc)
         return loc.get(self.output_variable, None)
 
     def get_default_name(self, **kwargs):
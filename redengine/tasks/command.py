@@ -1,12 +1,21 @@
 
+import asyncio
+import logging
+import shlex
 import subprocess
-from typing import List, Literal, Optional, Union
+import sys
+from collections import deque
+from logging.handlers import RotatingFileHandler
+from typing import Deque, List, Literal, Optional, Union
 
 from pydantic import Field, validator
 
 from redengine.core.parameters.parameters import Parameters
 from redengine.core.task import Task
 
+# Maximum length (bytes) of a line of streamed output
+MAX_LINE_LENGTH = 65536
+
 
 class CommandTask(Task):
     """Task that executes a command from 
@@ -22,6 +31,22 @@ class CommandTask(Task):
         If true, the command will be executed through the shell.
     kwds_popen : dict, optional
         Keyword arguments to be passed to subprocess.Popen
+    stream_output : bool, optional
+        If true, the output (stdout and stderr) of the command
+        is read line by line while the command runs and forwarded
+        to ``output_file`` or to the logger ``output_logger``.
+        Only the last ``output_tail`` lines are kept in memory
+        and returned. By default False.
+    output_file : str, optional
+        Path to the file where the streamed output is written.
+        The file is rotated when it exceeds ``output_file_max_bytes``.
+        If not given, the output is forwarded to ``output_logger``.
+    output_logger : str, optional
+        Name of the logger the streamed output lines are logged to,
+        by default 'redengine.command'.
+    output_tail : int, optional
+        Number of the last output lines kept as the return value 
+        when the output is streamed, by default 100.
     **kwargs : dict
         See :py:class:`redengine.core.Task`
 
@@ -34,6 +59,10 @@ class CommandTask(Task):
     Or list of commands:
 
     >>> task = CommandTask(["python", "-m", "pip", "install", "redengine"], name="my_cmd_task_2")
+
+    Stream the output of a long running command to a file:
+
+    >>> task = CommandTask("python myscript.py", stream_output=True, output_file="myscript.log", name="my_cmd_task_3")
     """
 
     command: Union[str, List[str]]
@@ -42,6 +71,13 @@ class CommandTask(Task):
     kwds_popen: dict = {}
     argform: Optional[Literal['-', '--', 'short', 'long']] = Field(description="Whether the arguments are turned as short or long form command line arguments")
 
+    stream_output: bool = False
+    output_file: Optional[str] = Field(description="File where the streamed output is written")
+    output_file_max_bytes: int = 10 * 1024 * 1024
+    output_file_backup_count: int = 3
+    output_logger: str = "redengine.command"
+    output_tail: int = 100
+
     def get_kwargs_popen(self) -> dict:
         kwargs = {
             "cwd": self.cwd, 
@@ -65,21 +101,15 @@ class CommandTask(Task):
 
     def execute(self, **parameters):
         """Run the command."""
-        command = self.command
-        
-        for param, val in parameters.items():
-            if not param.startswith("-"):
-                param = self.argform + param
+        command = self.get_command(parameters)
 
-            if isinstance(command, str):
-                command = command + f" {param} \"{val}\""
-            else:
-                command += [param] + [val]
+        if self.stream_output:
+            return asyncio.run(self._run_streaming(command))
 
         # https://stackoverflow.com/a/5469427/13696660
         pipe = subprocess.Popen(command, **self.get_kwargs_popen())
         try:
-            outs, errs = pipe.communicate(timeout=self.timeout)
+            outs, errs = pipe.communicate(timeout=self._get_timeout())
         except subprocess.TimeoutExpired:
             # https://docs.python.org/3.3/library/subprocess.html#subprocess.Popen.communicate
             pipe.kill()
@@ -93,6 +123,121 @@ class CommandTask(Task):
             raise OSError(f"Failed running command ({return_code}): \n{errs}")
         return outs
 
+    async def execute_async(self, **parameters):
+        """Run the command asynchronously.
+
+        The output is streamed similarly as with
+        ``stream_output=True``. Useful for supervising
+        multiple commands from one thread."""
+        command = self.get_command(parameters)
+        return await self._run_streaming(command)
+
+    def get_command(self, parameters:dict) -> Union[str, List[str]]:
+        "Get the command with the parameters as command line arguments"
+        command = self.command
+        
+        for param, val in parameters.items():
+            if not param.startswith("-"):
+                param = self.argform + param
+
+            if isinstance(command, str):
+                command = command + f" {param} \"{val}\""
+            else:
+                command = command + [param, val]
+        return command
+
+    async def _run_streaming(self, command:Union[str, List[str]]) -> str:
+        kwargs = self.get_kwargs_popen()
+        kwargs.update({
+            "stdin": subprocess.DEVNULL,
+            "stdout": subprocess.PIPE,
+            "stderr": subprocess.STDOUT,
+        })
+        if kwargs.pop("shell"):
+            if not isinstance(command, str):
+                command = subprocess.list2cmdline(command) if sys.platform == "win32" else " ".join(shlex.quote(arg) for arg in command)
+            proc = await asyncio.create_subprocess_shell(command, **kwargs)
+        else:
+            args = [command] if isinstance(command, str) else command
+            proc = await asyncio.create_subprocess_exec(*args, **kwargs)
+
+        tail = deque(maxlen=self.output_tail)
+        handler = self._get_output_handler()
+        async def communicate():
+            await self._read_output(proc.stdout, tail, handler)
+            return await proc.wait()
+
+        try:
+            # The process may close its output and keep running
+            # thus the reading and the waiting share the deadline
+            return_code = await asyncio.wait_for(communicate(), timeout=self._get_timeout())
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise subprocess.TimeoutExpired(command, self._get_timeout(), output="\n".join(tail))
+        except BaseException:
+            # Cancelled or failed reading the output
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+            raise
+        finally:
+            if handler is not None:
+                handler.close()
+
+        output = "\n".join(tail)
+        if return_code != 0:
+            raise OSError(f"Failed running command ({return_code}): \n{output}")
+        return output
+
+    async def _read_output(self, stream:asyncio.StreamReader, tail:Deque[str], handler:Optional[logging.Handler]):
+        """Read the output in chunks and forward it line by line.
+        Lines longer than ``MAX_LINE_LENGTH`` bytes are forwarded
+        in parts so that the memory stays bounded."""
+        logger = logging.getLogger(self.output_logger)
+        buffer = bytearray()
+        while True:
+            chunk = await stream.read(MAX_LINE_LENGTH)
+            if not chunk:
+                break
+            start = 0
+            while True:
+                end = chunk.find(b"\n", start)
+                if end == -1:
+                    break
+                buffer += chunk[start:end]
+                self._forward_line(bytes(buffer), tail, logger, handler)
+                buffer.clear()
+                start = end + 1
+            buffer += chunk[start:]
+            while len(buffer) >= MAX_LINE_LENGTH:
+                self._forward_line(bytes(buffer[:MAX_LINE_LENGTH]), tail, logger, handler)
+                del buffer[:MAX_LINE_LENGTH]
+        if buffer:
+            self._forward_line(bytes(buffer), tail, logger, handler)
+
+    def _forward_line(self, line:bytes, tail:Deque[str], logger:logging.Logger, handler:Optional[logging.Handler]):
+        line = line.decode("utf-8", errors="ignore").rstrip("\r")
+        tail.append(line)
+        if handler is not None:
+            record = logging.LogRecord(self.output_logger, logging.INFO, __file__, 0, line, None, None)
+            handler.handle(record)
+        else:
+            logger.info(line, extra={"task_name": self.name})
+
+    def _get_output_handler(self) -> Optional[logging.Handler]:
+        if self.output_file is None:
+            return None
+        return RotatingFileHandler(
+            self.output_file, 
+            maxBytes=self.output_file_max_bytes, 
+            backupCount=self.output_file_backup_count,
+            encoding="utf-8",
+        )
+
+    def _get_timeout(self) -> Optional[float]:
+        return self.timeout.total_seconds() if self.timeout is not None else None
+
     def postfilter_params(self, params: Parameters):
         # Only allows the task specific parameters
         # for simplicity
@@ -1,10 +1,14 @@
 
 from os import stat_result
+import os
 import sys
+import asyncio
 import inspect
 import importlib
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 import warnings
 
 from pydantic import Field, validator
@@ -34,6 +38,92 @@ def get_module(path, pkg_path=None):
         raise ImportError(f"Importing the file '{path}' failed.") from exc
     return task_module
 
+class ModuleCache:
+    """Cache of modules imported from paths.
+
+    The modules are cached by their absolute path and 
+    they are re-imported only if the file was modified
+    (its modification time or size changed). The cache
+    is shared by all tasks pointing to the same file.
+    """
+
+    def __init__(self):
+        self._modules: Dict[Path, Tuple[Tuple[int, int], object]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_key(path) -> Path:
+        return Path(path).absolute()
+
+    @staticmethod
+    def get_version(path) -> Optional[Tuple[int, int]]:
+        """Get the version of the file (None if it cannot
+        be read). Take it before importing the module so 
+        that a write during the import is not missed."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def get(self, path):
+        "Get cached module of the path or None if missing or outdated"
+        key = self._get_key(path)
+        with self._lock:
+            cached = self._modules.get(key)
+        if cached is None:
+            return None
+        version, module = cached
+        if version is None or self.get_version(key) != version:
+            self.invalidate(key)
+            return None
+        return module
+
+    def set(self, path, module, version:Optional[Tuple[int, int]]):
+        "Cache the module of the path imported from the version of the file"
+        key = self._get_key(path)
+        with self._lock:
+            self._modules[key] = (version, module)
+
+    def invalidate(self, path=None):
+        """Remove the module of the path from the cache
+        so that it is imported again when needed. If
+        path is not given, the whole cache is cleared."""
+        with self._lock:
+            if path is None:
+                self._modules.clear()
+            else:
+                self._modules.pop(self._get_key(path), None)
+
+_module_cache = ModuleCache()
+
+def clear_module_cache(path=None):
+    """Clear cached modules of path based FuncTasks.
+
+    Parameters
+    ----------
+    path : path-like, optional
+        Path of the file which module is cleared.
+        If not given, all cached modules are cleared.
+    """
+    _module_cache.invalidate(path)
+
+@lru_cache(maxsize=1024)
+def _get_cached_signature(func) -> inspect.Signature:
+    return inspect.signature(func)
+
+def get_signature(func) -> inspect.Signature:
+    """Get signature of a function.
+    
+    The signatures are cached by the function
+    thus a changed function (ie. reimported)
+    is inspected again."""
+    try:
+        return _get_cached_signature(func)
+    except TypeError:
+        # Not hashable
+        return inspect.signature(func)
+
 def to_import_path(src:stat_result):
     imp = '.'.join(Path(src).with_suffix("").parts)
     return imp
@@ -75,6 +165,13 @@ class FuncTask(Task):
     sys_path : list of paths
         Paths that are appended to ``sys.path`` when the function
         is imported.
+    cache : bool
+        If True, the imported function is stored to the task 
+        and the file is not inspected again. If False, the 
+        function is got from the module of the file on each run.
+        The modules are cached by the file path and reimported
+        only if the file has changed (see ``clear_module_cache``).
+        By default False.
     **kwargs : dict
         See :py:class:`redengine.core.Task`
 
@@ -87,6 +184,14 @@ class FuncTask(Task):
     ...     ...
     >>> task = FuncTask(myfunc, name="my_func_task_1")
 
+    Coroutine functions are also supported. With 
+    ``execution='async'`` they are run concurrently 
+    on the event loop of the scheduler:
+
+    >>> async def my_coro():
+    ...     ...
+    >>> task = FuncTask(my_coro, name="my_func_task_async", execution="async")
+
     **Via decorator:**
 
     >>> from redengine.tasks import FuncTask
@@ -210,24 +315,47 @@ class FuncTask(Task):
 
     def _set_descr(self):
         "Set description from func doc if desc missing"
-        if self.description is None and hasattr(self.func, "__doc__"):
+        if self.description is None and getattr(self.func, "__doc__", None) is not None:
             self.description = self.func.__doc__
 
     def execute(self, **params):
         "Run the actual, given, task"
         func = self.get_func(cache=self.cache)
+        if inspect.iscoroutinefunction(func):
+            return asyncio.run(func(**params))
         output = func(**params)
         return output
 
+    async def execute_async(self, **params):
+        "Run the actual, given, task on the event loop"
+        func = self.get_func(cache=self.cache)
+        if inspect.iscoroutinefunction(func):
+            return await func(**params)
+        # Not a coroutine function, run in a thread
+        return await super().execute_async(**params)
+
+    def prepare_process(self):
+        "Import the function in advance"
+        try:
+            self.get_func(cache=self.cache)
+        except Exception:
+            # The error is logged when the task is run
+            pass
+
     def get_func(self, cache=True):
         if self.func is None:
-            # Add dir of self.path to sys.path so importing from that dir works
-            pkg_path = find_package_root(self.path)
-            root = str(Path(self.path).parent.absolute()) if not pkg_path else str(pkg_path)
-
-            # _task_func is cached to faster performance
-            with TempSysPath([root] + self.sys_paths):
-                task_module = get_module(self.path, pkg_path=pkg_path)
+            # The module is imported only if the file
+            # has changed since it was last imported
+            task_module = _module_cache.get(self.path)
+            if task_module is None:
+                # Add dir of self.path to sys.path so importing from that dir works
+                pkg_path = find_package_root(self.path)
+                root = str(Path(self.path).parent.absolute()) if not pkg_path else str(pkg_path)
+
+                version = _module_cache.get_version(self.path)
+                with TempSysPath([root] + self.sys_paths):
+                    task_module = get_module(self.path, pkg_path=pkg_path)
+                _module_cache.set(self.path, task_module, version)
             task_func = getattr(task_module, self.func_name)
 
             if cache:
@@ -251,13 +379,6 @@ class FuncTask(Task):
         else:
             return f'{module_name}:{func_name}'
 
-    def process_finish(self, *args, **kwargs):
-        if self.is_delayed():
-            # Deleting the _func so it is refreshed
-            # next time the task is run.
-            self._func = None
-        super().process_finish(*args, **kwargs)
-
     def is_delayed(self):
         return self.func is None
         
@@ -267,7 +388,7 @@ class FuncTask(Task):
         # Get params from the typehints
         cache = False if self.path is not None else True
         func = self.get_func(cache=cache)
-        func_params = inspect.signature(func).parameters
+        func_params = get_signature(func).parameters
         for name, param in func_params.items():
             default = param.default
             if isinstance(default, BaseArgument):
@@ -300,8 +421,8 @@ class FuncTask(Task):
 
     @property
     def pos_args(self):
-        func = self.get_func()
-        sig = inspect.signature(func)
+        func = self.get_func(cache=self.cache)
+        sig = get_signature(func)
         pos_args = [
             val.name
             for name, val in sig.parameters.items()
@@ -314,8 +435,8 @@ class FuncTask(Task):
 
     @property
     def kw_args(self):
-        func = self.get_func()
-        sig = inspect.signature(func)
+        func = self.get_func(cache=self.cache)
+        sig = get_signature(func)
         kw_args = [
             val.name
             for name, val in sig.parameters.items()
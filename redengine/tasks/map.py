@@ -0,0 +1,168 @@
+import concurrent.futures
+import itertools
+import logging
+import time
+from typing import Callable, Iterable, Iterator, Literal, Optional
+
+from pydantic import Field
+
+from redengine.core.log import current_run_id
+from redengine.core.utils import get_process_context
+from redengine.exc import MapTaskException, TaskTerminationException
+from .func import FuncTask
+
+def _iter_chunks(items:Iterable, size:int) -> Iterator[list]:
+    "Split the items to chunks lazily"
+    items = iter(items)
+    while True:
+        chunk = list(itertools.islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+def _run_chunk(func:Callable, arg:str, chunk:list, kwargs:dict) -> list:
+    "Run the function for each item in the chunk (in a worker)"
+    return [func(**{arg: item}, **kwargs) for item in chunk]
+
+class MapTask(FuncTask):
+    """Task that executes a function over the items
+    of an iterable in parallel.
+
+    The value of the parameter ``map_arg`` of the
+    function (ie. set with ``Return`` or ``FuncArg``)
+    is split to chunks of ``chunk_size`` items and the
+    chunks are executed in parallel on a pool of
+    processes (or threads). At most ``max_in_flight``
+    chunks are submitted to the pool at a time thus
+    the items are consumed as the chunks finish.
+
+    The task succeeds if all the chunks succeed and it
+    returns the return values of the function in the
+    order of the items. If any of the chunks fail, the
+    task fails with ``MapTaskException`` after the rest
+    of the chunks have finished. The progress of the
+    chunks is logged to the logger ``progress_logger``.
+
+    Parameters
+    ----------
+    map_arg : str
+        Name of the parameter of the function which
+        value is iterated. The function is called with
+        each item as this parameter.
+    chunk_size : int, optional
+        Number of items run in one job of the pool,
+        by default 1.
+    max_in_flight : int, optional
+        Maximum number of chunks submitted to the pool
+        at the same time and the number of workers of
+        the pool. By default ``max_process_count`` of
+        the session configuration.
+    map_execution : str, {'process', 'thread'}
+        Whether the chunks are run on a pool of processes
+        or threads, by default 'process'.
+    progress_logger : str, optional
+        Name of the logger the progress of the chunks
+        is logged to, by default 'redengine.map'.
+    **kwargs : dict
+        See :py:class:`redengine.tasks.FuncTask`
+
+    Examples
+    --------
+
+    >>> from redengine.args import Return
+    >>> from redengine.tasks import MapTask
+    >>> def process_file(file, mode):
+    ...     ...
+    >>> task = MapTask(
+    ...     process_file, map_arg="file", chunk_size=10,
+    ...     parameters={"file": Return("list_files"), "mode": "fast"},
+    ...     name="process_files"
+    ... )
+
+    Warnings
+    --------
+
+    If ``map_execution='process'``, the function, the items
+    and the other parameters must be picklable. The task
+    itself runs as a thread by default as it only feeds
+    the pool.
+    """
+    execution: Optional[Literal['main', 'thread', 'process', 'async']] = "thread"
+    map_arg: str = Field(description="Parameter of the function which value is iterated")
+    chunk_size: int = Field(default=1, ge=1)
+    max_in_flight: Optional[int] = Field(default=None, ge=1)
+    map_execution: Literal['process', 'thread'] = "process"
+    progress_logger: str = "redengine.map"
+
+    def execute(self, **params):
+        "Run the function over the items in chunks"
+        if self.map_arg not in params:
+            raise KeyError(f"Parameter '{self.map_arg}' to map over is missing")
+        items = params.pop(self.map_arg)
+        func = self.get_func(cache=self.cache)
+        chunks = enumerate(_iter_chunks(items, self.chunk_size))
+        window = self.max_in_flight or self.session.config.max_process_count
+        terminate = self._thread_terminate
+        logger = logging.getLogger(self.progress_logger)
+        log_extra = {"task_name": self.name, "run_id": current_run_id.get()}
+
+        results = {}
+        failures = {}
+        futures = {}
+        n_items = 0
+        is_exhausted = False
+        start = time.monotonic()
+        with self._get_pool(window) as pool:
+            try:
+                while True:
+                    # Keep the window full
+                    while not is_exhausted and len(futures) < window:
+                        chunk_id, chunk = next(chunks, (None, None))
+                        if chunk is None:
+                            is_exhausted = True
+                            break
+                        future = pool.submit(_run_chunk, func, self.map_arg, chunk, params)
+                        futures[future] = (chunk_id, len(chunk))
+                    if not futures:
+                        break
+
+                    done, _ = concurrent.futures.wait(futures, timeout=0.1, return_when=concurrent.futures.FIRST_COMPLETED)
+                    if terminate.is_set():
+                        raise TaskTerminationException()
+                    for future in done:
+                        chunk_id, size = futures.pop(future)
+                        n_items += size
+                        exc = future.exception()
+                        if exc is None:
+                            results[chunk_id] = future.result()
+                        else:
+                            failures[chunk_id] = exc
+                            logger.warning(f"Task '{self.name}' chunk {chunk_id} failed: {exc!r}", extra=log_extra)
+                        logger.info(
+                            f"Task '{self.name}' progress: {len(results) + len(failures)} chunks ({n_items} items) finished, "
+                            f"{len(failures)} failed, {len(futures)} running",
+                            extra=log_extra
+                        )
+            except BaseException:
+                # Failed consuming the items or terminated,
+                # waiting only the chunks already running
+                # (no cancel_futures before Python 3.9)
+                for future in futures:
+                    future.cancel()
+                pool.shutdown(wait=False)
+                raise
+
+        logger.info(f"Task '{self.name}' finished {len(results) + len(failures)} chunks in {time.monotonic() - start:.3f} seconds", extra=log_extra)
+        if failures:
+            first = failures[min(failures)]
+            raise MapTaskException(
+                f"{len(failures)} of {len(results) + len(failures)} chunks failed",
+                failures=failures, results=results
+            ) from first
+        return [output for chunk_id in sorted(results) for output in results[chunk_id]]
+
+    def _get_pool(self, n_workers:int) -> concurrent.futures.Executor:
+        if self.map_execution == "thread":
+            return concurrent.futures.ThreadPoolExecutor(max_workers=n_workers, thread_name_prefix="redengine-map")
+        ctx = get_process_context(self.session.config.process_start_method, self.session.config.preload_modules)
+        return concurrent.futures.ProcessPoolExecutor(max_workers=n_workers, mp_context=ctx)
@@ -1,4 +1,7 @@
 
+import logging
+import time
+
 import pytest
 
 from redengine.conditions import (
@@ -13,6 +16,7 @@ from redengine.conditions import (
     TaskTerminated,
 )
 from redengine.core.task import Task
+from redengine.log import MinimalRecord
 from redengine.tasks import FuncTask
 
 
@@ -126,7 +130,9 @@ def test_task_status(tmpdir, session, cls, succeeding, expected):
             id="DependFailure"),
     ],
 )
-def test_task_depend_fail(tmpdir, session, cls, expected):
+@pytest.mark.parametrize("from_logs", [True, False])
+def test_task_depend_fail(tmpdir, session, cls, expected, from_logs):
+    session.config.force_status_from_logs = from_logs
     # Going to tempdir to dump the log files there
     with tmpdir.as_cwd() as old_dir:
         condition = cls(task="runned task", depend_task="prerequisite task")
@@ -192,7 +198,9 @@ def test_task_depend_fail(tmpdir, session, cls, expected):
             id="DependFailure"),
     ],
 )
-def test_task_depend_success(tmpdir, session, cls, expected):
+@pytest.mark.parametrize("from_logs", [True, False])
+def test_task_depend_success(tmpdir, session, cls, expected, from_logs):
+    session.config.force_status_from_logs = from_logs
     # Going to tempdir to dump the log files there
     with tmpdir.as_cwd() as old_dir:
         condition = cls(task="runned task", depend_task="prerequisite task")
@@ -255,4 +263,23 @@ def test_display(cls, string):
     task = FuncTask(func=lambda: None, name="mytask")
     depend_task = FuncTask(func=lambda: None, name="mydep")
     s = str(cls(task=task, depend_task=depend_task))
-    assert s == string
\ No newline at end of file
+    assert s == string
+
+
+@pytest.mark.parametrize("from_logs", [True, False])
+def test_task_depend_existing_logs(session, from_logs):
+    "The records logged before the tasks were created (ie. restarted)"
+    session.config.force_status_from_logs = from_logs
+    repo = logging.getLogger(session.config.task_logger_basename).handlers[0].repo
+    now = time.time()
+    repo.add(MinimalRecord(task_name="runned task", action="run", created=now - 30))
+    repo.add(MinimalRecord(task_name="prerequisite task", action="run", created=now - 20))
+    repo.add(MinimalRecord(task_name="prerequisite task", action="success", created=now - 10))
+
+    condition = DependSuccess(task="runned task", depend_task="prerequisite task")
+    FuncTask(run_task, name="prerequisite task", execution="main")
+    task = FuncTask(run_task, name="runned task", execution="main")
+    assert bool(condition)
+
+    task()
+    assert not bool(condition)
@@ -217,3 +217,46 @@ def test_executable(tmpdir, mock_datetime_now, logs, time_after, get_condition,
             assert bool(condition) 
         else:
             assert not bool(condition)
+
+@pytest.mark.parametrize(
+    "get_condition,logs,dt,expected",
+    [
+        pytest.param(
+            lambda:TaskExecutable(task="the task", period=TimeOfDay("07:00", "08:00")), 
+            [("2020-01-01 07:20", "success")],
+            "2020-01-01 07:30",
+            "2020-01-02 07:00",
+            id="Already succeeded"),
+        pytest.param(
+            lambda:TaskExecutable(task="the task", period=TimeOfDay("07:00", "08:00")), 
+            [("2019-12-31 07:20", "success")],
+            "2020-01-01 07:30",
+            "2020-01-01 07:30",
+            id="Succeeded yesterday"),
+        pytest.param(
+            lambda:TaskExecutable(task="the task", period=TimeOfDay("07:00", "08:00")), 
+            [],
+            "2020-01-01 06:30",
+            "2020-01-01 07:00",
+            id="Before period"),
+        pytest.param(
+            lambda:TaskExecutable(task="the task", period=TimeDelta("1 hour")), 
+            [("2020-01-01 07:20", "fail")],
+            "2020-01-01 07:30",
+            "2020-01-01 08:20",
+            id="Every hour"),
+        pytest.param(
+            lambda:TaskExecutable(task="the task", period=TimeDelta("1 hour")), 
+            [],
+            "2020-01-01 07:30",
+            "2020-01-01 07:30",
+            id="Every hour (not run)"),
+    ],
+)
+def test_get_next(logs, dt, get_condition, expected, session):
+    task = FuncTask(lambda:None, name="the task", execution="main")
+    for log_time, log_action in logs:
+        setattr(task, f'last_{log_action}', pd.Timestamp(log_time).to_pydatetime())
+
+    condition = get_condition()
+    assert condition.get_next(pd.Timestamp(dt).to_pydatetime()) == pd.Timestamp(expected)
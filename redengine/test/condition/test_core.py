@@ -1,5 +1,6 @@
 
 import pytest
+import pandas as pd
 
 from redengine.conditions import (
     true, false, ParamExists, IsPeriod,
@@ -7,7 +8,7 @@ from redengine.conditions import (
 )
 from redengine.core.condition import Statement, Comparable, Historical
 
-from redengine.time import TimeDelta
+from redengine.time import TimeDelta, TimeOfDay
 
 def test_true():
     assert bool(true)
@@ -110,4 +111,17 @@ def test_fail(get_cond,exc):
 )
 def test_representation(obj, string, represent):
     assert str(obj) == string
-    assert repr(obj) == represent
\ No newline at end of file
+    assert repr(obj) == represent
+
+
+@pytest.mark.parametrize("cond,dt,expected",
+    [
+        pytest.param(IsPeriod(period=TimeOfDay("07:00", "08:00")), "2020-01-01 06:00", "2020-01-01 07:00", id="Before period"),
+        pytest.param(IsPeriod(period=TimeOfDay("07:00", "08:00")), "2020-01-01 07:30", "2020-01-01 07:30", id="In period"),
+        pytest.param(IsPeriod(period=TimeOfDay("07:00", "08:00")), "2020-01-01 09:00", "2020-01-02 07:00", id="After period"),
+        pytest.param(true, "2020-01-01 06:00", None, id="Not predictable"),
+    ]
+)
+def test_get_next(cond, dt, expected):
+    expected = pd.Timestamp(expected) if expected is not None else None
+    assert cond.get_next(pd.Timestamp(dt).to_pydatetime()) == expected
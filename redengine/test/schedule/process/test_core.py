@@ -1,5 +1,11 @@
 
+import gc
 import multiprocessing
+import os
+from pathlib import Path
+import sys
+
+import pytest
 
 import pandas as pd
 
@@ -11,6 +17,12 @@ from redengine.conditions import SchedulerStarted, TaskStarted, AlwaysTrue
 def run_succeeding():
     pass
 
+def run_in_template():
+    # Objects of the preloaded modules are frozen
+    # in the template process (forkserver)
+    assert gc.get_freeze_count() > 0
+    assert "xml.dom.minidom" in sys.modules
+
 def run_creating_child():
 
     proc = multiprocessing.Process(target=run_succeeding, daemon=True)
@@ -34,3 +46,44 @@ def test_creating_child(tmpdir, session):
         assert 1 == logger.filter_by(action="run").count()
         assert 1 == logger.filter_by(action="success").count()
         assert 0 == logger.filter_by(action="fail").count()
+
+@pytest.mark.skipif("forkserver" not in multiprocessing.get_all_start_methods(), reason="Forkserver not supported")
+def test_template(tmpdir, session, monkeypatch):
+    # The forkserver does not inherit sys.path thus
+    # Red Engine must be importable via environment
+    import redengine
+    monkeypatch.setenv("PYTHONPATH", str(Path(redengine.__file__).parent.parent), prepend=os.pathsep)
+    with tmpdir.as_cwd() as old_dir:
+        FuncTask(run_in_template, name="task_1", start_cond=AlwaysTrue())
+
+        session.config.process_start_method = "forkserver"
+        session.config.preload_modules = ["xml.dom.minidom"]
+        session.config.shut_cond = (TaskStarted(task="task_1") >= 1) | ~SchedulerStarted(period=TimeDelta("5 seconds"))
+
+        session.start()
+
+        logger = session.get_task("task_1").logger
+        assert 1 == logger.filter_by(action="run").count()
+        assert 1 == logger.filter_by(action="success").count()
+        assert 0 == logger.filter_by(action="fail").count()
+
+def test_invalid_start_method(session):
+    with pytest.raises(ValueError):
+        session.config.process_start_method = "not valid"
+
+def test_prespawn(tmpdir, session):
+    with tmpdir.as_cwd() as old_dir:
+        task = FuncTask(run_succeeding, name="task_1", start_cond="every 1 second")
+
+        prespawned = []
+        session.hooks.scheduler_cycle.append(lambda scheduler: prespawned.append(task.is_prespawned()))
+        session.config.prespawn_lead = "1 second"
+        session.config.shut_cond = (TaskStarted(task="task_1") >= 2) | ~SchedulerStarted(period=TimeDelta("5 seconds"))
+
+        session.start()
+
+        logger = session.get_task("task_1").logger
+        assert 2 == logger.filter_by(action="run").count()
+        assert 2 == logger.filter_by(action="success").count()
+        assert any(prespawned)
+        assert not task.is_prespawned()
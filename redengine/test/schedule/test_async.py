@@ -0,0 +1,59 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from redengine.conditions import TaskStarted, AlwaysTrue
+from redengine.conditions.scheduler import SchedulerCycles
+from redengine.tasks import FuncTask
+
+async def run_async_sleep(_task_):
+    await asyncio.sleep(0.5)
+    return threading.current_thread().name
+
+async def run_async_failing():
+    await asyncio.sleep(0.01)
+    raise RuntimeError("Oops")
+
+def test_concurrent(session):
+    tasks = [
+        FuncTask(run_async_sleep, name=f"task {i}", execution="async", force_run=True)
+        for i in range(200)
+    ]
+    n_threads = threading.active_count()
+    session.config.shut_cond = SchedulerCycles() >= 1
+    session.config.instant_shutdown = False
+
+    start = time.time()
+    session.start()
+    duration = time.time() - start
+
+    assert all(task.status == "success" for task in tasks)
+    # All coroutines ran concurrently in one thread
+    assert duration < 5
+    assert {session.returns[task] for task in tasks} == {"redengine-event-loop"}
+
+    # Event loop is closed
+    assert threading.active_count() == n_threads
+    assert session.scheduler._loop is None
+
+def test_fail(session):
+    task = FuncTask(run_async_failing, name="a task", execution="async", force_run=True)
+    session.config.shut_cond = SchedulerCycles() >= 1
+    session.start()
+
+    assert task.status == "fail"
+    records = list(map(lambda e: e.dict(exclude={'created'}), session.get_task_log()))
+    assert [
+        {"task_name": "a task", "action": "run"},
+        {"task_name": "a task", "action": "fail"},
+    ] == records
+
+@pytest.mark.parametrize("execution", ["main", "thread", "process"])
+def test_coroutine_without_async(session, execution):
+    task = FuncTask(run_async_sleep, name="a task", execution=execution, force_run=True)
+    session.config.shut_cond = SchedulerCycles() >= 1
+    session.start()
+
+    assert task.status == "success"
@@ -0,0 +1,104 @@
+import logging
+import multiprocessing
+import pickle
+import time
+
+import pytest
+from redbird.logging import RepoHandler
+from redbird.repos import CSVFileRepo
+
+from redengine import Session
+from redengine.conditions import AlwaysTrue, TaskStarted
+from redengine.conditions.scheduler import SchedulerCycles
+from redengine.coordination import SQLiteCoordinator
+from redengine.log import MinimalRecord
+from redengine.tasks import FuncTask
+
+def run_job(output, _task_):
+    with open(output, "a") as file:
+        file.write(f"{_task_.name} {_task_.session.config.coordinator.node_id}\n")
+    time.sleep(0.05)
+
+def run_node(db, logs, output, mode):
+    logging.getLogger("redengine.task").handlers = [
+        RepoHandler(repo=CSVFileRepo(filename=logs, model=MinimalRecord))
+    ]
+    session = Session(config={
+        "shut_cond": SchedulerCycles() >= 15,
+        "cycle_sleep": 0.02,
+        "coordinator": SQLiteCoordinator(db, mode=mode),
+    })
+    session.set_as_default()
+    for name in ("a", "b", "c", "d"):
+        FuncTask(
+            run_job, name=name, execution="main", parameters={"output": output}, session=session,
+            start_cond=AlwaysTrue() if mode == "leader" else ~TaskStarted()
+        )
+    session.start()
+
+def run_nodes(tmpdir, mode, n_nodes=3):
+    db = str(tmpdir / "coordination.db")
+    logs = str(tmpdir / "logs.csv")
+    output = str(tmpdir / "output.txt")
+    CSVFileRepo(filename=logs, model=MinimalRecord).create()
+
+    ctx = multiprocessing.get_context("fork")
+    nodes = [ctx.Process(target=run_node, args=(db, logs, output, mode)) for _ in range(n_nodes)]
+    for node in nodes:
+        node.start()
+    for node in nodes:
+        node.join(timeout=60)
+        assert node.exitcode == 0
+
+    with open(output) as file:
+        return [line.split() for line in file.read().splitlines()]
+
+def test_leases(tmpdir):
+    coord_1 = SQLiteCoordinator(tmpdir / "coordination.db", node_id="node 1", lease_duration=0.2)
+    coord_2 = SQLiteCoordinator(tmpdir / "coordination.db", node_id="node 2", lease_duration=0.2)
+
+    assert coord_1.acquire("task")
+    assert not coord_2.acquire("task")
+    assert coord_1.acquire("task") # renew
+    assert coord_2.get_owner("task") == "node 1"
+
+    coord_1.release("task")
+    assert coord_2.get_owner("task") is None
+    assert coord_2.acquire("task")
+
+    # Expires if not renewed
+    time.sleep(0.25)
+    assert coord_2.get_owner("task") is None
+    assert coord_1.acquire("task")
+
+    # Leader election
+    assert coord_1.is_leader()
+    assert not coord_2.is_leader()
+
+def test_pickle(tmpdir):
+    coord = SQLiteCoordinator(tmpdir / "coordination.db", node_id="node 1")
+    assert coord.acquire("task")
+
+    # Passed to spawned processes with the config
+    coord = pickle.loads(pickle.dumps(coord))
+    assert coord.node_id == "node 1"
+    assert coord.get_owner("task") == "node 1"
+
+def test_invalid_mode(tmpdir):
+    with pytest.raises(ValueError):
+        SQLiteCoordinator(tmpdir / "coordination.db", mode="not valid")
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="Fork not supported")
+def test_active_standby(tmpdir):
+    runs = run_nodes(tmpdir, mode="leader")
+
+    # Only the leader runs the tasks
+    assert len(runs) > 4
+    assert len({node for _, node in runs}) == 1
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="Fork not supported")
+def test_task_leases(tmpdir):
+    runs = run_nodes(tmpdir, mode="lease")
+
+    # Each task ran once in one of the nodes
+    assert sorted(task for task, _ in runs) == ["a", "b", "c", "d"]
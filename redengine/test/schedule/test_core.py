@@ -44,7 +44,7 @@ def run_creating_child():
     proc.start()
 
 
-@pytest.mark.parametrize("execution", ["main", "thread", "process"])
+@pytest.mark.parametrize("execution", ["main", "thread", "process", "async"])
 def test_task_execution(tmpdir, execution, session):
     with tmpdir.as_cwd() as old_dir:
         # To be confident the scheduler won't lie to us
@@ -63,7 +63,7 @@ def test_task_execution(tmpdir, execution, session):
     pytest.param(lambda: RepoHandler(repo=MemoryRepo(model=TaskLogRecord)), id="Memory with model"),
     pytest.param(lambda: RepoHandler(repo=MemoryRepo()), id="Memory with dict"),
 ])
-@pytest.mark.parametrize("execution", ["main", "thread", "process"])
+@pytest.mark.parametrize("execution", ["main", "thread", "process", "async"])
 @pytest.mark.parametrize(
     "task_func,run_count,fail_count,success_count,inact_count",
     [
@@ -146,7 +146,7 @@ def test_task_log(tmpdir, execution, task_func, run_count, fail_count, success_c
         assert inact_count == len(list(task.logger.get_records(action="inaction")))
 
 @pytest.mark.parametrize("mode", ["use logs", "use cache"])
-@pytest.mark.parametrize("execution", ["main", "thread", "process"])
+@pytest.mark.parametrize("execution", ["main", "thread", "process", "async"])
 def test_task_status(session, execution, mode):
     session.config.force_status_from_logs = True if mode == "use logs" else False
 
@@ -196,7 +196,7 @@ def test_task_status(session, execution, mode):
     assert task_not_run.status == None
 
 
-@pytest.mark.parametrize("execution", ["main", "thread", "process"])
+@pytest.mark.parametrize("execution", ["main", "thread", "process", "async"])
 def test_task_force_run(tmpdir, execution, session):
     with tmpdir.as_cwd() as old_dir:
         task = FuncTask(
@@ -217,7 +217,7 @@ def test_task_force_run(tmpdir, execution, session):
         assert not task.force_run
 
 
-@pytest.mark.parametrize("execution", ["main", "thread", "process"])
+@pytest.mark.parametrize("execution", ["main", "thread", "process", "async"])
 def test_task_disabled(tmpdir, execution, session):
     with tmpdir.as_cwd() as old_dir:
 
@@ -238,7 +238,7 @@ def test_task_disabled(tmpdir, execution, session):
         assert task.disabled
 
 
-@pytest.mark.parametrize("execution", ["main", "thread", "process"])
+@pytest.mark.parametrize("execution", ["main", "thread", "process", "async"])
 def test_task_force_disabled(tmpdir, execution, session):
     # NOTE: force_run overrides disabled
     # as it is more practical to keep 
@@ -266,8 +266,19 @@ def test_task_force_disabled(tmpdir, execution, session):
         assert task.disabled
         assert not task.force_run # This should be reseted
 
-@pytest.mark.parametrize("execution", ["main", "thread", "process"])
-def test_priority(tmpdir, execution, session):
+def record_launches(monkeypatch) -> list:
+    "Record the names of the tasks in the order the scheduler runs them"
+    launched = []
+    run_task = Scheduler.run_task
+    def wrapper(self, task, *args, **kwargs):
+        launched.append(task.name)
+        return run_task(self, task, *args, **kwargs)
+    monkeypatch.setattr(Scheduler, "run_task", wrapper)
+    return launched
+
+@pytest.mark.parametrize("execution", ["main", "thread", "process", "async"])
+def test_priority(tmpdir, execution, session, monkeypatch):
+    launched = record_launches(monkeypatch)
     with tmpdir.as_cwd() as old_dir:
 
         task_1 = FuncTask(run_succeeding, name="1", priority=100, start_cond=AlwaysTrue(), execution=execution)
@@ -277,6 +288,8 @@ def test_priority(tmpdir, execution, session):
 
         assert 0 == task_4.priority
 
+        # All of the tasks should fit into the same cycle
+        session.config.max_process_count = 4
         session.config.shut_cond = (SchedulerCycles() == 1) | ~SchedulerStarted(period=TimeDelta("2 seconds"))
 
         session.start()
@@ -286,10 +299,14 @@ def test_priority(tmpdir, execution, session):
         task_2_start = list(task_2.logger.get_records())[0].created
         task_3_start = list(task_3.logger.get_records())[0].created
         task_4_start = list(task_4.logger.get_records())[0].created
-        
-        assert task_1_start < task_2_start < task_3_start < task_4_start
 
-@pytest.mark.parametrize("execution", ["main", "thread", "process"])
+        assert launched == ["1", "2", "3", "4"]
+        if execution != "process":
+            # The processes are launched in the order of priority
+            # but they may log their start in any order
+            assert task_1_start < task_2_start < task_3_start < task_4_start
+
+@pytest.mark.parametrize("execution", ["main", "thread", "process", "async"])
 def test_pass_params_as_global(tmpdir, execution, session):
     # thread-Parameters has been observed to fail rarely
     with tmpdir.as_cwd() as old_dir:
@@ -314,7 +331,7 @@ def test_pass_params_as_global(tmpdir, execution, session):
     pytest.param(Parameters(int_5=5), id="Parameters"),
     pytest.param(Parameters(int_5=Private(5)), id="Parameter with secret"),
 ])
-@pytest.mark.parametrize("execution", ["main", "thread", "process"])
+@pytest.mark.parametrize("execution", ["main", "thread", "process", "async"])
 def test_pass_params_as_local(tmpdir, execution, parameters, session):
     with tmpdir.as_cwd() as old_dir:
 
@@ -334,7 +351,7 @@ def test_pass_params_as_local(tmpdir, execution, parameters, session):
         assert 1 == logger.filter_by(action="success").count()
         assert 0 == logger.filter_by(action="fail").count()
 
-@pytest.mark.parametrize("execution", ["main", "thread", "process"])
+@pytest.mark.parametrize("execution", ["main", "thread", "process", "async"])
 def test_pass_params_as_local_and_global(tmpdir, execution, session):
     with tmpdir.as_cwd() as old_dir:
 
@@ -368,7 +385,7 @@ def create_line_to_shutdown():
     with open("shut.txt", "w") as file:
         file.write("line created\n")
 
-@pytest.mark.parametrize("execution", ["main", "thread", "process"])
+@pytest.mark.parametrize("execution", ["main", "thread", "process", "async"])
 def test_startup_shutdown(tmpdir, execution, session):
     with tmpdir.as_cwd() as old_dir:
         
@@ -394,8 +411,9 @@ def test_startup_shutdown(tmpdir, execution, session):
 
         assert list(session.get_task_log()) != []
 
-@pytest.mark.parametrize("execution", ["main", "thread", "process"])
-def test_logging_repo(tmpdir, execution):
+@pytest.mark.parametrize("execution", ["main", "thread", "process", "async"])
+def test_logging_repo(tmpdir, execution, monkeypatch):
+    launched = record_launches(monkeypatch)
     from redbird.logging import RepoHandler
     from redbird.repos import MemoryRepo
     session = Session()
@@ -417,6 +435,8 @@ def test_logging_repo(tmpdir, execution):
 
         assert 0 == task_4.priority
 
+        # All of the tasks should fit into the same cycle
+        session.config.max_process_count = 4
         session.config.shut_cond = (SchedulerCycles() == 1) | ~SchedulerStarted(period=TimeDelta("2 seconds"))
         session.start()
         assert session.scheduler.n_cycles == 1 
@@ -425,5 +445,9 @@ def test_logging_repo(tmpdir, execution):
         task_2_start = list(task_2.logger.get_records())[0].created
         task_3_start = list(task_3.logger.get_records())[0].created
         task_4_start = list(task_4.logger.get_records())[0].created
-        
-        assert task_1_start < task_2_start < task_3_start < task_4_start
+
+        assert launched == ["1", "2", "3", "4"]
+        if execution != "process":
+            # The processes are launched in the order of priority
+            # but they may log their start in any order
+            assert task_1_start < task_2_start < task_3_start < task_4_start
@@ -0,0 +1,88 @@
+import pickle
+
+import pytest
+
+from redengine.conditions import TaskStarted
+from redengine.core.events import EventBus
+from redengine.tasks import FuncTask
+
+def run_success():
+    pass
+
+def run_fail():
+    raise RuntimeError("Oops")
+
+@pytest.mark.parametrize("execution", ["main", "thread", "process"])
+def test_task_events(session, execution):
+    events = []
+    session.events.subscribe(["task_run", "task_success", "task_fail"], callback=events.append)
+    task_success = FuncTask(run_success, name="success", execution=execution, start_cond=~TaskStarted())
+    task_fail = FuncTask(run_fail, name="fail", execution=execution, start_cond=~TaskStarted())
+    session.config.shut_cond = (TaskStarted(task="success") >= 1) & (TaskStarted(task="fail") >= 1)
+    session.start()
+
+    assert [event.kind for event in events if event.task == "success"] == ["task_run", "task_success"]
+    assert [event.kind for event in events if event.task == "fail"] == ["task_run", "task_fail"]
+    run_ids = {event.data["run_id"] for event in events if event.task == "success"}
+    assert run_ids == {task_success.run_id}
+
+def test_scheduler_events(session):
+    sub = session.events.subscribe(queued=True)
+    FuncTask(run_success, name="success", execution="main", start_cond=~TaskStarted())
+    session.config.shut_cond = TaskStarted(task="success") >= 1
+    session.start()
+
+    kinds = [event.kind for event in sub.get_all()]
+    assert kinds[0] == "scheduler_startup"
+    assert kinds[1] == "cycle_start"
+    assert kinds[-1] == "scheduler_shutdown"
+    assert kinds.count("cycle_start") == kinds.count("cycle_end")
+    assert kinds.count("task_success") == 1
+
+def test_queued_callback():
+    bus = EventBus()
+    events = []
+    sub = bus.subscribe("task_fail", callback=events.append, queued=True)
+    bus.publish("task_fail", task="mytask")
+    bus.publish("task_success", task="mytask")
+    sub.close()
+    assert [(event.kind, event.task) for event in events] == [("task_fail", "mytask")]
+
+    # Not delivered after closed
+    bus.publish("task_fail", task="mytask")
+    assert len(events) == 1
+
+def test_decorator_and_errors(caplog):
+    bus = EventBus()
+    events = []
+
+    @bus.subscribe("cycle_end")
+    def failing(event):
+        raise RuntimeError("Oops")
+
+    @bus.subscribe("cycle_end")
+    def recording(event):
+        events.append(event)
+
+    bus.publish("cycle_end", n_cycles=1)
+    assert events[0].data == {"n_cycles": 1}
+    assert "failed to handle" in caplog.text
+
+def test_queue_full():
+    bus = EventBus()
+    sub = bus.subscribe(queued=True, maxsize=2)
+    for _ in range(3):
+        bus.publish("cycle_start")
+    assert len(sub.get_all()) == 2
+    assert sub.n_dropped == 1
+
+def test_invalid_kind():
+    bus = EventBus()
+    with pytest.raises(KeyError):
+        bus.subscribe("not_valid", callback=print)
+
+def test_pickle():
+    bus = EventBus()
+    bus.subscribe(callback=print)
+    bus = pickle.loads(pickle.dumps(bus))
+    assert not bus.has_subscribers("cycle_start")
@@ -0,0 +1,94 @@
+import logging
+import time
+
+import pytest
+from redbird.logging import RepoHandler
+from redbird.repos import MemoryRepo
+
+from redengine.conditions import TaskRunning
+from redengine.core import Scheduler
+from redengine.exc import TaskTerminationException
+from redengine.log.log_record import LogRecord
+from redengine.tasks import FuncTask
+
+def run_slow():
+    time.sleep(2)
+
+def run_slow_threaded(_thread_terminate_):
+    for _ in range(200):
+        if _thread_terminate_.is_set():
+            raise TaskTerminationException
+        time.sleep(0.01)
+
+def wait_instance(task, run_id):
+    for _ in range(200):
+        if not task.is_instance_alive(run_id):
+            return
+        time.sleep(0.01)
+
+@pytest.mark.parametrize("execution", ["thread", "process"])
+def test_instances(session, execution):
+    logging.getLogger(session.config.task_logger_basename).handlers = [
+        RepoHandler(repo=MemoryRepo(model=LogRecord))
+    ]
+    func = run_slow_threaded if execution == "thread" else run_slow
+    task = FuncTask(func, name="task", execution=execution, max_instances=2)
+    scheduler = Scheduler(session=session)
+    session.scheduler = scheduler
+
+    scheduler.run_task(task)
+    first = task.run_id
+    assert task.has_free_instance()
+    scheduler.run_task(task)
+    second = task.run_id
+
+    assert first != second
+    assert task.n_instances == 2
+    assert scheduler.n_alive == 2
+    assert TaskRunning(task=task)
+
+    # All instances are in use
+    task.force_run = True
+    assert not task.has_free_instance()
+    assert not scheduler.is_task_runnable(task)
+    assert task.waiting_for is None
+
+    # Terminating only the first run
+    scheduler.terminate_task(task, run_id=first)
+    wait_instance(task, first)
+    assert not task.is_instance_alive(first)
+    assert task.is_instance_alive(second)
+    assert task.n_instances == 1
+    assert task.has_free_instance()
+
+    scheduler.terminate_task(task)
+    scheduler.wait_task_alive()
+    scheduler.handle_logs()
+    assert scheduler.n_alive == 0
+
+    # The records carry the run they are for
+    actions = {}
+    for record in task.logger.get_records():
+        actions.setdefault(record.run_id, []).append(record.action)
+    assert actions == {first: ["run", "terminate"], second: ["run", "terminate"]}
+
+def test_timeout(session):
+    task = FuncTask(run_slow_threaded, name="task", execution="thread", max_instances=2, timeout="0.3 seconds")
+    scheduler = Scheduler(session=session)
+    session.scheduler = scheduler
+
+    scheduler.run_task(task)
+    first = task.run_id
+    time.sleep(0.2)
+    scheduler.run_task(task)
+    second = task.run_id
+
+    # Only the first one is overdue
+    time.sleep(0.15)
+    scheduler.terminate_timeouted()
+    wait_instance(task, first)
+    assert not task.is_instance_alive(first)
+    assert task.is_instance_alive(second)
+
+    scheduler.terminate_task(task)
+    scheduler.wait_task_alive()
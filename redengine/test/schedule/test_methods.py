@@ -5,6 +5,9 @@ only some parts of the scheduler (like
 executing one task)
 """
 
+import datetime
+import multiprocessing
+import os
 import time
 
 import pytest
@@ -12,7 +15,8 @@ import pytest
 from redengine.core import Scheduler
 from redengine.tasks import FuncTask
 from redengine.exc import TaskInactionException
-from redengine.conditions import AlwaysFalse
+from redengine.conditions import AlwaysFalse, TaskExecutable
+from redengine.time import TimeDelta
 
 def run_failing():
     raise RuntimeError("Task failed")
@@ -56,4 +60,80 @@ def test_run_task(execution, task_func, run_count, fail_count, success_count, se
     scheduler.handle_logs()
 
     assert success_count == logger.filter_by(action="success").count()
-    assert fail_count == logger.filter_by(action="fail").count()
\ No newline at end of file
+    assert fail_count == logger.filter_by(action="fail").count()
+
+def test_run_task_pending(session):
+    "Process launch that is not waited to start is pending till its run is logged"
+    task = FuncTask(func=run_succeeding, name="task", start_cond=AlwaysFalse(), execution="process", session=session)
+    logger = task.logger
+
+    scheduler = Scheduler(session=session)
+    scheduler.run_task(task, wait_for_run=False)
+    assert task.is_launch_pending()
+    assert not scheduler.is_task_runnable(task)
+
+    scheduler.wait_launches()
+    assert not task.is_launch_pending()
+    assert 1 == logger.filter_by(action="run").count()
+
+    scheduler.wait_task_alive()
+    scheduler.handle_logs()
+    assert 1 == logger.filter_by(action="success").count()
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != "fork", reason="Patch is not inherited by the child")
+def test_run_task_pending_crashed(session, monkeypatch):
+    "Process that dies before logging its run is reconciled as failed"
+    task = FuncTask(func=run_succeeding, name="task", start_cond=AlwaysFalse(), execution="process", session=session)
+    logger = task.logger
+
+    # Crash the child before it logs the run
+    monkeypatch.setattr(FuncTask, "log_running", lambda self: os._exit(1))
+
+    scheduler = Scheduler(session=session)
+    scheduler.run_task(task, wait_for_run=False)
+    task._process.join()
+
+    scheduler.handle_logs()
+    assert not task.is_launch_pending()
+    assert 1 == logger.filter_by(action="fail").count()
+
+def test_run_task_prespawned(session):
+    "Process task run on a warm process started ahead"
+    task = FuncTask(func=run_succeeding, name="task", start_cond=AlwaysFalse(), execution="process", session=session)
+    logger = task.logger
+
+    scheduler = Scheduler(session=session)
+    task.prespawn(log_queue=scheduler._log_queue)
+    warm_process = task._warm_process
+    assert task.is_prespawned()
+    assert not task.is_alive()
+
+    scheduler.run_task(task)
+    assert task._process is warm_process
+    assert not task.is_prespawned()
+
+    scheduler.wait_task_alive()
+    scheduler.handle_logs()
+    assert 1 == logger.filter_by(action="run").count()
+    assert 1 == logger.filter_by(action="success").count()
+
+def test_maintain_prespawn(session):
+    "Warm process is started ahead of predicted start and discarded if the prediction changes"
+    task = FuncTask(func=run_succeeding, name="task", start_cond=TaskExecutable(period=TimeDelta("10 minutes")), execution="process", session=session)
+    session.config.prespawn_lead = "1 minute"
+    scheduler = Scheduler(session=session)
+
+    task.last_success = datetime.datetime.now() - datetime.timedelta(minutes=9, seconds=30)
+    scheduler.maintain_prespawn(task)
+    assert task.is_prespawned()
+    warm_process = task._warm_process
+
+    # Predicted start not changed
+    scheduler.maintain_prespawn(task)
+    assert task._warm_process is warm_process
+
+    # Predicted start moved beyond lead time
+    task.last_success = datetime.datetime.now()
+    scheduler.maintain_prespawn(task)
+    assert not task.is_prespawned()
+    assert not warm_process.is_alive()
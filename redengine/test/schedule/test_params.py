@@ -77,7 +77,9 @@ def test_session_arg(execution, session):
 @pytest.mark.parametrize("execution", ["main", "thread", "process"])
 def test_return(execution, session):
 
-    input_task = FuncTask(func=run_with_output, name="task_with_output", start_cond=AlwaysTrue(), execution=execution, session=session)
+    # The input task is run once as otherwise it may be run again 
+    # before the dependent task is launched
+    input_task = FuncTask(func=run_with_output, name="task_with_output", start_cond=~TaskStarted(task="task_with_output"), execution=execution, session=session)
     task = FuncTask(func=run_with_return, name="task_use_output", start_cond=DependSuccess(depend_task=input_task), execution=execution, session=session)
 
     session.config.shut_cond = (TaskStarted(task="task_use_output") >= 1) | ~SchedulerStarted(period=TimeDelta("10 seconds"))
@@ -0,0 +1,56 @@
+import time
+
+from redengine.conditions import TaskFinished, TaskStarted
+from redengine.conditions.scheduler import SchedulerStarted
+from redengine.core import Scheduler
+from redengine.tasks import FuncTask
+from redengine.time import TimeDelta
+
+def run_slow():
+    time.sleep(0.1)
+
+def test_priority_order(session):
+    task_low = FuncTask(run_slow, name="low", priority=1, start_cond=~TaskStarted(), execution="thread", resources={"db": 1})
+    task_high = FuncTask(run_slow, name="high", priority=3, start_cond=~TaskStarted(), execution="thread", resources={"db": 1})
+    task_mid = FuncTask(run_slow, name="mid", priority=2, start_cond=~TaskStarted(), execution="thread", resources={"db": 1})
+
+    session.config.resource_limits = {"db": 1}
+    session.config.shut_cond = (
+        (TaskFinished(task="low") >= 1) & (TaskFinished(task="mid") >= 1) & (TaskFinished(task="high") >= 1)
+    ) | ~SchedulerStarted(period=TimeDelta("5 seconds"))
+    session.start()
+
+    starts = {task.name: task.last_run for task in (task_low, task_high, task_mid)}
+    assert starts["high"] < starts["mid"] < starts["low"]
+
+    # Queue wait is recorded per run
+    assert task_high.last_queue_wait.total_seconds() == 0
+    assert task_mid.last_queue_wait.total_seconds() > 0
+    assert task_low.last_queue_wait > task_mid.last_queue_wait
+    assert not session.scheduler._ready
+
+def test_aging(session):
+    task_old = FuncTask(run_slow, name="old", priority=0, execution="thread")
+    task_new = FuncTask(run_slow, name="new", priority=5, execution="thread")
+
+    session.config.execution_limits = {"thread": 1}
+    session.config.ready_queue_aging = 0.01
+    scheduler = Scheduler(session=session)
+    session.scheduler = scheduler
+
+    # The old one has gained 10 in priority while waiting
+    now = time.monotonic()
+    scheduler._ready = {task_new: now, task_old: now - 1000}
+    scheduler.run_ready()
+
+    assert task_old.is_alive()
+    assert not task_new.is_alive()
+    assert task_new.waiting_for == "execution 'thread'"
+    assert list(scheduler._ready) == [task_new]
+
+    scheduler.wait_task_alive()
+    scheduler.release_slots()
+    scheduler.run_ready()
+    assert task_new.is_alive()
+    assert not scheduler._ready
+    scheduler.wait_task_alive()
@@ -0,0 +1,61 @@
+import time
+
+import pytest
+
+from redengine.conditions import AlwaysTrue
+from redengine.conditions.scheduler import SchedulerCycles
+from redengine.core import Scheduler
+from redengine.tasks import FuncTask
+
+def run_slow():
+    time.sleep(0.2)
+
+@pytest.mark.parametrize("execution", ["main", "thread", "process"])
+def test_resource_limit(session, execution):
+    tasks = [
+        FuncTask(run_slow, name=f"task {i}", execution=execution, resources={"db": 1}, force_run=True)
+        for i in range(3)
+    ]
+    other = FuncTask(run_slow, name="other", execution=execution, resources={"cpu": 1}, force_run=True)
+    session.config.max_process_count = 10
+    session.config.resource_limits = {"db": 2}
+    scheduler = Scheduler(session=session)
+    session.scheduler = scheduler
+
+    for task in tasks + [other]:
+        if scheduler.is_task_runnable(task):
+            scheduler.run_task(task)
+
+    if execution == "main":
+        # Run one at a time thus the slots are released
+        assert [task.waiting_for for task in tasks] == [None, None, None]
+        return
+
+    assert [task.waiting_for for task in tasks] == [None, None, "resource 'db'"]
+    assert not tasks[2].is_alive()
+    assert other.waiting_for is None
+    assert other.is_alive()
+
+    # Slots are released after the tasks finish
+    scheduler.wait_task_alive()
+    scheduler.handle_logs()
+    scheduler.release_slots()
+    assert scheduler.is_task_runnable(tasks[2])
+    assert tasks[2].waiting_for is None
+
+def test_execution_limit(session):
+    threads = [
+        FuncTask(run_slow, name=f"thread {i}", execution="thread", start_cond=AlwaysTrue())
+        for i in range(3)
+    ]
+    session.config.execution_limits = {"thread": 1}
+    session.config.shut_cond = SchedulerCycles() >= 1
+    session.start()
+
+    assert sum(task.status == "success" for task in threads) == 1
+    assert [task.waiting_for for task in threads].count("execution 'thread'") == 2
+
+    # Waiting is in the status output
+    waiting = next(task for task in threads if task.status is None)
+    data = waiting.dict(exclude={'session'})
+    assert data["waiting_for"] == "execution 'thread'"
@@ -0,0 +1,104 @@
+import logging
+import time
+
+from redengine.conditions import DependSuccess, TaskExecutable, TaskStarted
+from redengine.conditions.scheduler import SchedulerStarted
+from redengine.core import Scheduler
+from redengine.core.shard import ProcessBudget, ShardScheduler, ShardedScheduler
+from redengine.log import MinimalRecord
+from redengine.tasks import FuncTask
+from redengine.time import TimeDelta
+
+def run_fast():
+    pass
+
+def run_slow():
+    time.sleep(0.2)
+
+def test_partition(session):
+    tasks = [FuncTask(run_fast, name=f"task {i}", execution="main") for i in range(20)]
+    scheduler = ShardedScheduler(session=session, n_shards=3)
+    partitions = scheduler.get_partitions()
+
+    assert len(partitions) == 3
+    assert set.union(*partitions) == {task.name for task in tasks}
+    assert sum(len(partition) for partition in partitions) == 20
+    # Stable
+    assert partitions == scheduler.get_partitions()
+
+    # By a key
+    scheduler = ShardedScheduler(session=session, n_shards=3, shard_key=lambda task: int(task.name.split(" ")[1]))
+    assert scheduler.get_shard(session["task 4"]) == 1
+
+def test_cross_shard_dependency(session):
+    FuncTask(run_fast, name="upstream", execution="main", start_cond=~TaskStarted())
+    FuncTask(run_fast, name="downstream", execution="main", start_cond=DependSuccess(depend_task="upstream") & ~TaskStarted())
+
+    session.config.n_shards = 2
+    session.config.shut_cond = (TaskStarted(task="downstream") >= 1) | ~SchedulerStarted(period=TimeDelta("5 seconds"))
+    scheduler = ShardedScheduler(session=session, shard_key=lambda task: 0 if task.name == "upstream" else 1)
+    scheduler()
+
+    # The records of both shards are in the logs of the session
+    upstream = [record.action for record in session["upstream"].logger.get_records()]
+    downstream = [record.action for record in session["downstream"].logger.get_records()]
+    assert upstream == ["run", "success"]
+    assert downstream == ["run", "success"]
+    assert session["downstream"].last_run > session["upstream"].last_success
+    assert all(not worker.is_alive() for worker in scheduler._workers)
+
+def test_process_budget(session):
+    tasks = [FuncTask(run_slow, name=f"task {i}", execution="process") for i in range(2)]
+    scheduler = Scheduler(session=session)
+    session.scheduler = scheduler
+    scheduler.process_budget = ProcessBudget(1)
+
+    scheduler.run_task(tasks[0])
+    assert not scheduler.has_free_processors()
+    assert scheduler.process_budget.n_used == 1
+
+    # Another scheduler could take the process
+    scheduler.run_task(tasks[1])
+    assert not tasks[1].is_alive()
+    assert tasks[1].waiting_for == "free processor"
+    assert tasks[1] in scheduler._ready
+
+    # Released as the process finishes
+    scheduler.wait_task_alive()
+    scheduler.handle_logs()
+    scheduler.release_slots()
+    assert scheduler.process_budget.n_used == 0
+    scheduler.run_ready()
+    assert tasks[1].is_alive()
+    scheduler.wait_task_alive()
+
+def test_restart_history(session):
+    # The records of a previous run of the scheduler
+    repo = logging.getLogger(session.config.task_logger_basename).handlers[0].repo
+    now = time.time()
+    for i in range(3):
+        repo.add(MinimalRecord(task_name="counted", action="run", created=now - 10 + i))
+    for i in range(2):
+        repo.add(MinimalRecord(task_name="retried", action="run", created=now - 6 + 2 * i))
+        repo.add(MinimalRecord(task_name="retried", action="fail", created=now - 5 + 2 * i))
+
+    FuncTask(run_fast, name="counted", execution="main")
+    FuncTask(run_fast, name="counter", execution="main", start_cond=(TaskStarted(task="counted") >= 3) & ~TaskStarted())
+    # Has failed and used its retry
+    FuncTask(run_fast, name="retried", execution="main", start_cond=TaskExecutable(retries=1, period=TimeDelta("1 hour")))
+
+    session.config.n_shards = 2
+    session.config.shut_cond = (TaskStarted(task="counter") >= 1) | ~SchedulerStarted(period=TimeDelta("2 seconds"))
+    scheduler = ShardedScheduler(session=session, shard_key=lambda task: 1 if task.name == "counter" else 0)
+    scheduler()
+
+    assert session["counter"].logger.filter_by(action="run").count() == 1
+    assert session["retried"].logger.filter_by(action="run").count() == 2
+
+def test_shard_task_order(session):
+    FuncTask(run_fast, name="c", execution="main", start_cond=DependSuccess(depend_task="b"))
+    FuncTask(run_fast, name="b", execution="main", start_cond=DependSuccess(depend_task="a"))
+    FuncTask(run_fast, name="a", execution="main")
+    FuncTask(run_fast, name="prioritized", execution="main", priority=1)
+    scheduler = ShardScheduler(session=session, index=0, partition={"a", "c", "prioritized"}, inbox=None, stop_event=None)
+    assert [task.name for task in scheduler.tasks] == ["prioritized", "a", "c"]
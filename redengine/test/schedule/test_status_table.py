@@ -0,0 +1,128 @@
+import datetime
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import redengine
+from redengine.conditions import TaskStarted
+from redengine.core import Scheduler
+from redengine.core.status import READ_TIMEOUT, StatusTable
+from redengine.tasks import FuncTask
+
+ROOT = str(Path(redengine.__file__).parent.parent)
+
+def run_success():
+    pass
+
+def run_slow():
+    time.sleep(0.5)
+
+def wait_other():
+    # Runs in a child process: the status is
+    # read from the table of the scheduler
+    task = redengine.session["other"]
+    statuses = []
+    for _ in range(1000):
+        status = task.get_status()
+        if not statuses or statuses[-1] != status:
+            statuses.append(status)
+        if status == "success":
+            break
+        time.sleep(0.01)
+    return statuses
+
+@pytest.fixture
+def status_table():
+    table = StatusTable(capacity=16)
+    yield table
+    table.close()
+
+def test_publish(session, status_table):
+    session.config.status_table = status_table
+    task_success = FuncTask(run_success, name="success", execution="main")
+    task_idle = FuncTask(run_success, name="idle", execution="main")
+    scheduler = Scheduler(session=session)
+    session.scheduler = scheduler
+    scheduler._publish_tasks()
+
+    reader = StatusTable.attach(status_table.name)
+    assert not reader.is_owner
+    assert reader.get_status("idle") is None
+    assert reader.get_status("missing") is None
+    assert reader.get("missing") is None
+
+    task_success()
+    task_success()
+    state = reader.get("success")
+    assert state["status"] == "success"
+    assert state["run_count"] == 2
+    assert state["pid"] == os.getpid()
+    assert state["last_run"] is not None
+    assert state["last_fail"] is None
+
+    df = reader.read().set_index("name")
+    assert df["status"].to_dict() == {"success": "success", "idle": None}
+    assert df["run_count"].to_dict() == {"success": 2, "idle": 0}
+    reader.close()
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="Fork not supported")
+def test_child_process(session, status_table):
+    session.config.status_table = status_table
+    session.config.process_start_method = "fork"
+    FuncTask(run_slow, name="other", execution="thread", start_cond=~TaskStarted())
+    task = FuncTask(wait_other, name="waiter", execution="process", start_cond=~TaskStarted())
+    session.config.shut_cond = (TaskStarted(task="other") >= 1) & (TaskStarted(task="waiter") >= 1)
+    session.start()
+
+    assert task.status == "success"
+    # The copy of the task in the child was not updated
+    assert session.returns[task][-1] == "success"
+    assert status_table.get("waiter")["run_count"] == 1
+
+def test_external_reader(session, status_table):
+    session.config.status_table = status_table
+    task = FuncTask(run_success, name="success", execution="main")
+    task()
+
+    code = (
+        "from redengine.core.status import StatusTable; "
+        f"print(StatusTable.attach({status_table.name!r}).get_status('success'))"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([ROOT, os.environ.get("PYTHONPATH", "")]))
+    output = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+    assert output.stdout.strip() == "success"
+    # The reader did not remove the table
+    assert StatusTable.attach(status_table.name).get_status("success") == "success"
+
+def test_full(status_table):
+    for i in range(16):
+        status_table.set_action(f"task {i}", "run")
+    with pytest.warns(UserWarning):
+        status_table.set_action("task 16", "run")
+    assert status_table.n_rows == 16
+    assert status_table.get_status("task 16") is None
+
+def test_times(status_table):
+    created = time.time()
+    status_table.set_action("task", "run", created=created)
+    state = status_table.get("task")
+    df = status_table.read().set_index("name")
+    # Both are local times
+    assert state["last_run"] == datetime.datetime.fromtimestamp(created)
+    assert abs((df.loc["task", "last_run"] - state["last_run"]).total_seconds()) < 1e-3
+    assert pd.isnull(df.loc["task", "last_success"])
+
+def test_dead_writer(status_table):
+    status_table.set_action("task", "run")
+    # The writer died in the middle of writing the row
+    status_table._rows[0]["seq"] += 1
+    start = time.monotonic()
+    assert status_table.get_status("task") == "run"
+    assert len(status_table.read()) == 1
+    assert time.monotonic() - start < 5 * READ_TIMEOUT
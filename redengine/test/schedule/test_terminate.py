@@ -1,4 +1,5 @@
 
+import asyncio
 import datetime
 import time
 import os
@@ -27,14 +28,25 @@ def run_slow_threaded(_thread_terminate_):
         with open("work.txt", "a") as file:
             file.write("line created\n")
 
+def run_waiting_threaded(_thread_terminate_):
+    if _thread_terminate_.wait(timeout=5):
+        raise TaskTerminationException
+
+async def run_slow_async():
+    await asyncio.sleep(1)
+    with open("work.txt", "a") as file:
+        file.write("line created\n")
+
 def get_slow_func(execution):
     return {
         "process": run_slow,
         # Thread tasks are terminated inside the task (the task should respect _thread_terminate_)
         "thread": run_slow_threaded,
+        # Async tasks are cancelled
+        "async": run_slow_async,
     }[execution]
 
-@pytest.mark.parametrize("execution", ["thread", "process"])
+@pytest.mark.parametrize("execution", ["thread", "process", "async"])
 def test_without_timeout(tmpdir, execution, session):
     """Test the task.timeout is respected overt scheduler.timeout"""
     # TODO: There is probably better ways to test this
@@ -57,7 +69,7 @@ def test_without_timeout(tmpdir, execution, session):
 
         assert os.path.exists("work.txt")
 
-@pytest.mark.parametrize("execution", ["thread", "process"])
+@pytest.mark.parametrize("execution", ["thread", "process", "async"])
 def test_task_timeout(tmpdir, execution, session):
     """Test task termination due to the task ran too long"""
     with tmpdir.as_cwd() as old_dir:
@@ -79,7 +91,7 @@ def test_task_timeout(tmpdir, execution, session):
 
         assert not os.path.exists("work.txt")
 
-@pytest.mark.parametrize("execution", ["thread", "process"])
+@pytest.mark.parametrize("execution", ["thread", "process", "async"])
 def test_task_terminate(tmpdir, execution, session):
     """Test task termination due to the task was terminated by another task"""
 
@@ -107,7 +119,7 @@ def test_task_terminate(tmpdir, execution, session):
         assert not task.force_termination
 
 
-@pytest.mark.parametrize("execution", ["thread", "process"])
+@pytest.mark.parametrize("execution", ["thread", "process", "async"])
 def test_task_terminate_end_cond(tmpdir, execution, session):
     """Test task termination due to the task ran too long"""
     #! NOTE: CI observed to get stuck in this for some times
@@ -126,4 +138,35 @@ def test_task_terminate_end_cond(tmpdir, execution, session):
         assert 0 == logger.filter_by(action="success").count()
         assert 0 == logger.filter_by(action="fail").count()
 
-        assert not os.path.exists("work.txt")
\ No newline at end of file
+        assert not os.path.exists("work.txt")
+
+
+def test_timeout_monotonic(tmpdir, session, monkeypatch):
+    """Test the timeout is not affected by the changes of the wall clock"""
+    with tmpdir.as_cwd() as old_dir:
+        task = FuncTask(run_waiting_threaded, name="slow task", execution="thread", timeout="0.5 seconds")
+        scheduler = Scheduler(session=session)
+        session.scheduler = scheduler
+        session.config.cycle_sleep = 10
+
+        scheduler.run_task(task)
+        assert (task, task.run_id) in scheduler._deadlines
+
+        # Wall clock jumps forward
+        real_time = time.time
+        monkeypatch.setattr(time, "time", lambda: real_time() + 3600)
+        assert not scheduler.is_timeouted(task)
+        scheduler.terminate_timeouted()
+        assert task.is_alive()
+        monkeypatch.undo()
+
+        # Scheduler wakes up at the deadline
+        start = time.monotonic()
+        scheduler._hibernate()
+        assert time.monotonic() - start < 1
+        scheduler.terminate_timeouted()
+        assert (task, task.run_id) not in scheduler._deadlines
+
+        scheduler.wait_task_alive()
+        scheduler.handle_logs()
+        assert 1 == task.logger.filter_by(action="terminate").count()
@@ -0,0 +1,63 @@
+import os
+import time
+
+from redengine.conditions import TaskStarted
+from redengine.core import Scheduler
+from redengine.exc import TaskTerminationException
+from redengine.tasks import FuncTask
+
+def run_pid(x):
+    return (os.getpid(), x)
+
+def run_fail():
+    raise RuntimeError("Oops")
+
+def run_waiting(_thread_terminate_):
+    if _thread_terminate_.wait(timeout=5):
+        raise TaskTerminationException
+
+def run_crash():
+    os._exit(1)
+
+def test_run(session):
+    task_success = FuncTask(run_pid, name="success", execution="thread", parameters={"x": 1}, start_cond=~TaskStarted())
+    task_fail = FuncTask(run_fail, name="fail", execution="thread", start_cond=~TaskStarted())
+    session.config.thread_host = True
+    session.config.shut_cond = (TaskStarted(task="success") >= 1) & (TaskStarted(task="fail") >= 1)
+    session.start()
+
+    assert [record.action for record in task_success.logger.get_records()] == ["run", "success"]
+    assert [record.action for record in task_fail.logger.get_records()] == ["run", "fail"]
+
+    # Ran in another process
+    pid, x = session.returns[task_success]
+    assert pid != os.getpid()
+    assert x == 1
+    assert session.scheduler._task_host is None
+
+def test_terminate(session):
+    task = FuncTask(run_waiting, name="task", execution="thread", timeout="0.5 seconds", start_cond=~TaskStarted())
+    session.config.thread_host = True
+    session.config.shut_cond = TaskStarted(task="task") >= 1
+    session.start()
+
+    assert [record.action for record in task.logger.get_records()] == ["run", "terminate"]
+
+def test_host_crash(session):
+    task = FuncTask(run_crash, name="task", execution="thread")
+    session.config.thread_host = True
+    scheduler = Scheduler(session=session)
+    session.scheduler = scheduler
+
+    scheduler.run_task(task)
+    assert task._hosted.wait(timeout=10)
+    scheduler.handle_logs()
+    assert task.status == "fail"
+
+    # A new host is started
+    task_success = FuncTask(run_pid, name="success", execution="thread", parameters={"x": 1})
+    scheduler.run_task(task_success)
+    assert task_success._hosted.wait(timeout=10)
+    scheduler.handle_logs()
+    assert task_success.status == "success"
+    scheduler._stop_task_host()
@@ -0,0 +1,70 @@
+import threading
+import time
+
+import pytest
+
+from redengine.conditions.scheduler import SchedulerCycles
+from redengine.core import Scheduler
+from redengine.exc import TaskTerminationException
+from redengine.tasks import FuncTask
+
+def run_sleep():
+    time.sleep(0.2)
+    return threading.current_thread().name
+
+def run_slow_threaded(_thread_terminate_):
+    for _ in range(100):
+        if _thread_terminate_.is_set():
+            raise TaskTerminationException
+        time.sleep(0.01)
+
+def test_bounded(session):
+    tasks = [
+        FuncTask(run_sleep, name=f"task {i}", execution="thread", force_run=True)
+        for i in range(10)
+    ]
+    session.config.thread_pool_size = 2
+    session.config.max_process_count = 20
+    session.config.shut_cond = SchedulerCycles() >= 1
+    session.config.instant_shutdown = False
+
+    session.start()
+
+    assert all(task.status == "success" for task in tasks)
+    # The tasks ran on the workers of the pool
+    thread_names = {session.returns[task] for task in tasks}
+    assert len(thread_names) == 2
+    assert all(name.startswith("redengine-task") for name in thread_names)
+
+    # Thread pool is closed
+    assert session.scheduler._thread_pool is None
+
+def test_queue_depth(session):
+    tasks = [
+        FuncTask(run_slow_threaded, name=f"task {i}", execution="thread")
+        for i in range(3)
+    ]
+    session.config.thread_pool_size = 1
+    scheduler = Scheduler(session=session)
+    session.scheduler = scheduler
+
+    for task in tasks:
+        scheduler.run_task(task)
+    assert all(task.is_alive() for task in tasks)
+    assert scheduler.n_thread_active == 1
+    assert scheduler.n_thread_queued == 2
+
+    # Queued run is cancelled
+    scheduler.terminate_task(tasks[2])
+    assert not tasks[2].is_alive()
+    assert tasks[2].status == "terminate"
+    assert scheduler.n_thread_queued == 1
+
+    # Running is terminated cooperatively
+    scheduler.terminate_task(tasks[0])
+    scheduler.wait_task_alive()
+    assert tasks[0].status == "terminate"
+    assert tasks[1].status == "success"
+    assert scheduler.n_thread_active == 0
+
+    scheduler._stop_thread_pool()
@@ -0,0 +1,50 @@
+import time
+
+import pytest
+
+from redengine.conditions import SchedulerCycles, TaskStarted
+from redengine.tasks import FuncTask
+
+def run_success():
+    pass
+
+def run_slow():
+    time.sleep(0.2)
+
+@pytest.mark.parametrize("trigger", [True, False])
+def test_pipeline_one_cycle(session, trigger):
+    session.config.trigger_dependents = trigger
+    # The downstream tasks are checked first in the cycle
+    task_c = FuncTask(run_success, name="c", execution="main", start_cond="after task 'b'", priority=3)
+    task_b = FuncTask(run_success, name="b", execution="main", start_cond="after task 'a'", priority=2)
+    task_a = FuncTask(run_success, name="a", execution="main", start_cond=~TaskStarted(), priority=1)
+    session.config.shut_cond = SchedulerCycles(_ge_=1)
+    session.start()
+
+    assert task_a.status == "success"
+    if trigger:
+        assert task_b.status == "success"
+        assert task_c.status == "success"
+    else:
+        assert task_b.status is None
+        assert task_c.status is None
+
+def test_nested_condition(session):
+    task_a = FuncTask(run_success, name="a", execution="main", start_cond=~TaskStarted(), priority=1)
+    task_b = FuncTask(run_success, name="b", execution="main", start_cond="(after task 'a' & true) | false", priority=2)
+    session.config.shut_cond = SchedulerCycles(_ge_=1)
+    session.start()
+
+    assert session.graph.get_children("a") == {"b"}
+    assert task_b.status == "success"
+
+def test_wake_up(session):
+    session.config.cycle_sleep = 2
+    task_a = FuncTask(run_slow, name="a", execution="thread", start_cond=~TaskStarted())
+    task_b = FuncTask(run_success, name="b", execution="main", start_cond="after task 'a'")
+    session.config.shut_cond = TaskStarted(task="b") >= 1
+    session.start()
+
+    # Not waited the full cycle_sleep after 'a' finished
+    assert task_b.status == "success"
+    assert (task_b.last_run - task_a.last_success).total_seconds() < 1
@@ -0,0 +1,163 @@
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+import redengine
+from redengine.conditions import TaskStarted
+from redengine.core import Scheduler
+from redengine.tasks import FuncTask
+from redengine.worker import WorkerServer
+from redengine.worker.protocol import AUTHKEY_ENV, parse_address, send_msg
+
+ROOT = str(Path(redengine.__file__).parent.parent)
+
+def run_success(x):
+    return x * 2
+
+def run_fail():
+    raise RuntimeError("Oops")
+
+def run_slow():
+    time.sleep(10)
+
+def run_recorded(output):
+    with open(output, "a") as file:
+        file.write(f"{os.getppid()}\n")
+    time.sleep(1)
+    return "done"
+
+@pytest.fixture
+def start_worker():
+    workers = []
+    def start(server, *args, authkey=None):
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join([ROOT, os.environ.get("PYTHONPATH", "")]))
+        env[AUTHKEY_ENV] = (authkey or server.authkey).decode("utf-8")
+        worker = subprocess.Popen(
+            [sys.executable, "-m", "redengine.worker", server.address, "--heartbeat", "0.1", *args],
+            env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        workers.append(worker)
+        return worker
+    yield start
+    for worker in workers:
+        worker.kill()
+        worker.wait()
+
+def test_parse_address():
+    assert parse_address("localhost:8765")[1] == ("localhost", 8765)
+    assert parse_address(("localhost", 8765))[1] == ("localhost", 8765)
+    assert parse_address("unix:/tmp/redengine.sock")[1] == "/tmp/redengine.sock"
+    assert parse_address("/tmp/redengine.sock")[1] == "/tmp/redengine.sock"
+
+@pytest.mark.parametrize("transport", ["tcp", "unix"])
+def test_run(session, start_worker, tmpdir, transport):
+    address = "127.0.0.1:0" if transport == "tcp" else f"unix:{tmpdir / 'workers.sock'}"
+    server = WorkerServer(address)
+    session.config.worker_server = server
+    server.start()
+    start_worker(server)
+    assert server.wait_workers(1, timeout=30)
+
+    task_success = FuncTask(run_success, name="success", execution="remote", parameters={"x": 2}, start_cond=~TaskStarted())
+    task_fail = FuncTask(run_fail, name="fail", execution="remote", start_cond=~TaskStarted())
+    session.config.shut_cond = (TaskStarted(task="success") >= 1) & (TaskStarted(task="fail") >= 1)
+    session.start()
+
+    assert [record.action for record in task_success.logger.get_records()] == ["run", "success"]
+    assert [record.action for record in task_fail.logger.get_records()] == ["run", "fail"]
+    assert session.returns[task_success] == 4
+    assert not server.is_started
+
+def test_terminate(session, start_worker):
+    server = WorkerServer()
+    session.config.worker_server = server
+    server.start()
+    start_worker(server)
+    assert server.wait_workers(1, timeout=30)
+
+    task = FuncTask(run_slow, name="slow", execution="remote", timeout="1 seconds", start_cond=~TaskStarted())
+    session.config.shut_cond = TaskStarted(task="slow") >= 1
+    session.start()
+
+    assert [record.action for record in task.logger.get_records()] == ["run", "terminate"]
+
+def test_reassign(session, start_worker, tmpdir):
+    output = str(tmpdir / "output.txt")
+    server = WorkerServer(heartbeat_timeout=1)
+    session.config.worker_server = server
+    server.start()
+    workers = {
+        worker.pid: worker
+        for worker in (start_worker(server, "--capacity", "1") for _ in range(2))
+    }
+    assert server.wait_workers(2, timeout=30)
+
+    task = FuncTask(run_recorded, name="task", execution="remote", parameters={"output": output})
+    scheduler = Scheduler(session=session)
+    session.scheduler = scheduler
+    scheduler.run_task(task)
+    assert task.is_alive()
+
+    # Wait till the task runs and stop the worker
+    # running it (it no longer sends heartbeats)
+    while not os.path.exists(output) or not Path(output).read_text().strip():
+        time.sleep(0.01)
+    lost = workers[int(Path(output).read_text())]
+    os.kill(lost.pid, signal.SIGSTOP)
+
+    assert task._remote.wait(timeout=30)
+    scheduler.handle_logs()
+    with open(output) as file:
+        pids = [int(line) for line in file.read().splitlines()]
+
+    assert task._remote.n_assigned == 2
+    assert len(set(pids)) == 2
+    assert task.status == "success"
+    assert session.returns[task] == "done"
+    assert len(server.workers) == 1
+    server.close()
+
+def test_no_server(session):
+    task = FuncTask(run_fail, name="task", execution="remote")
+    with pytest.raises(ValueError):
+        task()
+    assert task.status == "fail"
+
+def test_authentication(session, start_worker, tmpdir):
+    server = WorkerServer(authkey="secret")
+    server.start()
+
+    # A worker with a wrong key is rejected and exits
+    worker = start_worker(server, "--no-reconnect", authkey=b"wrong")
+    assert worker.wait(timeout=30) != 0
+    assert server.workers == []
+
+    # Messages of unauthenticated peers are not unpickled
+    output = tmpdir / "pwned.txt"
+    sock = socket.create_connection(parse_address(server.address)[1])
+    send_msg(sock, ("hello", _Malicious(str(output))))
+    sock.settimeout(5)
+    try:
+        while sock.recv(1024):
+            pass
+    except OSError:
+        pass
+    sock.close()
+    assert not output.exists()
+
+    start_worker(server)
+    assert server.wait_workers(1, timeout=30)
+    server.close()
+
+class _Malicious:
+    def __init__(self, path):
+        self.path = path
+
+    def __reduce__(self):
+        return (open, (self.path, "w"))
@@ -21,6 +21,20 @@ def test_get_task(session):
     assert t is task
 
 
+def test_get_task_renamed(session):
+    task = FuncTask(
+        lambda : None, 
+        name="example",
+        execution="main"
+    )
+    task.name = "renamed"
+    assert session.get_task("renamed") is task
+    assert "example" not in session
+
+    task.delete()
+    assert "renamed" not in session
+    assert session.tasks == set()
+
 def test_tasks_attr(session):
 
     task1 = FuncTask(
@@ -26,4 +26,84 @@ def test_dependency(session):
         Link(tb, td, relation=DependSuccess, type=Any),
     ]
     assert str(deps)
-    assert repr(deps)
\ No newline at end of file
+    assert repr(deps)
+
+def test_graph_nested(session):
+    ta = FuncTask(lambda: None, name="a", start_cond="daily", execution="main")
+    tb = FuncTask(lambda: None, name="b", start_cond="daily", execution="main")
+    tc = FuncTask(lambda: None, name="c", start_cond="(after task 'a' & daily) | (true & ~(after task 'b' failed))", execution="main")
+
+    graph = session.graph
+    assert graph.get_parents("c") == {"a", "b"}
+    assert graph.get_children("a") == {"c"}
+    assert graph.get_children("b") == {"c"}
+    assert sorted(graph, key=lambda link: link.parent.name) == [
+        Link(ta, tc, relation=DependSuccess, type=All),
+        Link(tb, tc, relation=DependFailure, type=All),
+    ]
+
+def test_graph_update(session):
+    ta = FuncTask(lambda: None, name="a", start_cond="daily", execution="main")
+    tb = FuncTask(lambda: None, name="b", start_cond="after task 'a'", execution="main")
+    graph = session.graph
+
+    tb.start_cond = "after task 'c'"
+    assert graph.get_children("a") == set()
+    assert graph.get_children("c") == {"b"}
+
+    tb.name = "renamed"
+    assert graph.get_children("c") == {"renamed"}
+
+    session.remove_task(tb)
+    assert graph.get_children("c") == set()
+    assert graph.get_parents("renamed") == set()
+
+def test_graph_removed_parent(session):
+    ta = FuncTask(lambda: None, name="a", start_cond="daily", execution="main")
+    tb = FuncTask(lambda: None, name="b", start_cond="after task 'a'", execution="main")
+    graph = session.graph
+
+    # The child still depends on the removed task
+    session.remove_task(ta)
+    assert graph.get_parents("b") == {"a"}
+    assert list(graph) == []
+
+def test_graph_order(session):
+    # Created in reverse order
+    FuncTask(lambda: None, name="d", start_cond="after tasks 'b', 'c'", execution="main")
+    FuncTask(lambda: None, name="c", start_cond="after task 'a'", execution="main")
+    FuncTask(lambda: None, name="b", start_cond="after task 'a'", execution="main")
+    FuncTask(lambda: None, name="a", start_cond="daily", execution="main")
+    FuncTask(lambda: None, name="0 alone", start_cond="daily", execution="main")
+
+    graph = session.graph
+    order = graph.topological_order()
+    assert order.index("a") < order.index("b") < order.index("d")
+    assert order.index("a") < order.index("c") < order.index("d")
+    assert [task.name for task in session.scheduler.tasks] == order
+    assert not graph.has_cycle()
+
+    path, total = graph.critical_path(runtimes={"a": 1, "b": 5, "c": 2, "d": 1, "0 alone": 6})
+    assert path == ["a", "b", "d"]
+    assert total == 7
+
+def test_graph_cycle(session):
+    FuncTask(lambda: None, name="a", start_cond="after task 'c'", execution="main")
+    FuncTask(lambda: None, name="b", start_cond="after task 'a'", execution="main")
+    FuncTask(lambda: None, name="c", start_cond="after task 'b'", execution="main")
+    FuncTask(lambda: None, name="d", start_cond="after task 'c'", execution="main")
+
+    graph = session.graph
+    assert graph.find_cycle() == ["a", "b", "c", "a"]
+    assert set(graph.topological_order()) == {"a", "b", "c", "d"}
+    path, total = graph.critical_path(runtimes={"d": 1})
+    assert path == ["d"]
+
+def test_graph_runtime_history(session):
+    ta = FuncTask(lambda: None, name="a", start_cond="daily", execution="main")
+    tb = FuncTask(lambda: None, name="b", start_cond="after task 'a'", execution="main")
+    ta()
+    tb()
+    path, total = session.graph.critical_path()
+    assert path == ["a", "b"]
+    assert total >= 0
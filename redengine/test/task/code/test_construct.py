@@ -8,6 +8,7 @@ from redbird.repos import MemoryRepo
 
 from redengine.log.log_record import LogRecord
 from redengine.tasks import CodeTask
+from redengine.tasks.code import compile_code
 from redengine.core import Scheduler
 from redengine.conditions import TaskStarted
 
@@ -84,4 +85,28 @@ def test_run_fail(session, execution):
 
     records = list(map(lambda e: e.dict(exclude={'created'}), session.get_task_log()))
     record_fail = [r for r in records if r['action'] == 'fail'][0]
-    assert 'File "<string>", line 5, in <module>\n  File "<string>", line 3, in main\nRuntimeError: Failed' in record_fail['exc_text']
\ No newline at end of file
+    assert 'File "<string>", line 5, in <module>\n  File "<string>", line 3, in main\nRuntimeError: Failed' in record_fail['exc_text']
+
+
+def test_construct_invalid_code(session):
+    with pytest.raises(ValueError):
+        task = CodeTask(code="return_value = (", name="mytask")
+    assert "mytask" not in session
+
+def test_compiled_once(session):
+    compile_code.cache_clear()
+    task = CodeTask(code="return_value = myparam + 1", name="mytask", execution="main", parameters={"myparam": 1})
+    task()
+    task()
+    assert session.returns[task] == 2
+    cache_info = compile_code.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 2
+
+    # Changing the code should change the output
+    task.code = "return_value = myparam + 2"
+    task()
+    assert session.returns[task] == 3
+
+    with pytest.raises(ValueError):
+        task.code = "return_value = ("
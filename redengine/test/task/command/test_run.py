@@ -3,6 +3,7 @@ import logging
 from pathlib import Path
 import platform
 import sys
+import time
 
 import pytest
 
@@ -11,6 +12,7 @@ from redbird.repos import MemoryRepo
 
 from redengine.log.log_record import LogRecord
 from redengine.tasks import CommandTask
+from redengine.tasks.command import MAX_LINE_LENGTH
 
 from task_helpers import wait_till_task_finish
 
@@ -127,4 +129,115 @@ def test_success_bash_file(tmpdir, session):
         wait_till_task_finish(task)
 
         assert Path("test.txt").is_file()
-        assert "success" == task.status
\ No newline at end of file
+        assert "success" == task.status
+
+
+@pytest.mark.parametrize("execution", ["main", "thread", "process"])
+def test_stream_output_file(tmpdir, execution, session):
+    with tmpdir.as_cwd() as old_dir:
+        task = CommandTask(
+            command=[sys.executable, "-c", "for i in range(1000): print(f'line {i}')"], 
+            name="a task",
+            execution=execution,
+            stream_output=True,
+            output_file="output.log",
+            output_tail=3,
+        )
+        task()
+        wait_till_task_finish(task)
+
+        assert "success" == task.status
+        assert session.returns[task] == "line 997\nline 998\nline 999"
+
+        lines = tmpdir.join("output.log").read().splitlines()
+        assert len(lines) == 1000
+        assert lines[0] == "line 0"
+        assert lines[-1] == "line 999"
+
+def test_stream_output_logger(tmpdir, session, caplog):
+    with tmpdir.as_cwd() as old_dir:
+        task = CommandTask(
+            command=[sys.executable, "-c", "import sys; print('to stdout'); print('to stderr', file=sys.stderr)"], 
+            name="a task",
+            execution="main",
+            stream_output=True,
+        )
+        with caplog.at_level(logging.INFO, logger="redengine.command"):
+            task()
+
+        assert "success" == task.status
+        records = [rec for rec in caplog.records if rec.name == "redengine.command"]
+        assert {"to stdout", "to stderr"} == {rec.message for rec in records}
+        assert all(rec.task_name == "a task" for rec in records)
+
+def test_stream_output_long_line(tmpdir, session):
+    with tmpdir.as_cwd() as old_dir:
+        task = CommandTask(
+            command=[sys.executable, "-c", f"import sys; sys.stdout.write('x' * {MAX_LINE_LENGTH * 2 + 10}); print(); print('end')"], 
+            name="a task",
+            execution="main",
+            stream_output=True,
+            output_tail=5,
+        )
+        task()
+
+        assert "success" == task.status
+        lines = session.returns[task].split("\n")
+        assert [len(line) for line in lines] == [MAX_LINE_LENGTH, MAX_LINE_LENGTH, 10, 3]
+
+def test_stream_output_timeout(tmpdir, session):
+    with tmpdir.as_cwd() as old_dir:
+        # Closes the output but keeps running
+        task = CommandTask(
+            command=[sys.executable, "-c", "import os, time; print('started', flush=True); os.close(1); os.close(2); time.sleep(30)"], 
+            name="a task",
+            execution="main",
+            stream_output=True,
+            timeout="1 seconds",
+        )
+        start = time.time()
+        task()
+
+        assert time.time() - start < 15
+        assert "fail" == task.status
+
+def test_stream_output_fail(tmpdir, session):
+    task_logger = logging.getLogger(session.config.task_logger_basename)
+    task_logger.handlers = [
+        RepoHandler(repo=MemoryRepo(model=LogRecord))
+    ]
+    with tmpdir.as_cwd() as old_dir:
+        task = CommandTask(
+            command=[sys.executable, "-c", "print('about to fail'); raise SystemExit(3)"], 
+            name="a task",
+            execution="main",
+            stream_output=True,
+            output_file="output.log",
+        )
+        task()
+
+        assert "fail" == task.status
+        records = list(map(lambda e: e.dict(exclude={'created'}), session.get_task_log()))
+        err = records[1]["exc_text"].strip().replace('\r', '')
+        assert err.endswith("OSError: Failed running command (3): \nabout to fail")
+
+def test_execute_async(tmpdir, session):
+    import asyncio
+    import time
+    tasks = [
+        CommandTask(
+            command=[sys.executable, "-c", f"import time; time.sleep(0.5); print('task {i}')"], 
+            name=f"task {i}",
+        )
+        for i in range(5)
+    ]
+    async def run_all():
+        return await asyncio.gather(*(task.execute_async() for task in tasks))
+
+    with tmpdir.as_cwd() as old_dir:
+        start = time.time()
+        outputs = asyncio.run(run_all())
+        # Run concurrently
+        assert time.time() - start < 2.5
+
+    assert outputs == [f"task {i}" for i in range(5)]
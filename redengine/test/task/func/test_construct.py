@@ -272,4 +272,17 @@ def test_existing_rename(session):
     assert task2.name == 'a task - 1'
 
     assert session['a task'] is task1
-    assert session['a task - 1'] is task2
\ No newline at end of file
+    assert session['a task - 1'] is task2
+
+
+def test_signature_changed_func(session):
+    def func_a(a, b=None): ...
+    def func_b(c, *, d=None): ...
+
+    task = FuncTask(func_a, name="mytask", execution="main")
+    assert task.kw_args == ["a", "b"]
+    assert task.pos_args == ["a", "b"]
+
+    task.func = func_b
+    assert task.kw_args == ["c", "d"]
+    assert task.pos_args == ["c"]
@@ -36,7 +36,7 @@ def run_parametrized_kwargs(**kwargs):
     assert isinstance(kwargs["string"], str)
     assert isinstance(kwargs["optional_float"], float)
 
-@pytest.mark.parametrize("execution", ["main", "thread", "process"])
+@pytest.mark.parametrize("execution", ["main", "thread", "process", "async"])
 @pytest.mark.parametrize(
     "task_func,expected_outcome,exc_cls",
     [
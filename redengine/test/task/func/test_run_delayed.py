@@ -1,5 +1,5 @@
 
-from redengine.tasks.func import FuncTask
+from redengine.tasks.func import FuncTask, clear_module_cache
 from textwrap import dedent
 import pytest
 import pandas as pd
@@ -258,4 +258,66 @@ def test_parametrization_kwargs(tmpdir, script_files, session):
         assert [
             {"task_name": "a task", "action": "run"},
             {"task_name": "a task", "action": "success"},
-        ] == records
\ No newline at end of file
+        ] == records
+
+
+def test_module_cached(tmpdir, session):
+    task_dir = tmpdir.mkdir("mytasks")
+    task_file = task_dir.join("myfile.py")
+    task_file.write(dedent("""
+    with open("imports.txt", "a") as f:
+        f.write("imported\\n")
+
+    def main():
+        return 'first'
+    """))
+
+    def count_imports():
+        return tmpdir.join("imports.txt").read().count("imported")
+
+    with tmpdir.as_cwd() as old_dir:
+
+        task1 = FuncTask(func_name="main", path="mytasks/myfile.py", name="task 1", execution="main")
+        task2 = FuncTask(func_name="main", path="mytasks/myfile.py", name="task 2", execution="main")
+        task1()
+        task1()
+        task2()
+        assert count_imports() == 1
+        assert session.returns[task2] == 'first'
+
+        # Modifying the file should reimport the module
+        task_file.write(dedent("""
+        with open("imports.txt", "a") as f:
+            f.write("imported\\n")
+
+        def main():
+            return 'second version'
+        """))
+        task1()
+        task2()
+        assert count_imports() == 2
+        assert session.returns[task1] == 'second version'
+
+        # Explicit invalidation
+        clear_module_cache("mytasks/myfile.py")
+        task1()
+        assert count_imports() == 3
+
+
+def test_module_written_while_imported(tmpdir, session):
+    task_dir = tmpdir.mkdir("mytasks")
+    task_file = task_dir.join("myfile.py")
+    # The file is modified in the middle of the import
+    task_file.write(dedent("""
+    with open(__file__, "w") as f:
+        f.write("def main():\\n    return 'second version'\\n")
+
+    def main():
+        return 'first'
+    """))
+
+    with tmpdir.as_cwd() as old_dir:
+        task = FuncTask(func_name="main", path="mytasks/myfile.py", name="a task", execution="main")
+        task()
+        task()
+        assert session.returns[task] == 'second version'
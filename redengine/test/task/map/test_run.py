@@ -0,0 +1,72 @@
+import logging
+
+import pytest
+
+from redengine.args import Return
+from redengine.exc import MapTaskException
+from redengine.tasks import FuncTask, MapTask
+
+def double(item):
+    return item * 2
+
+def fail_odd(item):
+    if item % 2:
+        raise ValueError(f"Odd item: {item}")
+    return item
+
+def get_items():
+    return list(range(10))
+
+@pytest.mark.parametrize("map_execution", ["thread", "process"])
+def test_run(session, map_execution):
+    task = MapTask(
+        double, name="map", execution="main", map_arg="item",
+        map_execution=map_execution, chunk_size=3, max_in_flight=2,
+        parameters={"item": range(10)}
+    )
+    task()
+    assert task.status == "success"
+    assert session.returns[task] == [item * 2 for item in range(10)]
+
+def test_upstream(session):
+    upstream = FuncTask(get_items, name="upstream", execution="main")
+    task = MapTask(
+        double, name="map", execution="thread", map_arg="item", map_execution="thread",
+        parameters={"item": Return("upstream")}
+    )
+    upstream()
+    task()
+    session.scheduler.wait_task_alive()
+    assert task.status == "success"
+    assert session.returns[task] == [item * 2 for item in range(10)]
+
+def test_failure(session):
+    task = MapTask(
+        fail_odd, name="map", execution="main", map_arg="item",
+        map_execution="thread", chunk_size=2,
+        parameters={"item": range(10)}
+    )
+    task()
+    assert task.status == "fail"
+
+    with pytest.raises(MapTaskException) as exc_info:
+        task.execute(item=range(10))
+
+    # Each chunk has one odd item
+    exc = exc_info.value
+    assert sorted(exc.failures) == [0, 1, 2, 3, 4]
+    assert exc.results == {}
+    assert isinstance(exc.__cause__, ValueError)
+
+def test_progress(session, caplog):
+    task = MapTask(
+        double, name="map", execution="main", map_arg="item",
+        map_execution="thread", chunk_size=4,
+        parameters={"item": range(10)}
+    )
+    with caplog.at_level(logging.INFO, logger="redengine.map"):
+        task()
+    records = [record for record in caplog.records if record.name == "redengine.map"]
+    assert [record.task_name for record in records] == ["map"] * 4
+    assert records[-2].getMessage() == "Task 'map' progress: 3 chunks (10 items) finished, 0 failed, 0 running"
+    assert all(record.run_id == task.run_id for record in records)
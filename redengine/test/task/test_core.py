@@ -1,6 +1,9 @@
 
+import logging
 import pickle
 import pytest
+from redengine.conditions import TaskSucceeded
+from redengine.time import TimeOfDay
 from redengine.core import Task
 from redengine.core.condition.base import AlwaysFalse, AlwaysTrue, BaseCondition
 
@@ -26,8 +29,79 @@ def test_set_invalid_status(session):
     with pytest.raises(ValueError):
         task.status = "not valid"
 
+    with pytest.raises(ValueError):
+        DummyTask(name="other", status="not valid")
+    assert "other" not in session
+
+def test_runtime_state(session):
+    task = DummyTask(name="mytest", force_run=True)
+    assert task.force_run
+    assert task.status is None
+    assert "force_run" not in task.__fields__
+
+    task.status = "run"
+    task.force_run = False
+    assert task.status == "run"
+    assert not task.force_run
+
+    # Runtime state is included in dumps
+    data = task.dict(exclude={'session'})
+    assert data["status"] == "run"
+    assert data["force_run"] is False
+    assert data["last_run"] is None
+    assert "status" not in task.dict(exclude={'session', 'status'})
+
+def test_copy_runtime_state(session):
+    task = DummyTask(name="mytest", force_run=True)
+    task.status = "run"
+    for copied in (task.copy(), task.copy(deep=True)):
+        assert copied.status == "run"
+        assert copied.force_run
+        copied.status = "fail"
+        assert task.status == "run"
+
 def test_pickle(session):
     task_1 = DummyTask(name="mytest")
     pkl_obj = pickle.dumps(task_1)
     task_2 = pickle.loads(pkl_obj)
-    assert task_1.name == task_2.name
\ No newline at end of file
+    assert task_1.name == task_2.name
+
+def test_pickle_runtime_state(session):
+    task_1 = DummyTask(name="mytest", force_run=True)
+    task_1.status = "fail"
+    task_2 = pickle.loads(pickle.dumps(task_1))
+    assert task_2.force_run
+    assert task_2.status == "fail"
+
+def test_shared_condition(session):
+    task_1 = DummyTask(name="task 1", start_cond="daily")
+    task_2 = DummyTask(name="task 2", start_cond="daily")
+
+    # Parsed once, statements copied but the period is shared
+    assert task_1.start_cond is not task_2.start_cond
+    assert task_1.start_cond.period is task_2.start_cond.period
+    assert task_1.start_cond.kwargs["task"] is task_1
+    assert task_2.start_cond.kwargs["task"] is task_2
+
+def test_logger_cached(session):
+    task = DummyTask(name="mytest")
+    logger = task.logger
+    assert task.logger is logger
+
+    # Changing the handlers creates new adapter
+    logging.getLogger(task.logger_name).addHandler(logging.NullHandler())
+    assert task.logger is not logger
+    logger = task.logger
+    assert task.logger is logger
+
+    task.logger_name = "redengine.task.other"
+    assert task.logger is not logger
+    assert task.logger.logger.name == "redengine.task.other"
+
+def test_period_cached(session):
+    task = DummyTask(name="mytest", start_cond=TaskSucceeded(period=TimeOfDay("10:00", "12:00")))
+    assert task.period is task.period
+    assert task.period == TimeOfDay("10:00", "12:00")
+
+    task.start_cond = TaskSucceeded(period=TimeOfDay("12:00", "14:00"))
+    assert task.period == TimeOfDay("12:00", "14:00")
@@ -0,0 +1,35 @@
+import os
+import tracemalloc
+
+import pytest
+
+from redengine.tasks import FuncTask
+
+def do_nothing():
+    ...
+
+@pytest.mark.skipif(
+    not os.environ.get("REDENGINE_BENCHMARK"), 
+    reason="Benchmark. Set env var REDENGINE_BENCHMARK to run"
+)
+@pytest.mark.parametrize("n_tasks", [
+    pytest.param(10_000, id="10k"),
+    pytest.param(100_000, id="100k"),
+])
+def test_memory_per_task(session, n_tasks):
+    "Benchmark the memory used by a task"
+    tracemalloc.start()
+    try:
+        mem_start, _ = tracemalloc.get_traced_memory()
+        tasks = [
+            FuncTask(do_nothing, name=f"task {i}", start_cond="daily", execution="main") 
+            for i in range(n_tasks)
+        ]
+        mem_end, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    
+    bytes_per_task = (mem_end - mem_start) / n_tasks
+    print(f"Memory per task ({n_tasks} tasks): {bytes_per_task:.0f} bytes")
+    assert len(session.tasks) == n_tasks
+    assert bytes_per_task < 3000
@@ -1,22 +1,24 @@
-
-from typing import TYPE_CHECKING, DefaultDict, List, Optional, Union
+import datetime
+from collections import deque
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Set, Tuple, Type, Union
 
 from pydantic import BaseModel
-from redengine._base import RedBase
-from redengine.conditions import Any, All, DependFinish, DependSuccess
-from redengine.conditions.task import DependFailure
+
 from redengine.core import Task
-from redengine.core.condition.base import BaseCondition
+from redengine.core.condition.base import BaseCondition, All, Any, _ConditionContainer
 
 from redengine import Session
 
+if TYPE_CHECKING:
+    from redengine.conditions import DependFailure, DependFinish, DependSuccess
+
 class Link:
 
-    def __init__(self, 
-                 parent: Task, 
-                 child: Task, 
-                 relation: Optional[Union[DependSuccess, DependFailure, DependFinish]]=None, 
-                 type: Optional[Union[Any, All]]=None):
+    def __init__(self,
+                 parent: Task,
+                 child: Task,
+                 relation: Optional[Type[Union['DependSuccess', 'DependFailure', 'DependFinish']]]=None,
+                 type: Optional[Type[Union[Any, All]]]=None):
         self.parent = parent
         self.child = child
         self.relation = relation
@@ -45,6 +47,250 @@ class Link:
     def __repr__(self):
         return f'Link({self.parent.name}, {self.child.name}, relation={getattr(self.relation, "__name__", None)}, type={getattr(self.type, "__name__", None)})'
 
+def iter_depends(cond:BaseCondition, container:type=None) -> Iterator[Tuple[str, type, Optional[type]]]:
+    """Iterate the dependency conditions (ie. ``after task 'a'``)
+    in a condition tree. Yields the name of the depended task,
+    the type of the condition and the type of the nearest
+    ``Any``/``All`` containing it."""
+    from redengine.conditions.task.utils import DependMixin
+    if isinstance(cond, DependMixin):
+        depend_task = cond.kwargs["depend_task"]
+        yield getattr(depend_task, "name", depend_task), type(cond), container
+    elif isinstance(cond, _ConditionContainer):
+        if isinstance(cond, (Any, All)):
+            container = type(cond)
+        for subcond in cond:
+            yield from iter_depends(subcond, container)
+
+class DependencyGraph:
+    """Index of the dependencies between the tasks
+    of a session (``session.graph``).
+
+    The tasks are nodes (by name) and the dependency
+    conditions in their start conditions (at any depth
+    of the condition tree) are the edges from the depended
+    task (parent) to the task (child). The index is
+    updated as the tasks are added, removed, renamed or
+    their start conditions are set thus the parents and
+    the children of a task are looked up in constant time.
+
+    Conditions modified in place are not noticed: call
+    ``update_task`` or ``rebuild`` after such changes.
+    """
+
+    def __init__(self, session:Session=None):
+        self.session = session
+        # child -> {parent: [(relation, container type)]}
+        self._parents: Dict[str, Dict[str, List[Tuple[type, Optional[type]]]]] = {}
+        # parent -> set of children
+        self._children: Dict[str, Set[str]] = {}
+        self._order = None
+
+    def update_task(self, task:Task):
+        "Index (again) the dependencies of a task"
+        self._remove_parents(task.name)
+        parents = {}
+        for parent, relation, container in iter_depends(task.start_cond):
+            parents.setdefault(parent, []).append((relation, container))
+        if parents:
+            self._parents[task.name] = parents
+            for parent in parents:
+                self._children.setdefault(parent, set()).add(task.name)
+        self._order = None
+
+    def remove_task(self, name:str):
+        """Remove the dependencies of a task. The links
+        to its children are kept as they still depend on it."""
+        self._remove_parents(name)
+        self._order = None
+
+    def rename_task(self, old_name:str, task:Task):
+        "Move the dependencies of a renamed task"
+        self._remove_parents(old_name)
+        self.update_task(task)
+
+    def rebuild(self):
+        "Index all of the tasks of the session"
+        self._parents = {}
+        self._children = {}
+        self._order = None
+        for task in self.session.tasks:
+            self.update_task(task)
+
+    def _remove_parents(self, name:str):
+        for parent in self._parents.pop(name, {}):
+            children = self._children.get(parent)
+            if children is not None:
+                children.discard(name)
+                if not children:
+                    del self._children[parent]
+
+    def get_parents(self, name:str) -> Set[str]:
+        "Get the names of the tasks the task depends on"
+        return set(self._parents.get(name, ()))
+
+    def get_children(self, name:str) -> Set[str]:
+        "Get the names of the tasks depending on the task"
+        return self._children.get(name, set())
+
+    @property
+    def nodes(self) -> Set[str]:
+        "set: Names of the tasks in the graph"
+        nodes = set(self._parents) | set(self._children)
+        if self.session is not None:
+            nodes |= {task.name for task in self.session.tasks}
+        return nodes
+
+    def __iter__(self) -> Iterator[Link]:
+        """Iterate the links between the tasks. Links to
+        tasks that are not in the session are skipped."""
+        session = self.session
+        for child, parents in self._parents.items():
+            if child not in session:
+                continue
+            for parent, relations in parents.items():
+                if parent not in session:
+                    # Removed but its children still depend on it
+                    continue
+                for relation, container in relations:
+                    yield Link(session[parent], session[child], relation=relation, type=container)
+
+    def get_order(self) -> Dict[str, int]:
+        """Get the positions of the tasks in a topological
+        order (parents before children). Tasks in cycles
+        are put last."""
+        if self._order is None:
+            order = {}
+            nodes = sorted(self.nodes)
+            n_parents = {node: len(self._parents.get(node, ())) for node in nodes}
+            queue = deque(node for node in nodes if n_parents[node] == 0)
+            while queue:
+                node = queue.popleft()
+                order[node] = len(order)
+                for child in sorted(self._children.get(node, ())):
+                    n_parents[child] -= 1
+                    if n_parents[child] == 0:
+                        queue.append(child)
+            for node in nodes:
+                if node not in order:
+                    order[node] = len(order)
+            self._order = order
+        return self._order
+
+    def topological_order(self) -> List[str]:
+        """Get the names of the tasks in a topological
+        order (parents before children)."""
+        order = self.get_order()
+        return sorted(order, key=order.__getitem__)
+
+    def find_cycle(self) -> Optional[List[str]]:
+        """Find a dependency cycle. Returns the names
+        of the tasks in the cycle (the first is repeated
+        last) or None if the graph is acyclic."""
+        visited = set()
+        for start in sorted(self.nodes):
+            if start in visited:
+                continue
+            path = []
+            on_path = {}
+            stack = [(start, iter(sorted(self._children.get(start, ()))))]
+            visited.add(start)
+            on_path[start] = 0
+            path.append(start)
+            while stack:
+                node, children = stack[-1]
+                for child in children:
+                    if child in on_path:
+                        return path[on_path[child]:] + [child]
+                    if child not in visited:
+                        visited.add(child)
+                        on_path[child] = len(path)
+                        path.append(child)
+                        stack.append((child, iter(sorted(self._children.get(child, ())))))
+                        break
+                else:
+                    stack.pop()
+                    del on_path[path.pop()]
+        return None
+
+    def has_cycle(self) -> bool:
+        "Whether the dependencies have a cycle"
+        return self.find_cycle() is not None
+
+    def get_runtime(self, name:str) -> float:
+        """Get the expected runtime of a task (seconds)
+        from the runtimes of its previous runs in the logs
+        or from the latest run."""
+        task = self.session[name] if name in self.session else None
+        if task is None:
+            return 0.0
+        if task.logger.is_readable:
+            runtimes = []
+            for record in task.logger.get_records(action="success"):
+                runtime = record.get("runtime") if isinstance(record, dict) else getattr(record, "runtime", None)
+                if isinstance(runtime, datetime.timedelta):
+                    runtimes.append(runtime.total_seconds())
+                elif isinstance(runtime, (int, float)):
+                    runtimes.append(float(runtime))
+            if runtimes:
+                return sum(runtimes) / len(runtimes)
+        last_run, last_success = task.last_run, task.last_success
+        if last_run is not None and last_success is not None and last_success >= last_run:
+            return (last_success - last_run).total_seconds()
+        return 0.0
+
+    def critical_path(self, runtimes:Dict[str, float]=None) -> Tuple[List[str], float]:
+        """Get the longest chain of dependent tasks
+        by the expected runtimes.
+
+        Parameters
+        ----------
+        runtimes : dict, optional
+            Runtimes (seconds) of the tasks. By default
+            the historical runtimes (see ``get_runtime``).
+
+        Returns
+        -------
+        list of str, float
+            Names of the tasks in the path and the
+            total runtime of it.
+        """
+        if runtimes is None:
+            runtimes = {}
+        order = self.topological_order()
+        cycle = self.find_cycle()
+        in_cycle = set(cycle) if cycle is not None else set()
+
+        finish = {}
+        previous = {}
+        for node in order:
+            if node in in_cycle:
+                continue
+            runtime = runtimes[node] if node in runtimes else self.get_runtime(node)
+            start = 0.0
+            for parent in self._parents.get(node, ()):
+                if parent in finish and finish[parent] > start:
+                    start = finish[parent]
+                    previous[node] = parent
+            finish[node] = start + runtime
+        if not finish:
+            return [], 0.0
+
+        node = max(finish, key=finish.__getitem__)
+        total = finish[node]
+        path = [node]
+        while node in previous:
+            node = previous[node]
+            path.append(node)
+        return path[::-1], total
+
+    def __getstate__(self):
+        # The index is rebuilt where needed
+        return {"session": None}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
 class Dependencies(BaseModel):
     class Config:
         arbitrary_types_allowed = True
@@ -55,23 +301,8 @@ class Dependencies(BaseModel):
         super().__init__(session=session, **kwargs)
 
     def __iter__(self):
-        for task in self.session.tasks:
-            yield from self._get_links(task)
-
-    def _get_links(self, task:Task) -> Union[Any, All]:
-        cond = task.start_cond
-        if isinstance(cond, (Any, All)):
-            for subcond in cond:
-                if isinstance(subcond, (DependFinish, DependSuccess, DependFailure)):
-                    req_task = subcond.kwargs['depend_task']
-                    req_task = self.session.get_task(req_task)
-                    yield Link(parent=req_task, child=task, relation=type(subcond), type=type(cond))
-        elif isinstance(cond, (DependFinish, DependSuccess, DependFailure)):
-            req_task = cond.kwargs['depend_task']
-            req_task = self.session.get_task(req_task)
-            yield Link(req_task, task, relation=type(cond))
-
+        yield from self.session.graph
 
 def get_dependencies(session) -> List[Link]:
     "Get list of dependency links"
-    return list(Dependencies(session))
\ No newline at end of file
+    return list(Dependencies(session))
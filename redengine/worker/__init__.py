@@ -0,0 +1,5 @@
+"""Remote workers running the tasks of a scheduler
+on other hosts (``execution='remote'``)."""
+
+from .server import WorkerServer, RemoteRun
+from .agent import Worker
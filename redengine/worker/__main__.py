@@ -0,0 +1,44 @@
+import argparse
+import logging
+import multiprocessing
+import signal
+import sys
+
+from redengine.worker.agent import Worker
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m redengine.worker",
+        description="Run the tasks sent by a Red Engine scheduler."
+    )
+    parser.add_argument("address", help="Address of the scheduler: host:port or path of a Unix socket")
+    parser.add_argument("--capacity", type=int, default=None, help="Maximum number of runs at the same time (default: number of CPUs)")
+    parser.add_argument("--id", dest="worker_id", default=None, help="Identifier of the worker (default: host name and process id)")
+    parser.add_argument("--heartbeat", type=float, default=1.0, help="Seconds between heartbeats (default: 1)")
+    parser.add_argument("--no-reconnect", dest="reconnect", action="store_false", help="Exit if the connection to the scheduler is lost")
+    parser.add_argument("--start-method", default=None, choices=multiprocessing.get_all_start_methods(), help="Start method of the processes of the runs")
+    parser.add_argument("--path", action="append", default=[], help="Directory added to the Python path (to import the tasks)")
+    parser.add_argument("--log-level", default="INFO", help="Logging level of the worker (default: INFO)")
+    parser.add_argument("--authkey-file", default=None, help="File containing the shared secret of the scheduler (default: environment variable REDENGINE_WORKER_AUTHKEY)")
+    args = parser.parse_args(args)
+
+    sys.path[:0] = args.path
+    logging.basicConfig(level=args.log_level, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    authkey = None
+    if args.authkey_file is not None:
+        with open(args.authkey_file, "rb") as file:
+            authkey = file.read().strip()
+
+    worker = Worker(
+        args.address, capacity=args.capacity, worker_id=args.worker_id, heartbeat=args.heartbeat,
+        reconnect=args.reconnect, start_method=args.start_method, authkey=authkey
+    )
+    signal.signal(signal.SIGTERM, lambda signum, frame: worker.stop())
+    try:
+        worker.run()
+    except KeyboardInterrupt:
+        worker.stop()
+
+if __name__ == "__main__":
+    main()
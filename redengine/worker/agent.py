@@ -0,0 +1,206 @@
+import logging
+import multiprocessing
+import os
+import pickle
+import socket
+import threading
+import traceback
+from typing import Optional, Tuple, Union
+
+from redengine.worker.protocol import authenticate, connect, get_authkey, recv_msg, send_msg
+
+def _run_task(run_id:str, task_name:str, payload:bytes, queue):
+    "Run a task sent by the scheduler (in the process of the run)"
+    try:
+        task, params, direct_params, exec_hooks = pickle.loads(payload)
+    except Exception:
+        # Ie. the module of the task is not importable on the worker
+        message = f"Task '{task_name}' crashed in unpickling on worker:\n{traceback.format_exc()}"
+        record = logging.LogRecord(
+            name="redengine.worker", level=logging.CRITICAL,
+            pathname=__file__, lineno=0, msg=message, args=None, exc_info=None
+        )
+        record.message = message
+        record.task_name = task_name
+        record.action = "fail"
+        record.run_id = run_id
+        queue.put(record)
+        return
+    task._run_as_process(params, direct_params, queue, None, exec_hooks)
+
+class Worker:
+    """Agent that runs tasks sent by a scheduler.
+
+    The worker connects to the ``WorkerServer`` of
+    the scheduler and runs each task it receives in
+    a new process. The log records of the runs, including
+    the return values, are sent back to the scheduler.
+    The worker sends heartbeats so that the scheduler
+    notices if the worker is lost. Usually started
+    from the command line:
+
+    .. code-block:: console
+
+        python -m redengine.worker scheduler-host:8765 --capacity 4
+
+    The tasks are unpickled on the worker thus the
+    modules of the tasks must be importable there.
+    The worker and the scheduler prove to each other
+    that they know the shared authkey before anything
+    is unpickled (see ``WorkerServer``).
+
+    Parameters
+    ----------
+    address : str, tuple
+        Address of the scheduler: ``host:port``, a tuple
+        of host and port or a path of a Unix socket.
+    capacity : int, optional
+        Maximum number of runs at the same time, by
+        default the number of CPUs.
+    worker_id : str, optional
+        Identifier of the worker, by default created
+        from the host name and the process id.
+    heartbeat : float
+        Seconds between heartbeats, by default 1.
+    reconnect : bool
+        Whether to reconnect if the connection to the
+        scheduler is lost (or cannot be opened), by
+        default True.
+    retry_interval : float
+        Seconds between the connection attempts, by
+        default 1.
+    start_method : str, optional
+        Start method of the processes of the runs,
+        by default the default of multiprocessing.
+    authkey : str, bytes, optional
+        Shared secret of the scheduler, by default
+        the environment variable ``REDENGINE_WORKER_AUTHKEY``.
+    """
+
+    def __init__(self, address:Union[str, Tuple[str, int]], capacity:int=None, worker_id:str=None,
+                 heartbeat:float=1.0, reconnect:bool=True, retry_interval:float=1.0, start_method:str=None,
+                 authkey:Union[str, bytes]=None):
+        self.address = address
+        self.capacity = capacity if capacity is not None else os.cpu_count() or 1
+        self.worker_id = worker_id if worker_id is not None else f"{socket.gethostname()}:{os.getpid()}"
+        self.heartbeat = heartbeat
+        self.reconnect = reconnect
+        self.retry_interval = retry_interval
+        self.start_method = start_method
+        self.authkey = get_authkey(authkey)
+        if not self.authkey:
+            raise ValueError("Authkey is required (pass authkey or set REDENGINE_WORKER_AUTHKEY)")
+        self.logger = logging.getLogger("redengine.worker")
+
+        self._stop = threading.Event()
+        self._sock: Optional[socket.socket] = None
+
+    def run(self):
+        "Connect to the scheduler and run the tasks till stopped"
+        while not self._stop.is_set():
+            try:
+                sock = connect(self.address, timeout=self.retry_interval)
+            except OSError:
+                if not self.reconnect:
+                    raise
+                self._stop.wait(self.retry_interval)
+                continue
+            self.logger.info(f"Connected to {self.address}")
+            try:
+                self._serve(sock)
+            finally:
+                sock.close()
+            if not self.reconnect:
+                break
+            self.logger.info(f"Disconnected from {self.address}")
+
+    def stop(self):
+        "Stop the worker (the running tasks are terminated)"
+        self._stop.set()
+        sock = self._sock
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def _serve(self, sock:socket.socket):
+        "Run the tasks sent over the connection till it closes"
+        self._sock = sock
+        # Nothing is unpickled before the scheduler is authenticated
+        sock.settimeout(max(self.heartbeat, self.retry_interval) * 10)
+        authenticate(sock, self.authkey, server=False)
+        sock.settimeout(None)
+        send_lock = threading.Lock()
+        disconnected = threading.Event()
+
+        def send(msg):
+            with send_lock:
+                send_msg(sock, msg)
+
+        ctx = multiprocessing.get_context(self.start_method)
+        records = ctx.Queue()
+        processes = {}
+        monitors = []
+
+        def forward():
+            # The records and the exits of the runs are
+            # sent in the order they were put to the queue
+            while True:
+                item = records.get()
+                if item is None:
+                    break
+                msg = item if isinstance(item, tuple) else ("record", item)
+                try:
+                    send(msg)
+                except OSError:
+                    disconnected.set()
+
+        def beat():
+            while not disconnected.wait(self.heartbeat):
+                try:
+                    send(("heartbeat",))
+                except OSError:
+                    disconnected.set()
+
+        def monitor(run_id, process):
+            process.join()
+            # The records of the run are in the queue before its exit
+            processes.pop(run_id, None)
+            records.put(("exit", run_id))
+
+        forwarder = threading.Thread(target=forward, name="redengine-worker-forward", daemon=True)
+        forwarder.start()
+        try:
+            send(("hello", {"worker_id": self.worker_id, "capacity": self.capacity, "host": socket.gethostname()}))
+            threading.Thread(target=beat, name="redengine-worker-heartbeat", daemon=True).start()
+            while not disconnected.is_set():
+                try:
+                    msg = recv_msg(sock)
+                except (EOFError, OSError):
+                    break
+                if msg[0] == "run":
+                    _, run_id, task_name, payload = msg
+                    self.logger.info(f"Running task '{task_name}' (run '{run_id}')")
+                    process = ctx.Process(target=_run_task, args=(run_id, task_name, payload, records))
+                    process.start()
+                    processes[run_id] = process
+                    thread = threading.Thread(target=monitor, args=(run_id, process), daemon=True)
+                    thread.start()
+                    monitors.append(thread)
+                elif msg[0] == "terminate":
+                    process = processes.get(msg[1])
+                    if process is not None:
+                        self.logger.info(f"Terminating run '{msg[1]}'")
+                        process.terminate()
+        finally:
+            disconnected.set()
+            self._sock = None
+            # The scheduler reassigns the runs left
+            for process in list(processes.values()):
+                process.terminate()
+            for thread in monitors:
+                thread.join()
+            records.put(None)
+            forwarder.join()
+            records.close()
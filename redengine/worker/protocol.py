@@ -0,0 +1,153 @@
+"""Wire protocol between the scheduler (WorkerServer)
+and the workers.
+
+The messages are tuples pickled and prefixed by their
+length (4 bytes, big endian). The scheduler sends:
+
+- ``("run", run_id, task_name, payload)``: run a task. The
+  payload is the pickled task, parameters and execution hooks.
+- ``("terminate", run_id)``: terminate a run.
+
+The worker sends:
+
+- ``("hello", info)``: the identifier and the capacity
+  of the worker (sent first).
+- ``("heartbeat",)``: the worker is alive.
+- ``("record", record)``: log record of a run.
+- ``("exit", run_id)``: the run has ended and all of
+  its records are sent.
+
+Trust model: the messages are pickles thus unpickling
+a message from a peer allows the peer to run arbitrary
+code. Therefore both ends first prove that they know
+the shared secret (authkey) with HMAC challenges and
+nothing is unpickled before that. The connection is
+not encrypted: use it on trusted networks or tunnel
+it (ie. SSH or VPN) and keep the authkey secret.
+"""
+
+import hashlib
+import hmac
+import os
+import pickle
+import socket
+import struct
+from multiprocessing import AuthenticationError
+from typing import Any, Optional, Tuple, Union
+
+_HEADER = struct.Struct(">I")
+
+# Environment variable of the shared secret
+AUTHKEY_ENV = "REDENGINE_WORKER_AUTHKEY"
+
+_NONCE_SIZE = 32
+_MAX_AUTH_SIZE = 256
+_AUTH_OK = b"#OK"
+_AUTH_FAIL = b"#FAIL"
+
+def parse_address(address:Union[str, Tuple[str, int]]) -> Tuple[int, Any]:
+    """Get the socket family and the address.
+
+    The address is a path of a Unix socket (with prefix
+    ``unix:`` or containing ``/``), ``host:port`` or
+    a tuple of host and port."""
+    if isinstance(address, tuple):
+        return socket.AF_INET, address
+    address = str(address)
+    if address.startswith("unix:"):
+        return socket.AF_UNIX, address[len("unix:"):]
+    elif "/" in address:
+        return socket.AF_UNIX, address
+    host, _, port = address.rpartition(":")
+    return socket.AF_INET, (host or "127.0.0.1", int(port))
+
+def format_address(family:int, address) -> str:
+    "Format the address so that it can be passed to the workers"
+    if family == socket.AF_UNIX:
+        return f"unix:{address}"
+    host, port = address[:2]
+    return f"{host}:{port}"
+
+def connect(address:Union[str, Tuple[str, int]], timeout:float=None) -> socket.socket:
+    "Connect to the scheduler"
+    family, addr = parse_address(address)
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(addr)
+    except OSError:
+        sock.close()
+        raise
+    sock.settimeout(None)
+    return sock
+
+def get_authkey(authkey:Union[str, bytes]=None) -> Optional[bytes]:
+    """Get the shared secret as bytes (by default
+    from the environment variable ``REDENGINE_WORKER_AUTHKEY``)"""
+    if authkey is None:
+        authkey = os.environ.get(AUTHKEY_ENV)
+    if authkey is None:
+        return None
+    return authkey.encode("utf-8") if isinstance(authkey, str) else bytes(authkey)
+
+def _send_bytes(sock:socket.socket, data:bytes):
+    sock.sendall(_HEADER.pack(len(data)) + data)
+
+def _recv_bytes(sock:socket.socket, max_size:int) -> bytes:
+    size, = _HEADER.unpack(_recv_exact(sock, _HEADER.size))
+    if size > max_size:
+        raise AuthenticationError("Invalid authentication message")
+    return _recv_exact(sock, size)
+
+def _digest(authkey:bytes, nonce:bytes) -> bytes:
+    return hmac.new(authkey, b"redengine-worker:" + nonce, hashlib.sha256).digest()
+
+def _deliver_challenge(sock:socket.socket, authkey:bytes):
+    nonce = os.urandom(_NONCE_SIZE)
+    _send_bytes(sock, nonce)
+    response = _recv_bytes(sock, _MAX_AUTH_SIZE)
+    if not hmac.compare_digest(response, _digest(authkey, nonce)):
+        _send_bytes(sock, _AUTH_FAIL)
+        raise AuthenticationError("Peer does not know the authkey")
+    _send_bytes(sock, _AUTH_OK)
+
+def _answer_challenge(sock:socket.socket, authkey:bytes):
+    nonce = _recv_bytes(sock, _MAX_AUTH_SIZE)
+    _send_bytes(sock, _digest(authkey, nonce))
+    if _recv_bytes(sock, _MAX_AUTH_SIZE) != _AUTH_OK:
+        raise AuthenticationError("Authkey was rejected by the peer")
+
+def authenticate(sock:socket.socket, authkey:bytes, server:bool):
+    """Authenticate both ends of a connection with the
+    shared secret (raises AuthenticationError if either
+    end does not know it). Must be done before any
+    message is received."""
+    if not authkey:
+        raise ValueError("Authkey is required")
+    if server:
+        _deliver_challenge(sock, authkey)
+        _answer_challenge(sock, authkey)
+    else:
+        _answer_challenge(sock, authkey)
+        _deliver_challenge(sock, authkey)
+
+def send_msg(sock:socket.socket, msg:tuple):
+    "Send a message"
+    data = pickle.dumps(msg)
+    sock.sendall(_HEADER.pack(len(data)) + data)
+
+def recv_msg(sock:socket.socket) -> tuple:
+    """Receive a message (raises EOFError if the connection closed).
+    Only for authenticated connections (see ``authenticate``)."""
+    size, = _HEADER.unpack(_recv_exact(sock, _HEADER.size))
+    return pickle.loads(_recv_exact(sock, size))
+
+def _recv_exact(sock:socket.socket, size:int) -> bytes:
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 1 << 20))
+        if not chunk:
+            raise EOFError("Connection closed")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
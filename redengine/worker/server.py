@@ -0,0 +1,418 @@
+import logging
+import os
+import pickle
+import queue
+import secrets
+import socket
+import threading
+import time
+from collections import deque
+from multiprocessing import AuthenticationError
+from typing import TYPE_CHECKING, Dict, List, Tuple, Union
+
+from redengine.worker.protocol import authenticate, format_address, get_authkey, parse_address, recv_msg, send_msg
+
+if TYPE_CHECKING:
+    from redengine.core import Task, Parameters
+
+class RemoteRun:
+    """Handle of a run of a task on a worker.
+
+    The run is alive from the submission till
+    the worker reports that the run has ended
+    (or it is terminated)."""
+
+    def __init__(self, server:'WorkerServer', run_id:str, task_name:str, payload:bytes):
+        self.server = server
+        self.run_id = run_id
+        self.task_name = task_name
+        self.payload = payload
+        self.worker_id = None
+        self.n_assigned = 0
+        self.terminating = False
+        self._done = threading.Event()
+
+    def is_alive(self) -> bool:
+        "Whether the run is waiting for a worker or running"
+        return not self._done.is_set()
+
+    def wait(self, timeout:float=None) -> bool:
+        "Wait till the run has ended"
+        return self._done.wait(timeout)
+
+    def terminate(self, timeout:float=None):
+        "Terminate the run and wait till it has ended"
+        self.server.terminate(self, timeout=timeout)
+
+class _WorkerConn:
+    "Connection to a worker"
+
+    def __init__(self, sock:socket.socket, info:dict):
+        self.sock = sock
+        self.worker_id = info["worker_id"]
+        self.capacity = info["capacity"]
+        self.host = info.get("host")
+        self.runs = {}
+        self.last_seen = time.monotonic()
+
+    @property
+    def n_free(self) -> int:
+        return self.capacity - len(self.runs)
+
+class WorkerServer:
+    """Server the remote workers connect to.
+
+    The tasks with ``execution='remote'`` are sent
+    to the workers (see ``python -m redengine.worker``)
+    that run them in their own processes and stream
+    the log records (and the return values) back. The
+    records are put to ``queue`` which the scheduler
+    handles like the records of the process tasks.
+
+    The runs wait in a backlog till a worker has free
+    capacity. If a worker is lost (the connection is
+    closed or the worker has not sent heartbeats in
+    ``heartbeat_timeout`` seconds), its runs are
+    reassigned to the other workers.
+
+    Parameters
+    ----------
+    address : str, tuple
+        Address to listen: ``host:port``, a tuple of
+        host and port or a path of a Unix socket
+        (``unix:/path/to/socket``). If the port is 0,
+        a free port is chosen and ``address`` is
+        updated as the server starts.
+    heartbeat_timeout : float
+        Seconds without messages after which a worker
+        is considered lost, by default 10.
+    reassign : bool
+        Whether the runs of a lost worker are run
+        again on other workers. If False, the runs
+        are logged as failed, by default True.
+    authkey : str, bytes, optional
+        Shared secret the workers must know. By default
+        the environment variable ``REDENGINE_WORKER_AUTHKEY``
+        or, if not set, a random key (see ``authkey``).
+
+    Notes
+    -----
+    The tasks and the log records are sent as pickles
+    thus anyone who can connect without the authkey
+    could run code on the scheduler (and a fake scheduler
+    on the workers). The workers and the server prove
+    they know the authkey before anything is unpickled.
+    The traffic is not encrypted thus use trusted networks
+    or tunnels and listen only on the interfaces needed.
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        import os
+        from redengine.worker import WorkerServer
+
+        session.config.worker_server = WorkerServer(
+            "10.0.0.5:8765", authkey=os.environ["REDENGINE_WORKER_AUTHKEY"]
+        )
+
+    And on the hosts of the workers (with the same
+    ``REDENGINE_WORKER_AUTHKEY`` in the environment):
+
+    .. code-block:: console
+
+        python -m redengine.worker 10.0.0.5:8765
+    """
+
+    def __init__(self, address:Union[str, Tuple[str, int]]="127.0.0.1:0", heartbeat_timeout:float=10, reassign:bool=True,
+                 authkey:Union[str, bytes]=None):
+        self.address = address
+        authkey = get_authkey(authkey)
+        self.authkey = authkey if authkey is not None else secrets.token_hex(32).encode("ascii")
+        self.heartbeat_timeout = heartbeat_timeout
+        self.reassign = reassign
+        self.logger = logging.getLogger("redengine.worker")
+        self.queue = queue.Queue()
+        self._init_runtime()
+
+    def _init_runtime(self):
+        self._sock = None
+        self._threads = []
+        self._workers: Dict[str, _WorkerConn] = {}
+        self._runs: Dict[str, RemoteRun] = {}
+        self._backlog = deque()
+        self._lock = threading.RLock()
+        self._closing = threading.Event()
+
+    @property
+    def is_started(self) -> bool:
+        "bool: Whether the server is listening"
+        return self._sock is not None
+
+    @property
+    def workers(self) -> List[str]:
+        "list of str: Identifiers of the connected workers"
+        with self._lock:
+            return list(self._workers)
+
+    @property
+    def n_free(self) -> int:
+        "int: Number of runs the connected workers can take"
+        with self._lock:
+            return sum(max(worker.n_free, 0) for worker in self._workers.values()) - len(self._backlog)
+
+    def start(self):
+        "Start listening to the workers (if not already)"
+        with self._lock:
+            if self._sock is not None:
+                return
+            family, addr = parse_address(self.address)
+            if family == socket.AF_UNIX and os.path.exists(addr):
+                os.unlink(addr)
+            sock = socket.socket(family, socket.SOCK_STREAM)
+            if family != socket.AF_UNIX:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind(addr)
+            sock.listen()
+            # Timeout so that the accepting thread notices closing
+            sock.settimeout(0.2)
+            self.address = format_address(family, sock.getsockname())
+            self._sock = sock
+            self._closing.clear()
+            self._threads = [
+                threading.Thread(target=self._accept, args=(sock,), name="redengine-worker-server", daemon=True),
+                threading.Thread(target=self._monitor, name="redengine-worker-monitor", daemon=True),
+            ]
+            for thread in self._threads:
+                thread.start()
+        self.logger.info(f"Listening workers at {self.address}")
+
+    def close(self):
+        """Stop listening and disconnect the workers.
+        The runs not finished are logged as failed."""
+        with self._lock:
+            if self._sock is None:
+                return
+            self._closing.set()
+            sock = self._sock
+            self._sock = None
+            sock.close()
+            for worker in list(self._workers.values()):
+                self._drop_worker(worker)
+            while self._backlog:
+                self._fail_run(self._backlog.popleft(), "Worker server closed")
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        family, addr = parse_address(self.address)
+        if family == socket.AF_UNIX and os.path.exists(addr):
+            os.unlink(addr)
+
+    def wait_workers(self, n:int=1, timeout:float=None) -> bool:
+        "Wait till at least n workers have connected"
+        end = time.monotonic() + timeout if timeout is not None else None
+        while len(self.workers) < n:
+            if end is not None and time.monotonic() >= end:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def submit(self, task:'Task', params:'Parameters', direct_params:'Parameters', exec_hooks:list) -> RemoteRun:
+        """Send a run of a task to a worker (or to the
+        backlog if the workers are busy)."""
+        # Pickled here as the task may change before
+        # a worker is free
+        payload = pickle.dumps((task, params, direct_params, exec_hooks))
+        run = RemoteRun(self, task.run_id, task.name, payload)
+        self.start()
+        with self._lock:
+            self._runs[run.run_id] = run
+            self._backlog.append(run)
+            self._dispatch()
+        return run
+
+    def terminate(self, run:RemoteRun, timeout:float=None):
+        """Terminate a run and wait till the worker
+        has ended it (at most the timeout, by default
+        ``heartbeat_timeout``)."""
+        timeout = self.heartbeat_timeout if timeout is None else timeout
+        with self._lock:
+            if not run.is_alive():
+                return
+            run.terminating = True
+            if run.worker_id is None:
+                # Still in the backlog
+                self._backlog.remove(run)
+                self._end_run(run)
+                return
+            worker = self._workers[run.worker_id]
+            try:
+                send_msg(worker.sock, ("terminate", run.run_id))
+            except OSError:
+                self._drop_worker(worker)
+        if not run.wait(timeout):
+            # The worker did not respond in time
+            self.logger.warning(f"Worker '{run.worker_id}' did not end run '{run.run_id}' of task '{run.task_name}'")
+            with self._lock:
+                worker = self._workers.get(run.worker_id)
+                if worker is not None:
+                    worker.runs.pop(run.run_id, None)
+                self._end_run(run)
+
+    def _accept(self, sock:socket.socket):
+        while not self._closing.is_set():
+            try:
+                conn, _ = sock.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                # Closed
+                break
+            thread = threading.Thread(target=self._serve, args=(conn,), name="redengine-worker-conn", daemon=True)
+            thread.start()
+
+    def _serve(self, sock:socket.socket):
+        "Handle the messages of a worker"
+        try:
+            sock.settimeout(self.heartbeat_timeout)
+            # Nothing is unpickled from unauthenticated peers
+            authenticate(sock, self.authkey, server=True)
+            kind, info = recv_msg(sock)
+            sock.settimeout(None)
+            if kind != "hello":
+                raise ValueError(f"Expected hello, got: {kind}")
+        except AuthenticationError as exc:
+            self.logger.warning(f"Rejected a connection: {exc}")
+            sock.close()
+            return
+        except Exception:
+            self.logger.exception("Invalid handshake from a worker")
+            sock.close()
+            return
+
+        worker = _WorkerConn(sock, info)
+        with self._lock:
+            if self._closing.is_set():
+                sock.close()
+                return
+            if worker.worker_id in self._workers:
+                # Reconnected before the old connection was noticed closed
+                self._drop_worker(self._workers[worker.worker_id])
+            self._workers[worker.worker_id] = worker
+            self.logger.info(f"Worker '{worker.worker_id}' connected (capacity: {worker.capacity})")
+            self._dispatch()
+
+        try:
+            while True:
+                try:
+                    msg = recv_msg(sock)
+                except (EOFError, OSError):
+                    break
+                except Exception:
+                    # The message could not be unpickled (ie. the
+                    # return value of a task is not importable here)
+                    self.logger.exception(f"Invalid message from worker '{worker.worker_id}'")
+                    continue
+                worker.last_seen = time.monotonic()
+                if msg[0] == "record":
+                    self.queue.put(msg[1])
+                elif msg[0] == "exit":
+                    with self._lock:
+                        run = worker.runs.pop(msg[1], None)
+                        if run is not None:
+                            self._end_run(run)
+                            self._dispatch()
+        finally:
+            with self._lock:
+                self._drop_worker(worker)
+
+    def _monitor(self):
+        "Drop the workers that have stopped sending heartbeats"
+        interval = min(self.heartbeat_timeout / 4, 1)
+        while not self._closing.wait(interval):
+            now = time.monotonic()
+            with self._lock:
+                for worker in list(self._workers.values()):
+                    if now - worker.last_seen > self.heartbeat_timeout:
+                        self.logger.warning(f"Worker '{worker.worker_id}' has not sent heartbeats in {self.heartbeat_timeout} seconds")
+                        self._drop_worker(worker)
+
+    def _dispatch(self):
+        "Send the runs in the backlog to the workers with free capacity"
+        while self._backlog:
+            worker = max(self._workers.values(), key=lambda worker: worker.n_free, default=None)
+            if worker is None or worker.n_free <= 0:
+                break
+            run = self._backlog.popleft()
+            run.worker_id = worker.worker_id
+            run.n_assigned += 1
+            worker.runs[run.run_id] = run
+            try:
+                send_msg(worker.sock, ("run", run.run_id, run.task_name, run.payload))
+            except OSError:
+                # The run is put back to the backlog
+                self._drop_worker(worker)
+
+    def _drop_worker(self, worker:_WorkerConn):
+        "Disconnect a worker and reassign its runs"
+        if self._workers.get(worker.worker_id) is not worker:
+            # Already dropped
+            return
+        del self._workers[worker.worker_id]
+        try:
+            worker.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        worker.sock.close()
+
+        runs = list(worker.runs.values())
+        worker.runs.clear()
+        if self._closing.is_set():
+            self.logger.info(f"Worker '{worker.worker_id}' disconnected")
+        else:
+            self.logger.warning(f"Worker '{worker.worker_id}' lost with {len(runs)} runs")
+        for run in runs:
+            if run.terminating:
+                self._end_run(run)
+            elif self._closing.is_set() or not self.reassign:
+                self._fail_run(run, f"Worker '{worker.worker_id}' running the task was lost")
+            else:
+                self.logger.warning(f"Reassigning run '{run.run_id}' of task '{run.task_name}'")
+                run.worker_id = None
+                self._backlog.appendleft(run)
+        self._dispatch()
+
+    def _end_run(self, run:RemoteRun):
+        self._runs.pop(run.run_id, None)
+        run._done.set()
+
+    def _fail_run(self, run:RemoteRun, message:str):
+        "End a run that will not finish on a worker as failed"
+        record = logging.LogRecord(
+            name=self.logger.name, level=logging.CRITICAL,
+            pathname=__file__, lineno=0, msg=message, args=None, exc_info=None
+        )
+        record.message = message
+        record.task_name = run.task_name
+        record.action = "fail"
+        record.run_id = run.run_id
+        self.queue.put(record)
+        self._end_run(run)
+
+    def __getstate__(self):
+        # NOTE: The config (and the server) is pickled
+        # when a process task is started using spawn.
+        # The authkey is not passed on.
+        return {
+            "address": self.address,
+            "heartbeat_timeout": self.heartbeat_timeout,
+            "reassign": self.reassign,
+        }
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.authkey = None
+        self.logger = logging.getLogger("redengine.worker")
+        self.queue = queue.Queue()
+        self._init_runtime()
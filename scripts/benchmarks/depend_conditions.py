@@ -0,0 +1,93 @@
+"""Benchmark checking the dependency conditions.
+
+A DAG of tasks with ``--n-edges`` dependency edges
+(``after tasks 'a', 'b'``, each task depending on
+``--fan-in`` earlier tasks) is created, each task is
+run once and the start conditions of all of the tasks
+are checked repeatedly, as the scheduler does on each
+cycle. The checks are timed reading the status from
+the logs (``force_status_from_logs=True``) and from
+the cached latest times of the tasks (default).
+
+Usage:
+
+    python scripts/benchmarks/depend_conditions.py --n-edges 1000
+    python scripts/benchmarks/depend_conditions.py --repo csv
+"""
+
+import argparse
+import logging
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from redbird.logging import RepoHandler
+from redbird.repos import CSVFileRepo, MemoryRepo
+
+from redengine import Session
+from redengine.log import MinimalRecord
+from redengine.tasks import FuncTask
+
+def do_nothing():
+    ...
+
+def create_dag(n_edges:int, fan_in:int, seed:int=0):
+    "Create tasks with n_edges dependencies"
+    rnd = random.Random(seed)
+    n_roots = fan_in
+    tasks = [FuncTask(do_nothing, name=f"task {i}", execution="main") for i in range(n_roots)]
+    n_children = n_edges // fan_in
+    for i in range(n_roots, n_roots + n_children):
+        parents = rnd.sample(range(i), fan_in)
+        start_cond = "after tasks " + ", ".join(f"'task {parent}'" for parent in parents)
+        tasks.append(FuncTask(do_nothing, name=f"task {i}", execution="main", start_cond=start_cond))
+    return tasks
+
+def time_checks(tasks, repeat:int):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for task in tasks:
+            bool(task.start_cond)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-edges", type=int, default=1000)
+    parser.add_argument("--fan-in", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--repo", choices=["memory", "csv"], default="memory")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        session = Session(config={"force_status_from_logs": False}, delete_existing_loggers=True)
+        session.set_as_default()
+        if args.repo == "csv":
+            repo = CSVFileRepo(filename=os.path.join(tmpdir, "logs.csv"), model=MinimalRecord)
+        else:
+            repo = MemoryRepo(model=MinimalRecord)
+        task_logger = logging.getLogger(session.config.task_logger_basename)
+        task_logger.handlers = [RepoHandler(repo=repo)]
+        task_logger.setLevel(logging.INFO)
+
+        tasks = create_dag(args.n_edges, args.fan_in)
+        n_edges = sum(len(session.graph.get_parents(task.name)) for task in tasks)
+        for name in session.graph.topological_order():
+            session[name]()
+
+        results = {}
+        for from_logs in (True, False):
+            session.config.force_status_from_logs = from_logs
+            results[from_logs] = time_checks(tasks, args.repeat)
+
+    print(f"Tasks: {len(tasks)}, edges: {n_edges}, repo: {args.repo}")
+    for from_logs, timings in results.items():
+        label = "From logs" if from_logs else "From cache"
+        print(f"{label} per check of all tasks (ms): min {min(timings) * 1e3:.2f}, median {statistics.median(timings) * 1e3:.2f}")
+    print(f"Speedup: {min(results[True]) / min(results[False]):.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Benchmark the start skew of simultaneous process tasks.
+
+All tasks are set to start in the same scheduler cycle
+and the skew is measured from the start of the cycle 
+to the moment each task logged it started running.
+
+Usage:
+
+    python scripts/benchmarks/launch_skew.py --n-tasks 500
+"""
+
+import argparse
+import logging
+import statistics
+import time
+
+from redbird.logging import RepoHandler
+from redbird.repos import MemoryRepo
+
+from redengine import Session
+from redengine.conditions.scheduler import SchedulerCycles
+from redengine.log import MinimalRecord
+from redengine.tasks import FuncTask
+
+def do_nothing():
+    ...
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-tasks", type=int, default=500)
+    parser.add_argument("--execution", default="process")
+    parser.add_argument("--thread-pool-size", type=int, default=None)
+    args = parser.parse_args()
+
+    session = Session(config={
+        "max_process_count": args.n_tasks,
+        "shut_cond": SchedulerCycles() >= 1,
+        "thread_pool_size": args.thread_pool_size,
+    }, delete_existing_loggers=True)
+    session.set_as_default()
+    task_logger = logging.getLogger(session.config.task_logger_basename)
+    task_logger.handlers = [RepoHandler(repo=MemoryRepo(model=MinimalRecord))]
+
+    for i in range(args.n_tasks):
+        FuncTask(do_nothing, name=f"task_{i}", execution=args.execution, force_run=True)
+
+    start = time.time()
+    session.start()
+    end = time.time()
+
+    starts = sorted(
+        record.created - start 
+        for record in session.get_task_log() 
+        if record.action == "run"
+    )
+    print(f"Tasks started: {len(starts)}/{args.n_tasks}")
+    print(f"Start skew (s): min {starts[0]:.3f}, median {statistics.median(starts):.3f}, max {starts[-1]:.3f}")
+    print(f"Total duration (s): {end - start:.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Benchmark the launch latency and memory of process tasks.
+
+Process tasks are run one at a time and the latency
+is measured from starting the process (or passing
+the run to a prespawned process) to the moment
+the task logged it started running. The memory is 
+the proportional set size (PSS) of each task process
+thus the pages shared copy-on-write are divided 
+among the processes sharing them (Linux only).
+
+Usage:
+
+    python scripts/benchmarks/process_launch.py --n-tasks 50 --n-idle-tasks 10000 --start-method forkserver --preload pandas
+"""
+
+import argparse
+import statistics
+import time
+
+from redengine import Session
+from redengine.conditions.scheduler import SchedulerCycles
+from redengine.tasks import FuncTask
+
+def get_pss():
+    "Get proportional set size of the current process (kB)"
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            if line.startswith("Pss:"):
+                return int(line.split()[1])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-tasks", type=int, default=50)
+    parser.add_argument("--start-method", default=None)
+    parser.add_argument("--preload", nargs="*", default=[])
+    parser.add_argument("--n-idle-tasks", type=int, default=0, help="Tasks in the session that are not run")
+    parser.add_argument("--prespawn", action="store_true", help="Start the processes ahead of the runs")
+    args = parser.parse_args()
+
+    session = Session(config={
+        "process_start_method": args.start_method,
+        "preload_modules": args.preload,
+        "tasks_as_daemon": False,
+    }, delete_existing_loggers=True)
+    session.set_as_default()
+    scheduler = session.scheduler
+
+    for i in range(args.n_idle_tasks):
+        FuncTask(get_pss, name=f"idle_{i}", execution="process")
+    tasks = [
+        FuncTask(get_pss, name=f"task_{i}", execution="process")
+        for i in range(args.n_tasks)
+    ]
+    # Warm up (ie. start the forkserver)
+    scheduler.run_task(FuncTask(get_pss, name="warmup", execution="process"))
+    scheduler.wait_task_alive()
+    scheduler.handle_logs()
+
+    latencies = []
+    for task in tasks:
+        if args.prespawn:
+            task.prespawn()
+            time.sleep(1 if args.start_method == "spawn" else 0.1)
+        start = time.perf_counter()
+        scheduler.run_task(task)
+        latencies.append(time.perf_counter() - start)
+        scheduler.wait_task_alive()
+        scheduler.handle_logs()
+
+    memory = [session.returns[task] for task in tasks]
+    print(f"Start method: {args.start_method or 'default'}{' (prespawned)' if args.prespawn else ''}")
+    print(f"Launch latency (ms): median {statistics.median(latencies) * 1000:.1f}, max {max(latencies) * 1000:.1f}")
+    print(f"Task process PSS (kB): median {statistics.median(memory):.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark the overhead of running a task.
+
+A task that does nothing is run repeatedly with
+``execution="main"`` and the time spent per run 
+is measured. This is the overhead the framework 
+adds on top of the actual work of a task 
+(parameters, hooks, logging and status updates).
+
+Usage:
+
+    python scripts/benchmarks/run_overhead.py --n-runs 10000
+"""
+
+import argparse
+import datetime
+import logging
+import statistics
+import time
+
+from redbird.logging import RepoHandler
+from redbird.repos import MemoryRepo
+
+from redengine import Session
+from redengine.log import MinimalRecord
+from redengine.tasks import FuncTask
+
+def do_nothing():
+    ...
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-runs", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    session = Session(config={"force_status_from_logs": False}, delete_existing_loggers=True)
+    session.set_as_default()
+    task_logger = logging.getLogger(session.config.task_logger_basename)
+    task_logger.handlers = [RepoHandler(repo=MemoryRepo(model=MinimalRecord))]
+
+    task = FuncTask(do_nothing, name="task", execution="main")
+
+    timings = []
+    for _ in range(args.repeat):
+        # Keep the log from growing over the repeats
+        task_logger.handlers[0].repo.collection.clear()
+        start = time.perf_counter()
+        for _ in range(args.n_runs):
+            task()
+            task.force_run = False
+        timings.append((time.perf_counter() - start) / args.n_runs)
+
+    # Updates of the runtime state (done multiple times per run)
+    now = datetime.datetime.now()
+    start = time.perf_counter()
+    for _ in range(args.n_runs):
+        task.status = "run"
+        task.last_run = now
+        task.force_run = False
+    state_timing = (time.perf_counter() - start) / args.n_runs
+
+    print(f"Runs: {args.n_runs} x {args.repeat}")
+    print(f"Per run (us): min {min(timings) * 1e6:.1f}, median {statistics.median(timings) * 1e6:.1f}")
+    print(f"Per 3 state updates (us): {state_timing * 1e6:.2f}")
+
+if __name__ == "__main__":
+    main()